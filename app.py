@@ -1,16 +1,21 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
 import time
-import re
-import yfinance as yf
 import streamlit.components.v1 as components
-import plotly.graph_objects as go
-import plotly.figure_factory as ff
+from streamlit.errors import StreamlitAPIException
 import datetime
-import pandas as pd
+import os
+from terminal import STREAM_QUOTES, lazy, metrics
+
+# Heavy libraries and the terminal layers load on first use, so a view only
+# pays for what it renders (Calendar and Charts never import plotly or lxml).
+go = lazy("plotly.graph_objects")
+(barstore, correlation, dispatch, heatmap, llm, llmcache, news, pipeline, quotes, retrieval, widgets, charts, symbols, watchlists,
+ memory, backend, api) = (lazy(f"terminal.{name}") for name in ("barstore", "correlation", "dispatch", "heatmap", "llm", "llmcache", "news",
+                                                                "pipeline", "quotes", "retrieval", "widgets", "charts", "symbols",
+                                                                "watchlists", "memory", "backend", "api"))
 
 # --- 1. CONFIGURATION ---
+RERUN_STARTED = time.perf_counter()
 st.set_page_config(
     page_title="Terminal",
     page_icon="💠",
@@ -23,8 +28,6 @@ if 'active_view' not in st.session_state:
     st.session_state['active_view'] = "Home" 
 if 'active_chart' not in st.session_state:
     st.session_state['active_chart'] = "COINBASE:BTCUSD"
-if 'chat_history' not in st.session_state:
-    st.session_state['chat_history'] = []
 
 # --- 3. SIDEBAR & THEME CONTROL ---
 with st.sidebar:
@@ -73,6 +76,7 @@ with st.sidebar:
     st.subheader("Settings")
     tz_map = {"London (GMT)": 15, "New York (EST)": 8, "Tokyo (JST)": 18}
     selected_tz = st.selectbox("Timezone:", list(tz_map.keys()), index=0)
+    chat_budget = st.slider("Assistant context (tokens):", 500, 8000, 2000, step=500)
 
 
 # --- 4. CSS INJECTION (Responsive & Themed) ---
@@ -171,145 +175,83 @@ st.markdown(f"""
 
 # --- 5. DATA & LOGIC ---
 
-@st.cache_data(ttl=60)
-def get_market_data(tickers_dict):
+def get_server_api_key():
+    key = os.environ.get("GOOGLE_API_KEY", "")
     try:
-        data = {}
-        for name, symbol in tickers_dict.items():
-            if not symbol: continue 
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="1d", interval="1m")
-                if hist.empty: hist = ticker.history(period="2d")
-                if not hist.empty:
-                    latest = hist['Close'].iloc[-1]
-                    open_p = hist['Open'].iloc[0] if len(hist) > 1 else latest
-                    change = ((latest - open_p) / open_p) * 100
-                    data[name] = (latest, change)
-                else: data[name] = (0.0, 0.0)
-            except: data[name] = (0.0, 0.0)
-        return data
-    except: return None
-
-def get_symbol_details(key):
-    key_upper = key.upper()
-    icon = "📈"
-    if "BTC" in key_upper: icon = "₿"
-    elif "ETH" in key_upper: icon = "Ξ"
-    elif "EUR" in key_upper: icon = "💶"
-    elif "GBP" in key_upper: icon = "💷"
-    elif "USD" in key_upper: icon = "💵"
-    elif "JPY" in key_upper: icon = "¥"
-    elif "GOLD" in key_upper: icon = "⚱️"
-    elif "OIL" in key_upper: icon = "🛢️"
-    elif "NVDA" in key_upper: icon = "🤖"
-    elif "AAPL" in key_upper: icon = "🍎"
-    return icon
+        if not key and "GOOGLE_API_KEY" in st.secrets: key = st.secrets["GOOGLE_API_KEY"]
+    except: pass
+    return key.strip() or None
+
+# The refresher, quote stream, stores and LLM stack live in terminal/backend.py, one per
+# server and shared by every session. TERMINAL_API_PORT also serves them as JSON from this process.
+@st.cache_resource
+def get_backend():
+    core = backend.Backend(server_api_key=get_server_api_key()).start()
+    if os.environ.get("TERMINAL_API_PORT"): api.serve_in_thread(core, port=int(os.environ["TERMINAL_API_PORT"]))
+    return core
+
+def get_market_data():
+    return get_backend().market_data()
+
+def render_staleness(name, label):
+    snap = get_backend().refresher.get(name)
+    if not snap.stale or not snap.updated_at: return
+    reason = f"last refresh failed: {snap.error}" if snap.error else "refreshing"
+    st.caption(f"⏳ {label} as of {int(snap.age)}s ago ({reason})")
+
+# The grid only ever builds one page of buttons; sorting and slicing happen on the frame,
+# so a several-hundred-symbol watchlist costs the same widgets as a 6-symbol class.
+GRID_COLUMNS, GRID_PAGE = 6, 24
+GRID_SORTS = {"Default": None, "Change ▼": ("change", False), "Change ▲": ("change", True), "Name": (None, True)}
+
+def watchlist_tickers(codes):
+    # Display name -> yfinance code; clashing names fall back to the code itself.
+    tickers = {}
+    for code in codes:
+        record = symbols.REGISTRY.resolve(code)
+        tickers[record.name if record.name not in tickers else record.yf] = record.yf
+    return tickers
+
+def sort_grid(data, sort):
+    column, ascending = GRID_SORTS[sort] or (None, None)
+    if ascending is None: return data
+    if column is None: return data.sort_index(ascending=ascending, kind="stable")
+    return data.sort_values(column, ascending=ascending, kind="stable")
 
 def render_ticker_grid(data):
-    if not data: return
-    tv_map = {"BTC": "COINBASE:BTCUSD", "ETH": "COINBASE:ETHUSD", "SOL": "COINBASE:SOLUSD", "EUR": "FX:EURUSD", "GBP": "FX:GBPUSD", "JPY": "FX:USDJPY", "CHF": "FX:USDCHF", "CAD": "FX:USDCAD", "AUD": "FX:AUDUSD", "NZD": "FX:NZDUSD", "DXY": "TVC:DXY", "GOLD": "OANDA:XAUUSD", "OIL": "TVC:USOIL", "NVDA": "NASDAQ:NVDA", "TSLA": "NASDAQ:TSLA", "AAPL": "NASDAQ:AAPL", "SPX": "OANDA:SPX500USD", "NDX": "OANDA:NAS100USD"}
-    
-    cols = st.columns(6)
-    for i, (key, (price, change)) in enumerate(data.items()):
-        icon = get_symbol_details(key)
+    if data is None or data.empty: return
+    cols = st.columns(GRID_COLUMNS)
+    for i, (key, symbol, price, change) in enumerate(zip(data.index, data['symbol'], data['price'], data['change'])):
+        record = symbols.REGISTRY.get(symbol)
         arrow = "▲" if change >= 0 else "▼"
         price_str = f"${price:,.0f}" if price > 100 else f"${price:.4f}"
-        label = f"{icon} {key}\n{price_str} {arrow} {change:.2f}%"
+        label = f"{record.icon if record else symbols.icon_for(key)} {key}\n{price_str} {arrow} {change:.2f}%"
         
-        with cols[i % 6]:
+        with cols[i % GRID_COLUMNS]:
             if st.button(label, key=f"btn_{key}", use_container_width=True):
-                clean_key = key.split("-")[0] if "-" in key else key
-                tv_code = tv_map.get(clean_key, tv_map.get(key, "COINBASE:BTCUSD"))
-                st.session_state['active_chart'] = tv_code
+                st.session_state['active_chart'] = symbols.REGISTRY.chart_code(symbol)
+                # Symbols TradingView has no code for open straight in the native engine.
+                if not (record and record.tv): st.session_state['chart_engine'] = "Native"
                 st.session_state['active_view'] = "Charts"
                 st.rerun()
 
-@st.cache_data(ttl=300)
 def get_crypto_fng():
-    try: return int(requests.get("https://api.alternative.me/fng/?limit=1").json()['data'][0]['value'])
-    except: return 50
+    return get_backend().crypto_fng()
 
-@st.cache_data(ttl=300)
 def get_macro_fng():
-    try:
-        hist = yf.Ticker("^VIX").history(period="5d")
-        vix_now = hist['Close'].iloc[-1]
-        vix_prev = hist['Close'].iloc[-2]
-        change_pct = ((vix_now - vix_prev) / vix_prev) * 100
-        score = 100 - ((vix_now - 10) * 3)
-        return max(0, min(100, int(score))), round(vix_now, 2), round(change_pct, 2)
-    except: return 50, 0, 0
+    return get_backend().macro_fng()
 
 # --- MARKET VITALS ---
-def render_market_vitals_widget(vix, vix_change):
-    vix_color = "text-green-400" if vix_change < 0 else "text-red-400"
-    arrow = "▼" if vix_change < 0 else "▲"
-    
-    html_code = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-      <script src="https://cdn.tailwindcss.com"></script>
-      <style>
-        body {{ background-color: transparent; margin: 0; padding: 2px; }}
-        .font-sans {{ font-family: 'Inter', sans-serif; }}
-        .font-mono {{ font-family: 'JetBrains Mono', monospace; }}
-      </style>
-    </head>
-    <body>
-      <div class="grid grid-cols-2 gap-4 bg-slate-900 p-4 rounded-lg border border-slate-700 font-sans shadow-lg">
-        <div class="flex flex-col">
-          <span class="text-xs text-slate-400 uppercase tracking-widest font-bold">Fear (VIX)</span>
-          <div class="text-xl font-mono text-white mt-1">
-            {vix} <span class="text-sm {vix_color}">{arrow} {abs(vix_change)}%</span>
-          </div>
-        </div>
-        <div class="flex flex-col border-l border-slate-700 pl-4">
-          <span class="text-xs text-slate-400 uppercase tracking-widest font-bold">Options PCR</span>
-          <div class="text-xl font-mono text-white mt-1">
-            0.85 <span class="text-sm text-blue-400">Neutral</span>
-          </div>
-        </div>
-        <div class="flex flex-col border-t border-slate-700 pt-4">
-          <span class="text-xs text-slate-400 uppercase tracking-widest font-bold">Net Exch. Flow</span>
-          <div class="text-xl font-mono text-red-400 mt-1">
-            +$210M <span class="text-xs text-slate-500 block italic">Selling Pressure</span>
-          </div>
-        </div>
-        <div class="flex flex-col border-l border-t border-slate-700 pl-4 pt-4">
-          <span class="text-xs text-slate-400 uppercase tracking-widest font-bold">Kimchi Prem.</span>
-          <div class="text-xl font-mono text-white mt-1">
-            +1.2% <span class="text-sm text-green-400">Low Risk</span>
-          </div>
-        </div>
-      </div>
-    </body>
-    </html>
-    """
-    components.html(html_code, height=180)
+def render_market_vitals_widget(vix, vix_change, theme_mode="dark"):
+    components.html(widgets.vitals_html(vix, vix_change, theme_mode), height=180)
 
 # --- CORRELATION MATRIX ---
-@st.cache_data(ttl=3600)
-def get_correlation_matrix():
-    symbols = ["BTC-USD", "^GSPC", "GC=F", "CL=F", "DX-Y.NYB"]
-    rename_map = {"BTC-USD": "BTC", "^GSPC": "SPX", "GC=F": "GOLD", "CL=F": "OIL", "DX-Y.NYB": "DXY"}
-    try:
-        df = yf.download(symbols, period="30d")['Close']
-        df = df.rename(columns=rename_map)
-        df = df.dropna()
-        corr = df.corr()
-        return corr
-    except: return None
-
-def render_correlation_matrix(corr_df, text_color):
+def get_correlation_matrix(universe="Core", window=30):
+    return get_backend().correlation_matrix(universe, window)
+
+def render_correlation_matrix(corr_df, text_color, window=30):
     if corr_df is None: return
-    z = corr_df.values.tolist()
-    x = corr_df.columns.tolist()
-    y = corr_df.index.tolist()
-    colorscale = [[0.0, '#EF4444'], [0.5, '#F3F4F6'], [1.0, '#10B981']]
-    fig = ff.create_annotated_heatmap(z=z, x=x, y=y, annotation_text=[[f"{val:.2f}" for val in row] for row in z], colorscale=colorscale)
-    fig.update_layout(title={'text': "Asset Correlation (30D)", 'font': {'size': 14, 'color': text_color}}, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font={'family': "Inter", 'color': text_color}, height=300, margin=dict(l=10, r=10, t=40, b=10))
+    fig = heatmap.figure(corr_df, text_color, f"Asset Correlation ({window}D)")
     st.plotly_chart(fig, use_container_width=True)
 
 def render_gauge(value, title, text_color):
@@ -322,227 +264,402 @@ def render_gauge(value, title, text_color):
     st.plotly_chart(fig, use_container_width=True)
 
 def render_chart(symbol, theme_mode):
-    html = f"""
-    <div class="tradingview-widget-container" style="height:650px;border-radius:12px;overflow:hidden;box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-      <div id="tradingview_{symbol}" style="height:100%"></div>
-      <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
-      <script type="text/javascript">
-      new TradingView.widget({{"autosize": true, "symbol": "{symbol}", "interval": "D", "timezone": "Etc/UTC", "theme": "{theme_mode}", "style": "1", "locale": "en", "toolbar_bg": "#f1f3f6", "enable_publishing": false, "allow_symbol_change": true, "container_id": "tradingview_{symbol}"}});
-      </script>
-    </div>
-    """
-    components.html(html, height=650)
+    components.html(widgets.tradingview_html(symbol, theme_mode), height=650)
 
 def render_economic_calendar(timezone_id):
-    calendar_url = f"https://sslecal2.investing.com?columns=exc_flags,exc_currency,exc_importance,exc_actual,exc_forecast,exc_previous&features=datepicker,timezone&countries=5,4,72,35,25,6,43,12,37&calType=week&timeZone={timezone_id}&lang=1&importance=3"
-    html = f"""
-    <div style="border: 1px solid #E5E7EB; border-radius: 12px; overflow: hidden; height: 800px; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-        <iframe src="{calendar_url}" width="100%" height="800" frameborder="0" allowtransparency="true"></iframe>
-    </div>
-    """
-    components.html(html, height=800)
+    components.html(widgets.calendar_html(timezone_id), height=800)
+
+# --- NATIVE CHARTS ---
+CHART_INTERVALS = ("1m", "5m", "15m", "1h", "1d", "1wk")
+
+@st.cache_resource
+def get_chart_syncs():
+    return {}
+
+def sync_chart_bars(symbol, interval):
+    # At most one download attempt per symbol/interval per bar period; the store only fetches missing bars.
+    attempts, now = get_chart_syncs(), time.time()
+    if now - attempts.get((symbol, interval), 0) < max(60, barstore.INTERVAL_SECONDS[interval]): return
+    attempts[(symbol, interval)] = now
+    try: get_backend().bars.sync([symbol], interval)
+    except: metrics.fail("sync_chart_bars")
+
+@metrics.timed()
+def render_native_chart(symbol, interval, range_name, style, text_color):
+    sync_chart_bars(symbol, interval)
+    fig = charts.figure(get_backend().bars, symbol, interval, range_name, style, text_color)
+    if fig is None:
+        st.info(f"No {interval} history stored for {symbol} yet.")
+        return
+    st.plotly_chart(fig, use_container_width=True, config={"scrollZoom": True, "displaylogo": False})
 
 # --- 6. AI ENGINE ---
-@st.cache_data(ttl=600) 
 def get_rss_news(query):
-    try:
-        url = f"https://news.google.com/rss/search?q={query}+when:1d&hl=en-US&gl=US&ceid=US:en"
-        r = requests.get(url, timeout=5)
-        soup = BeautifulSoup(r.content, features="html.parser")
-        items = soup.findAll('item')
-        news_text = ""
-        for item in items[:20]: 
-            title = item.find('title').text if item.find('title') else "No Title"
-            pubdate = item.find('pubdate').text if item.find('pubdate') else ""
-            news_text += f"- {title} ({pubdate})\n"
-        return news_text if news_text else "No recent news found."
-    except Exception as e: return f"News Feed Error: {str(e)}"
+    try: return get_backend().rss_news(query)
+    except Exception as e:
+        st.warning(f"News Feed Error: {str(e)}")
+        return ()
+
+def get_briefing_news(mode, items=None):
+    return get_backend().briefing_news(mode, get_rss_news(backend.NEWS_QUERIES[mode]) if items is None else items)
 
 def resolve_best_model(api_key):
-    url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
-    try:
-        response = requests.get(url)
-        data = response.json()
-        if 'error' in data: return None, data['error']['message']
-        valid_models = [m['name'].replace("models/", "") for m in data.get('models', []) if 'generateContent' in m.get('supportedGenerationMethods', [])]
-        preferred = ["gemini-1.5-flash", "gemini-1.0-pro", "gemini-pro"]
-        for p in preferred:
-            if p in valid_models: return p, "OK"
-        return (valid_models[0], "OK") if valid_models else (None, "No valid models")
-    except Exception as e: return None, str(e)
-
-@st.cache_data(ttl=3600, show_spinner="Analyzing...") 
-def generate_report(data_dump, mode, api_key):
-    if not api_key: return "⚠️ Please enter your Google API Key in the sidebar."
-    clean_key = api_key.strip()
-    active_model, status = resolve_best_model(clean_key)
-    if not active_model: return f"❌ Error: {status}"
-    
-    headers = {'Content-Type': 'application/json'}
-    safety_settings = [{"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"}]
-    generation_config = {"maxOutputTokens": 8192}
-
-    if mode == "BTC":
-        prompt = f"""ROLE: Senior Crypto Strategist. TASK: Deep-dive Bitcoin report. DATA: {data_dump}. OUTPUT: ### ⚡️ LIVE PULSE\n### 🏦 FLOWS\n### 🔮 SCENARIOS"""
-    elif mode == "GEO":
-        prompt = f"""ROLE: Intelligence Analyst. TASK: Geopolitical Threat Assessment. DATA: {data_dump}. OUTPUT: ### 🌍 THREAT MATRIX\n### ⚔️ FLASHPOINTS\n### 🛡 MARKET IMPACT"""
-    elif mode == "GLOBAL":
-        prompt = f"""ROLE: Chief Investment Officer. TASK: Global Market Executive Summary. DATA: {data_dump}. OUTPUT: ### 🌎 MACRO OVERVIEW\n### 🚨 KEY RISKS\n### 💡 OPPORTUNITIES"""
-    else: # FX
-        prompt = f"""ROLE: FX Strategist. TASK: Weekly Outlook for 7 Major Pairs. DATA: {data_dump}. OUTPUT: **💵 DXY**\n---\n### 🇪🇺 EUR/USD\n### 🇬🇧 GBP/USD\n### 🇯🇵 USD/JPY\n### 🇨🇭 USD/CHF\n### 🇦🇺 AUD/USD\n### 🇨🇦 USD/CAD\n### 🇳🇿 NZD/USD"""
-
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{active_model}:generateContent?key={clean_key}"
-    payload = {"contents": [{"parts": [{"text": prompt}]}], "safetySettings": safety_settings, "generationConfig": generation_config}
-    
+    return get_backend().resolve_model(api_key)
+
+CHAT_TTL = 3600
+
+def stream_report(data_dump, mode, api_key):
+    return get_backend().stream_report(data_dump, mode, api_key)
+
+def stream_to_card(chunks, placeholder, interval=0.1):
+    """``(text, error)``: the streamed text, and the failure message if generation stopped short."""
+    parts, last, error = [], 0.0, None
     try:
-        r = requests.post(url, headers=headers, json=payload)
-        return r.json()['candidates'][0]['content']['parts'][0]['text'].replace("$","USD ") if 'candidates' in r.json() else f"❌ Error: {r.json().get('error', {}).get('message', 'Unknown')}"
-    except Exception as e: return f"System Error: {str(e)}"
+        for chunk in chunks:
+            parts.append(chunk)
+            if time.time() - last > interval:
+                placeholder.markdown(f'<div class="terminal-card">{"".join(parts)}</div>', unsafe_allow_html=True)
+                last = time.time()
+    except backend.ReportError as e: error = str(e)
+    text = "".join(parts)
+    placeholder.markdown(f'<div class="terminal-card">{text}</div>', unsafe_allow_html=True)
+    return text, error
+
+# --- BRIEFING PIPELINE ---
+REPORT_KEYS = {"GLOBAL": "global_rep", "BTC": "btc_rep", "FX": "fx_rep", "GEO": "geo_rep"}
+
+def run_all_briefings(api_key):
+    labels = {pipeline.RUNNING: "⏳", pipeline.DONE: "✅", pipeline.FAILED: "❌", pipeline.SKIPPED: "⏭️"}
+    stages = {mode: "queued" for mode in REPORT_KEYS}
+    items = {}
+    with st.status("Generating all briefings...", expanded=True) as status:
+        rows = {mode: st.empty() for mode in REPORT_KEYS}
+        for mode in REPORT_KEYS: rows[mode].markdown(f"**{mode}** · queued")
+        for name, state, value in get_backend().briefing_pipeline(api_key).run():
+            stage, mode = name.split(":")
+            stages[mode] = f"{labels[state]} {'news' if stage == 'news' else 'report'} {state}"
+            if state == pipeline.FAILED: stages[mode] += f" ({value})"
+            if stage == "news" and state == pipeline.DONE: items[mode] = value
+            if stage == "report" and state == pipeline.DONE and not record_report(mode, value, items[mode]):
+                stages[mode] = f"{labels[pipeline.FAILED]} report failed ({value})"
+            rows[mode].markdown(f"**{mode}** · {stages[mode]}")
+        status.update(label="Briefings ready", state="complete")
+
+def record_report(mode, text, items, briefed_at=None, error=None):
+    # A failed or partial report is shown as an error once, never kept as the report or counted as briefing its headlines.
+    key = REPORT_KEYS[mode]
+    created = None if error else get_backend().save_report(mode, text, items, "manual", api_key)
+    if not created:
+        st.session_state[f"{key}_error"] = error or "❌ Error: empty report"
+        return None
+    get_backend().headlines.mark_briefed(mode, briefed_at)
+    st.session_state[key], st.session_state[f"{key}_at"] = text, created
+    st.session_state.pop(f"{key}_error", None)
+    return created
+
+def sync_reports():
+    store = get_backend().reports
+    for mode, created in store.latest_times().items():
+        key = REPORT_KEYS.get(mode)
+        if key and created > st.session_state.get(f"{key}_at", 0.0):
+            st.session_state[key] = store.latest(mode).text
+            st.session_state[f"{key}_at"] = created
+
+def render_report_card(mode):
+    key = REPORT_KEYS[mode]
+    if f"{key}_error" in st.session_state: st.error(st.session_state.pop(f"{key}_error"))
+    if key not in st.session_state: return
+    st.markdown(f'<div class="terminal-card">{st.session_state[key]}</div>', unsafe_allow_html=True)
+    if f"{key}_at" in st.session_state:
+        st.caption(f"🕒 Generated {datetime.datetime.fromtimestamp(st.session_state[f'{key}_at']):%d %b %H:%M} · regenerate on demand above")
 
 # --- NEW: CHAT ASSISTANT LOGIC ---
-def chat_with_reports(user_msg, api_key):
-    if not api_key: return "⚠️ Please enter API Key in sidebar."
+# The prompt carries the last few turns verbatim plus a running summary of older
+# ones, capped at CHAT_MEMORY_TOKENS; the view renders CHAT_WINDOW turns at a time.
+CHAT_MEMORY_TOKENS = 1500
+CHAT_WINDOW = 20
+
+@st.cache_resource
+def get_memory_store():
+    store = memory.MemoryStore()
+    store.prune()
+    return store
+
+def open_chat(session=None):
+    chat = memory.ConversationMemory(get_memory_store(), session, token_budget=CHAT_MEMORY_TOKENS)
+    # The session id rides in the URL so a reload reopens the conversation from disk.
+    st.query_params["chat"] = chat.session
+    st.session_state['chat_memory'], st.session_state['chat_window'] = chat, CHAT_WINDOW
+    return chat
+
+def get_chat_memory():
+    # ``is None``: an empty conversation has len() 0 and would otherwise reopen from disk every rerun.
+    chat = st.session_state.get('chat_memory')
+    return chat if chat is not None else open_chat(st.query_params.get("chat"))
+
+def load_older_turns():
+    st.session_state['chat_window'] = st.session_state.get('chat_window', CHAT_WINDOW) + CHAT_WINDOW
+
+REPORT_LABELS = {'global_rep': "GLOBAL REPORT", 'btc_rep': "BITCOIN REPORT", 'fx_rep': "FX REPORT", 'geo_rep': "GEOPOLITICS REPORT"}
+
+def report_context(user_msg, token_budget=2000, k=4):
+    reports = {label: st.session_state[key] for key, label in REPORT_LABELS.items() if key in st.session_state}
+    if not reports: return ""
+    sections = retrieval.select_sections(reports, user_msg, k=k, token_budget=token_budget)
+    return "".join(f"{s.report}{' - ' + s.heading if s.heading else ''}:\n{s.text}\n\n" for s in sections)
+
+@metrics.timed()
+def stream_chat(user_msg, api_key, token_budget=2000, history=""):
+    if not api_key:
+        yield "⚠️ Please enter API Key in sidebar."
+        return
     
     # 1. Gather Context from generated reports
-    context_text = ""
-    if 'global_rep' in st.session_state: context_text += f"GLOBAL REPORT:\n{st.session_state['global_rep']}\n\n"
-    if 'btc_rep' in st.session_state: context_text += f"BITCOIN REPORT:\n{st.session_state['btc_rep']}\n\n"
-    if 'fx_rep' in st.session_state: context_text += f"FX REPORT:\n{st.session_state['fx_rep']}\n\n"
-    if 'geo_rep' in st.session_state: context_text += f"GEOPOLITICS REPORT:\n{st.session_state['geo_rep']}\n\n"
-    
+    context_text = report_context(user_msg, token_budget)
     if not context_text:
-        return "ℹ️ No reports generated yet. Please generate a report in the other tabs first so I have data to discuss!"
+        yield "ℹ️ No reports generated yet. Please generate a report in the other tabs first so I have data to discuss!"
+        return
 
     clean_key = api_key.strip()
     active_model, status = resolve_best_model(clean_key)
-    if not active_model: return f"❌ Error: {status}"
+    if not active_model:
+        metrics.fail("stream_chat")
+        yield f"❌ Error: {status}"
+        return
     
     # 2. Construct Prompt
+    history_block = f"CONVERSATION SO FAR:\n{history}\n" if history else ""
     system_prompt = f"""
-    You are the Terminal AI Assistant. You have access to the following reports generated by the system:
+    You are the Terminal AI Assistant. You have access to the following report sections generated by the system:
     
     {context_text}
-    
+    {history_block}
     USER QUESTION: {user_msg}
     
     TASK: Answer the user's question specifically using the data from the reports above. Be concise, professional, and strategic. 
-    If the answer isn't in the reports, say so.
+    Use the conversation so far to resolve follow-up questions. If the answer isn't in the reports, say so.
     """
     
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{active_model}:generateContent?key={clean_key}"
-    payload = {"contents": [{"parts": [{"text": system_prompt}]}]}
-    headers = {'Content-Type': 'application/json'}
-    
+    cache = get_backend().llm_cache
+    cache_key = llmcache.cache_key(active_model, "chat", question=" ".join(user_msg.lower().split()), context=context_text, history=history)
+    hit = cache.get(cache_key, max_age=CHAT_TTL)
+    metrics.cache("llm.chat", hit is not None)
+    if hit is not None:
+        yield hit
+        return
+
+    parts = []
     try:
-        r = requests.post(url, headers=headers, json=payload)
-        return r.json()['candidates'][0]['content']['parts'][0]['text'] if 'candidates' in r.json() else "❌ AI Error"
-    except Exception as e: return f"System Error: {str(e)}"
+        client = get_backend().llm_client
+        for chunk in get_backend().dispatcher.stream(clean_key, cache_key, lambda: client.stream(clean_key, system_prompt), dispatch.INTERACTIVE):
+            parts.append(chunk)
+            yield chunk
+    except llm.LLMError:
+        metrics.fail("stream_chat")
+        yield "❌ AI Error"
+        return
+    except Exception as e:
+        metrics.fail("stream_chat")
+        yield f"System Error: {str(e)}"
+        return
+    reply = "".join(parts)
+    if not reply.strip():
+        # Blocked or empty completions are not cached, so asking again retries upstream.
+        metrics.fail("stream_chat")
+        yield "ℹ️ No answer came back for that question; try rephrasing it."
+        return
+    cache.put(cache_key, reply, "chat", active_model)
+
+def chat_with_reports(user_msg, api_key, token_budget=2000, history=""):
+    return "".join(stream_chat(user_msg, api_key, token_budget, history))
 
 # --- 7. MAIN DASHBOARD ---
-st.markdown("## 🖥️ MARKET OVERVIEW")
-
-# Ticker Grid
-col_sel, col_space = st.columns([1, 2])
-with col_sel:
-    selected_market = st.selectbox("Select Asset Class:", ["Standard", "Crypto", "Forex", "Tech Stocks", "Indices"], index=0, label_visibility="collapsed")
-
-market_map = {
-    "Standard": {"BTC": "BTC-USD", "EUR": "EURUSD=X", "USD": "DX-Y.NYB", "GOLD": "GC=F", "OIL": "CL=F", "SPX": "^GSPC"},
-    "Crypto": {"BTC": "BTC-USD", "ETH": "ETH-USD", "SOL": "SOL-USD", "XRP": "XRP-USD", "DOGE": "DOGE-USD", "ADA": "ADA-USD"},
-    "Forex": {"EUR": "EURUSD=X", "GBP": "GBPUSD=X", "JPY": "JPY=X", "CHF": "CHF=X", "CAD": "CAD=X", "AUD": "AUDUSD=X"},
-    "Tech Stocks": {"NVDA": "NVDA", "TSLA": "TSLA", "AAPL": "AAPL", "MSFT": "MSFT", "GOOG": "GOOG", "AMZN": "AMZN"},
-    "Indices": {"S&P 500": "^GSPC", "NASDAQ": "^IXIC", "DOW": "^DJI", "VIX": "^VIX", "FTSE": "^FTSE", "DAX": "^GDAXI"}
-}
-active_tickers = market_map[selected_market]
-market_data = get_market_data(active_tickers)
-render_ticker_grid(market_data)
+# The grid, the vitals panel, the chart switcher and the active view are
+# fragments: their widgets rerun only their own function, and the grid and
+# vitals poll the refresher snapshot on their own interval.
+QUOTE_REFRESH = 1 if STREAM_QUOTES else 5
+VITALS_REFRESH = QUOTE_REFRESH if STREAM_QUOTES else 60
 
-st.write("") 
-
-# Navigation (ADDED "Assistant")
-nav_options = ["Home", "Assistant", "Bitcoin", "Currencies", "Geopolitics", "Calendar", "Charts"]
-cols = st.columns(len(nav_options))
-for i, option in enumerate(nav_options):
-    if cols[i].button(option, use_container_width=True, type="primary" if st.session_state['active_view'] == option else "secondary"):
-        st.session_state['active_view'] = option
-        st.rerun()
-
-st.markdown("---")
+st.markdown("## 🖥️ MARKET OVERVIEW")
 
-# View Controller
-view = st.session_state['active_view']
+def save_watchlist(current):
+    name = st.session_state[f"watchlist_name_{current}"].strip()
+    codes, rejected = watchlists.parse_symbols(st.session_state[f"watchlist_symbols_{current}"])
+    if not name or not codes:
+        st.toast("A watchlist needs a name and at least one valid symbol")
+        return
+    get_backend().watch_symbols(get_backend().watchlists.save(name, codes))
+    if rejected: st.toast(f"Skipped invalid symbols: {', '.join(rejected[:10])}")
+    st.session_state['watchlist_edit'] = name
+    st.session_state['market_class'] = f"★ {name}"
+
+def delete_watchlist(current):
+    get_backend().watchlists.delete(current)
+    st.session_state['watchlist_edit'] = "New list"
+    if st.session_state.get('market_class') == f"★ {current}": st.session_state['market_class'] = "Standard"
+
+def render_watchlist_editor():
+    with st.expander("⭐ Watchlists"):
+        store = get_backend().watchlists
+        current = st.selectbox("Watchlist:", ["New list"] + store.names(), key="watchlist_edit", label_visibility="collapsed")
+        st.text_input("Name:", "" if current == "New list" else current, key=f"watchlist_name_{current}")
+        st.text_area("Symbols:", ", ".join(store.get(current)), key=f"watchlist_symbols_{current}", height=120,
+                     placeholder="AAPL, MSFT, ^N225, SHEL.L, ...", help=f"yfinance codes separated by commas, spaces or new lines (up to {watchlists.MAX_SYMBOLS})")
+        col_s, col_d = st.columns(2)
+        col_s.button("Save", on_click=save_watchlist, args=(current,), use_container_width=True)
+        col_d.button("Delete", on_click=delete_watchlist, args=(current,), disabled=current == "New list", use_container_width=True)
 
-if view == "Home":
+with st.sidebar:
+    render_watchlist_editor()
+
+@st.fragment(run_every=QUOTE_REFRESH)
+@metrics.timed("fragment.market_overview")
+def render_market_overview():
+    lists = {f"★ {name}": name for name in get_backend().watchlists.names()}
+    options = list(quotes.MARKET_MAP) + list(lists)
+    if st.session_state.get('market_class') not in options: st.session_state['market_class'] = options[0]
+    col_sel, col_sort, col_page, col_space = st.columns([2, 1, 1, 2])
+    with col_sel:
+        selected_market = st.selectbox("Select Asset Class:", options, key="market_class", label_visibility="collapsed")
+    sort = col_sort.selectbox("Sort:", list(GRID_SORTS), key="grid_sort", label_visibility="collapsed")
+    active_tickers = watchlist_tickers(get_backend().watchlists.get(lists[selected_market])) if selected_market in lists else quotes.MARKET_MAP[selected_market]
+    market_data = get_market_data()
+    if market_data is not None:
+        market_data = sort_grid(quotes.select(market_data, active_tickers), sort)
+        pages = max(1, -(-len(market_data) // GRID_PAGE))
+        if pages > 1:
+            page = col_page.number_input("Page:", 1, pages, key=f"grid_page_{selected_market}_{pages}", label_visibility="collapsed")
+            start = (page - 1) * GRID_PAGE
+            col_space.caption(f"{start + 1}–{min(start + GRID_PAGE, len(market_data))} of {len(market_data)}")
+            market_data = market_data.iloc[start:start + GRID_PAGE]
+    render_ticker_grid(market_data)
+    if STREAM_QUOTES and not get_backend().quote_stream.connected:
+        st.caption(f"⏳ Live quotes reconnecting ({get_backend().quote_stream.error or 'connecting'}); showing polled prices")
+    render_staleness("quotes", "Quotes")
+
+@st.fragment(run_every=VITALS_REFRESH)
+@metrics.timed("fragment.vitals")
+def render_vitals():
+    _, vix_val, vix_chg = get_macro_fng()
+    render_market_vitals_widget(vix_val, vix_chg, theme['tv_theme'])
+    render_staleness("macro_fng", "VIX")
+
+@st.fragment
+@metrics.timed("fragment.chart_switcher")
+def render_chart_switcher():
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        asset_map = symbols.REGISTRY.quick_switch()
+        default_ix = None
+        current_val = st.session_state['active_chart']
+        vals = list(asset_map.values())
+        if current_val in vals: default_ix = vals.index(current_val)
+        selected_label = st.selectbox("Quick Switch:", list(asset_map.keys()), index=default_ix, label_visibility="collapsed", placeholder="Quick Switch")
+        if selected_label and asset_map[selected_label] != current_val:
+            st.session_state['active_chart'] = asset_map[selected_label]
+        engine = st.radio("Engine:", ["TradingView", "Native"], horizontal=True, label_visibility="collapsed", key="chart_engine")
+    with col1:
+        st.subheader(f"{st.session_state['active_chart']}")
+    if engine == "TradingView":
+        render_chart(st.session_state['active_chart'], theme['tv_theme'])
+        return
+
+    # Native engine: any yfinance symbol, drawn from our own bar history.
+    active = st.session_state['active_chart']
+    c_sym, c_rng, c_int, c_sty = st.columns(4)
+    record = symbols.REGISTRY.get(active)
+    symbol = c_sym.text_input("Symbol:", record.yf if record else "BTC-USD", key=f"native_symbol_{active}", label_visibility="collapsed").strip().upper()
+    range_name = c_rng.selectbox("Range:", list(charts.RANGES), index=4, label_visibility="collapsed")
+    interval = c_int.selectbox("Interval:", CHART_INTERVALS, index=4, label_visibility="collapsed")
+    style = c_sty.selectbox("Style:", charts.STYLES, label_visibility="collapsed")
+    if symbol: render_native_chart(symbol, interval, range_name, style, theme['text'])
+
+def set_view(option):
+    st.session_state['active_view'] = option
+
+def rerun_view():
+    # Fragment scope is only valid while the workspace is rerunning on its own.
+    try: st.rerun(scope="fragment")
+    except StreamlitAPIException: st.rerun()
+
+def view_home():
     col_a, col_b = st.columns([1, 2])
     with col_a:
         st.markdown("### 📡 Market Vitals")
-        _, vix_val, vix_chg = get_macro_fng()
-        render_market_vitals_widget(vix_val, vix_chg)
+        render_vitals()
         
     with col_b:
         st.markdown("### 🧬 Asset Correlation")
-        corr_matrix = get_correlation_matrix()
-        render_correlation_matrix(corr_matrix, theme['text'])
+        col_u, col_w = st.columns(2)
+        corr_universe = col_u.selectbox("Universe:", list(backend.correlation_universes().keys()), index=0, label_visibility="collapsed")
+        corr_window = col_w.radio("Window:", correlation.WINDOWS, index=1, format_func=lambda w: f"{w}D", horizontal=True, label_visibility="collapsed")
+        corr_matrix = get_correlation_matrix(corr_universe, corr_window)
+        render_correlation_matrix(corr_matrix, theme['text'], corr_window)
     
     st.write("")
     st.markdown("### 🌎 Global Command Center")
+    if st.button("⚡ GENERATE ALL BRIEFINGS"):
+        run_all_briefings(api_key)
+        rerun_view()
     if st.button("GENERATE EXECUTIVE BRIEFING", type="primary"):
-        raw_news = ""
         with st.spinner("Compiling Global Intel..."):
-            raw_news = get_rss_news("Global economy stock market inflation central banks")
+            raw_news = get_briefing_news("GLOBAL")
+            briefed_at = time.time()
         st.info("⚡ Synthesizing Macro Outlook...")
-        report = generate_report(raw_news, "GLOBAL", api_key)
-        st.session_state['global_rep'] = report
-        st.rerun()
-    if 'global_rep' in st.session_state:
-        st.markdown(f'<div class="terminal-card">{st.session_state["global_rep"]}</div>', unsafe_allow_html=True)
-
-# --- NEW: ASSISTANT TAB ---
-elif view == "Assistant":
+        report, error = stream_to_card(stream_report(news.format_items(raw_news), "GLOBAL", api_key), st.empty())
+        record_report("GLOBAL", report, raw_news, briefed_at, error)
+        rerun_view()
+    render_report_card("GLOBAL")
+
+def view_assistant():
     st.markdown("### 🤖 Terminal AI Assistant")
     st.caption("Ask questions about any generated report (Bitcoin, FX, Global, etc.)")
+    chat = get_chat_memory()
     
-    # Display Chat History
-    for msg in st.session_state['chat_history']:
-        with st.chat_message(msg["role"]):
-            st.markdown(msg["content"])
+    # Display Chat History (a recent window; older turns page in from disk)
+    shown = st.session_state.get('chat_window', CHAT_WINDOW)
+    col_old, col_new = st.columns([3, 1])
+    if len(chat) > shown: col_old.button(f"⬆ Load older ({len(chat) - shown} more)", on_click=load_older_turns)
+    if len(chat): col_new.button("🗒️ New conversation", on_click=open_chat, use_container_width=True)
+    for turn in chat.recent(shown):
+        with st.chat_message(turn.role):
+            st.markdown(turn.content)
             
     # Input Area
     if prompt := st.chat_input("Ask about the markets..."):
-        # 1. Add User Message
-        st.session_state['chat_history'].append({"role": "user", "content": prompt})
+        # 1. Add User Message (history is taken first so the question isn't repeated in it)
+        history = chat.context()
+        chat.append("user", prompt)
         with st.chat_message("user"):
             st.markdown(prompt)
             
         # 2. Get AI Response
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = chat_with_reports(prompt, api_key)
-                st.markdown(response)
-                st.session_state['chat_history'].append({"role": "assistant", "content": response})
+            response = st.write_stream(stream_chat(prompt, api_key, chat_budget, history))
+            chat.append("assistant", response if isinstance(response, str) else "".join(map(str, response)))
 
-elif view == "Bitcoin":
+def view_bitcoin():
     col_a, col_b = st.columns([1, 2])
     with col_a:
         st.markdown("### Market Sentiment")
         btc_fng = get_crypto_fng()
         st.markdown(f"<div class='terminal-card' style='text-align: center;'><div class='metric-val'>{btc_fng}</div><div style='font-size: 12px; color: {theme['text']};'>Fear & Greed Index</div></div>", unsafe_allow_html=True)
         render_gauge(btc_fng, "", theme['text'])
+        render_staleness("crypto_fng", "Fear & Greed")
         
     with col_b:
         st.markdown("### 📡 Deep-Dive Briefing")
         if st.button("GENERATE REPORT", type="primary"):
-            raw_news = ""
             with st.spinner("Scanning Institutional Feeds..."):
-                raw_news = get_rss_news("Bitcoin crypto market ETF on-chain")
+                raw_news = get_briefing_news("BTC")
+                briefed_at = time.time()
             st.info("⚡ Analyzing Market Structure...")
-            report = generate_report(raw_news, "BTC", api_key)
-            st.session_state['btc_rep'] = report
-            st.rerun()
-        if 'btc_rep' in st.session_state:
-            st.markdown(f'<div class="terminal-card">{st.session_state["btc_rep"]}</div>', unsafe_allow_html=True)
+            report, error = stream_to_card(stream_report(news.format_items(raw_news), "BTC", api_key), st.empty())
+            record_report("BTC", report, raw_news, briefed_at, error)
+            rerun_view()
+        render_report_card("BTC")
 
-elif view == "Currencies":
+def view_currencies():
     col_a, col_b = st.columns([1, 2])
     with col_a:
         st.markdown("### 🌍 Macro Risk")
@@ -554,54 +671,72 @@ elif view == "Currencies":
     with col_b:
         st.markdown("### 💱 FX Strategy Desk")
         if st.button("GENERATE FX OUTLOOK", type="primary"):
-            raw_news = ""
             with st.spinner("Aggregating Central Bank Data..."):
-                raw_news += get_rss_news("EURUSD GBPUSD USDJPY AUDUSD USDCAD forex central bank")
+                raw_news = get_briefing_news("FX")
+                briefed_at = time.time()
             st.info("⚡ Synthesizing 7-Pair Analysis...")
-            report = generate_report(raw_news, "FX", api_key)
-            st.session_state['fx_rep'] = report
-            st.rerun()
-        if 'fx_rep' in st.session_state:
-            st.markdown(f'<div class="terminal-card">{st.session_state["fx_rep"]}</div>', unsafe_allow_html=True)
+            report, error = stream_to_card(stream_report(news.format_items(raw_news), "FX", api_key), st.empty())
+            record_report("FX", report, raw_news, briefed_at, error)
+            rerun_view()
+        render_report_card("FX")
 
-elif view == "Geopolitics":
+def view_geopolitics():
     st.markdown("### 🌐 Global Threat Matrix")
     if st.button("RUN INTEL SCAN", type="primary"):
-        raw_news = ""
         with st.spinner("Parsing Classified Wires..."):
-            raw_news += get_rss_news("Geopolitics War Oil Gold Economy sanctions")
+            raw_news = get_briefing_news("GEO")
+            briefed_at = time.time()
         st.info("⚡ Assessing Strategic Risks...")
-        report = generate_report(raw_news, "GEO", api_key)
-        st.session_state['geo_rep'] = report
-        st.rerun()
-    if 'geo_rep' in st.session_state:
-        st.markdown(f'<div class="terminal-card">{st.session_state["geo_rep"]}</div>', unsafe_allow_html=True)
+        report, error = stream_to_card(stream_report(news.format_items(raw_news), "GEO", api_key), st.empty())
+        record_report("GEO", report, raw_news, briefed_at, error)
+        rerun_view()
+    render_report_card("GEO")
 
-elif view == "Calendar":
+def view_calendar():
     st.markdown("### 📅 Economic Calendar")
     render_economic_calendar(tz_map[selected_tz])
 
-elif view == "Charts":
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.subheader(f"{st.session_state['active_chart']}")
-    with col2:
-        asset_map = {
-            "Bitcoin (BTC/USD)": "COINBASE:BTCUSD", "Ethereum (ETH/USD)": "COINBASE:ETHUSD",
-            "Ripple (XRP/USD)": "COINBASE:XRPUSD", "Gold (XAU/USD)": "OANDA:XAUUSD",
-            "Crude Oil (WTI)": "TVC:USOIL", "Dollar Index (DXY)": "TVC:DXY",
-            "EUR / USD": "FX:EURUSD", "GBP / USD": "FX:GBPUSD", "USD / JPY": "FX:USDJPY",
-            "USD / CHF": "FX:USDCHF", "AUD / USD": "FX:AUDUSD", "USD / CAD": "FX:USDCAD",
-            "NZD / USD": "FX:NZDUSD"
-        }
-        default_ix = 0
-        current_val = st.session_state['active_chart']
-        vals = list(asset_map.values())
-        if current_val in vals: default_ix = vals.index(current_val)
-        selected_label = st.selectbox("Quick Switch:", list(asset_map.keys()), index=default_ix, label_visibility="collapsed")
-        
-        if asset_map[selected_label] != current_val:
-            st.session_state['active_chart'] = asset_map[selected_label]
-            st.rerun()
-            
-    render_chart(st.session_state['active_chart'], theme['tv_theme'])
+VIEWS = {"Home": view_home, "Assistant": view_assistant, "Bitcoin": view_bitcoin, "Currencies": view_currencies,
+         "Geopolitics": view_geopolitics, "Calendar": view_calendar, "Charts": render_chart_switcher}
+
+@st.fragment
+@metrics.timed("fragment.workspace")
+def render_workspace():
+    # Navigation (ADDED "Assistant")
+    nav_options = list(VIEWS)
+    cols = st.columns(len(nav_options))
+    for i, option in enumerate(nav_options):
+        cols[i].button(option, use_container_width=True, type="primary" if st.session_state['active_view'] == option else "secondary", on_click=set_view, args=(option,))
+
+    st.markdown("---")
+
+    # View Controller
+    sync_reports()
+    VIEWS[st.session_state['active_view']]()
+
+render_market_overview()
+st.write("") 
+render_workspace()
+
+with st.sidebar:
+    llm_queue = get_backend().dispatch_stats()
+    if llm_queue and (llm_queue["queued"] or llm_queue["running"]):
+        st.caption(f"🧠 LLM queue: {llm_queue['queued']} waiting · {llm_queue['running']} running · avg wait {llm_queue['batch_wait_avg']:.1f}s")
+
+# --- 8. DIAGNOSTICS ---
+# Full-script reruns only; fragment reruns are timed by their own decorators.
+metrics.observe("rerun", time.perf_counter() - RERUN_STARTED)
+
+def fmt_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:,.0f}"
+
+with st.sidebar:
+    with st.expander("🩺 Diagnostics"):
+        # A markdown table rather than st.dataframe, which would import pandas on every rerun of every view.
+        lines = ["| metric | calls | err | p50 ms | p95 ms | hit % |", "|---|--:|--:|--:|--:|--:|"]
+        lines += [f"| {r['name']} | {r['calls']} | {r['errors']} | {fmt_ms(r['p50_s'])} | {fmt_ms(r['p95_s'])} | "
+                  f"{'-' if r['hit_ratio'] is None else format(r['hit_ratio'], '.0%')} |" for r in metrics.snapshot()]
+        st.markdown("\n".join(lines))
+        col_p, col_j = st.columns(2)
+        col_p.download_button("Prometheus", metrics.prometheus(), "terminal.prom", "text/plain", use_container_width=True)
+        col_j.download_button("JSON lines", metrics.jsonl(), "terminal-metrics.jsonl", "application/x-ndjson", use_container_width=True)
@@ -0,0 +1,224 @@
+"""Local stand-ins for Google News RSS, alternative.me, the Gemini REST API and Yahoo's quote stream.
+
+One threaded HTTP server answers the first three on 127.0.0.1 so the
+benchmarks run without network access:
+
+    /rss?q=...                                   fixture XML for the query (ETag / 304 aware)
+    /fng                                         fixed fear & greed reading
+    /models                                      a single generateContent-capable model
+    /models/<m>:generateContent                  whole reply after ``ttft`` + chunk delays
+    /models/<m>:streamGenerateContent?alt=sse    ``chunks`` SSE events, ``chunk_delay`` apart
+
+``fail(503, 404)`` makes the next requests answer with those statuses,
+``stream_error_after`` ends SSE replies with an error event after that many
+chunks, and
+``requests["connections"]`` counts accepted TCP connections, so client
+retries and keep-alive reuse can be checked against it.
+
+``QuoteFeed`` is a websocket server speaking Yahoo's pricing protocol. Run
+either standalone to develop against them:
+
+    python bench/fakes.py quotes --port 8765     # TERMINAL_QUOTE_STREAM_URL=ws://127.0.0.1:8765
+    python bench/fakes.py http --port 8080       # GEMINI_API_ROOT=http://127.0.0.1:8080
+"""
+import argparse
+import hashlib
+import http.server
+import json
+import logging
+import math
+import random
+import threading
+import time
+import urllib.parse
+
+import fixtures
+
+MODEL = "models/gemini-1.5-flash"
+WORDS = ("liquidity", "yields", "dollar", "risk", "volatility", "flows", "breakout", "support", "inflation", "policy")
+
+
+def reply_chunks(n):
+    """Deterministic markdown reply split into ``n`` chunks."""
+    chunks = []
+    for i in range(n):
+        head = f"\n### Section {i // 10 + 1}\n" if i % 10 == 0 else ""
+        chunks.append(head + " ".join(WORDS[(i + j) % len(WORDS)] for j in range(12)) + f" ${i}. ")
+    return chunks
+
+
+class FakeServices:
+    def __init__(self, rss_latency=0.0, ttft=0.3, chunk_delay=0.02, chunks=40, fng=57, port=0):
+        self.rss_latency, self.ttft, self.chunk_delay, self.chunks, self.fng = rss_latency, ttft, chunk_delay, chunks, fng
+        self.requests = {"rss": 0, "rss_304": 0, "fng": 0, "models": 0, "generate": 0, "connections": 0, "failed": 0}
+        self._failures = []
+        self.stream_error_after = None
+        self._lock = threading.Lock()
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="fake-services", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, name):
+        with self._lock: self.requests[name] += 1
+
+    def fail(self, *statuses):
+        """Answer the next ``len(statuses)`` requests with these HTTP statuses."""
+        with self._lock: self._failures.extend(statuses)
+
+    def _next_failure(self):
+        with self._lock: return self._failures.pop(0) if self._failures else None
+
+    def rss(self, query):
+        query = query.rsplit(" when:", 1)[0]
+        try:
+            with open(fixtures.rss_path(query), "rb") as f: return f.read()
+        except FileNotFoundError: return fixtures.synth_rss(query)
+
+    def _handler(self):
+        services = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                services.count("connections")
+
+            def failed(self):
+                status = services._next_failure()
+                if status is None: return False
+                services.count("failed")
+                self.send(status, json.dumps({"error": {"code": status, "message": f"injected {status}"}}).encode())
+                return True
+
+            def send(self, code, body=b"", content_type="application/json", headers=()):
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers: self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urllib.parse.urlsplit(self.path)
+                if self.failed(): return
+                if url.path == "/rss":
+                    services.count("rss")
+                    if services.rss_latency: time.sleep(services.rss_latency)
+                    body = services.rss(urllib.parse.parse_qs(url.query).get("q", [""])[0])
+                    etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                    if self.headers.get("If-None-Match") == etag:
+                        services.count("rss_304")
+                        return self.send(304, headers=[("ETag", etag)])
+                    return self.send(200, body, "application/rss+xml", [("ETag", etag)])
+                if url.path == "/fng":
+                    services.count("fng")
+                    return self.send(200, json.dumps({"data": [{"value": str(services.fng)}]}).encode())
+                if url.path == "/models":
+                    services.count("models")
+                    return self.send(200, json.dumps({"models": [{"name": MODEL, "supportedGenerationMethods": ["generateContent"]}]}).encode())
+                self.send(404, b'{"error": {"message": "not found"}}')
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.failed(): return
+                services.count("generate")
+                time.sleep(services.ttft)
+                chunks = reply_chunks(services.chunks)
+                if ":streamGenerateContent" in self.path:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Connection", "close")
+                    self.end_headers()
+                    for i, chunk in enumerate(chunks):
+                        if i: time.sleep(services.chunk_delay)
+                        event = {"candidates": [{"content": {"parts": [{"text": chunk}]}}]}
+                        if i == services.stream_error_after: event = {"error": {"code": 500, "message": "injected stream error"}}
+                        self.wfile.write(b"data: " + json.dumps(event).encode() + b"\r\n\r\n")
+                        self.wfile.flush()
+                        if "error" in event: break
+                    self.close_connection = True
+                    return
+                time.sleep(services.chunk_delay * (len(chunks) - 1))
+                self.send(200, json.dumps({"candidates": [{"content": {"parts": [{"text": "".join(chunks)}]}}]}).encode())
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class QuoteFeed:
+    """Random-walk ticks for whatever the client subscribes to, ``rate`` rounds per second."""
+
+    def __init__(self, rate=10.0, port=0, volatility=2e-4):
+        from websockets.sync.server import serve
+        logging.getLogger("websockets.server").setLevel(logging.WARNING)
+        self.rate, self.volatility = rate, volatility
+        closes = {s: float(f["Close"].iloc[-1]) for s, f in fixtures.load_bars("1d", align=False).items()}
+        self.prices = {s: [p, p] for s, p in closes.items()}  # symbol -> [open, last]
+        self.sent = 0
+        self._lock = threading.Lock()
+        self.server = serve(self._handle, "127.0.0.1", port)
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.server.socket.getsockname()[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="fake-quote-feed", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+
+    def tick(self, symbol, rng):
+        from terminal import stream  # imported late so callers can set TERMINAL_* env first
+        with self._lock:
+            prices = self.prices.setdefault(symbol, [100.0, 100.0])
+            prices[1] *= math.exp(rng.gauss(0, self.volatility))
+            self.sent += 1
+            return stream.encode(symbol, prices[1], time.time(), prices[0], (prices[1] / prices[0] - 1) * 100)
+
+    def _handle(self, ws):
+        from websockets.exceptions import ConnectionClosed
+        symbols, rng, interval = [], random.Random(), 1.0 / self.rate
+        while True:
+            try: symbols = json.loads(ws.recv(timeout=interval)).get("subscribe", symbols)
+            except TimeoutError: pass
+            except ConnectionClosed: return
+            try:
+                for symbol in symbols: ws.send(self.tick(symbol, rng))
+            except ConnectionClosed: return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a stand-in upstream until interrupted.")
+    parser.add_argument("service", choices=["quotes", "http"])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=10.0, help="quote rounds per second")
+    args = parser.parse_args()
+    if args.service == "quotes":
+        feed = QuoteFeed(rate=args.rate, port=args.port).start()
+        print(f"TERMINAL_QUOTE_STREAM_URL={feed.url}")
+    else:
+        services = FakeServices(port=args.port).start()
+        print(f"GEMINI_API_ROOT={services.url}  news.FEED_URL={services.url}/rss  sentiment.FNG_URL={services.url}/fng")
+    try:
+        while True: time.sleep(3600)
+    except KeyboardInterrupt: pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Market and news fixtures for the offline benchmarks.
+
+    python bench/fixtures.py record     # live yfinance + Google News (needs network)
+    python bench/fixtures.py synth      # deterministic stand-ins, no network
+
+Bars are stored as one gzipped CSV per interval (``symbol,ts,open,high,low,
+close,volume`` with UTC epoch seconds); RSS responses as one XML file per
+query. ``YFinanceReplay`` serves the bars back through the ``yf.download`` /
+``yf.Ticker().history`` surface the terminal layers use.
+"""
+import argparse
+import ast
+import email.utils
+import os
+import re
+import sys
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+FIXTURES = os.path.join(HERE, "fixtures")
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+# Daily history covers the longest correlation window; minute bars only feed the quote grid.
+DAILY_BARS, MINUTE_BARS = 400, 60
+
+sys.path.insert(0, ROOT)
+
+
+def backend_constant(name):
+    """Literal module-level constant from terminal/backend.py, read without importing it (which would fix DATA_DIR)."""
+    with open(os.path.join(ROOT, "terminal", "backend.py"), encoding="utf-8") as f:
+        for node in ast.parse(f.read()).body:
+            if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == name for t in node.targets):
+                return ast.literal_eval(node.value)
+    raise KeyError(name)
+
+
+def symbols():
+    from terminal import quotes
+    return sorted(set(quotes.universe()) | set(backend_constant("CORRELATION_SYMBOLS")))
+
+
+def slug(query):
+    return re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")[:60]
+
+
+def bars_path(interval):
+    return os.path.join(FIXTURES, f"bars_{interval}.csv.gz")
+
+
+def rss_path(query):
+    return os.path.join(FIXTURES, "rss", f"{slug(query)}.xml")
+
+
+def write_bars(interval, frames):
+    rows = []
+    for symbol, frame in frames.items():
+        frame = frame.dropna(subset=["Close"])
+        if frame.empty: continue
+        ts = pd.DatetimeIndex(frame.index)
+        ts = ts.tz_convert("UTC") if ts.tz is not None else ts.tz_localize("UTC")
+        rows.append(pd.DataFrame({"symbol": symbol, "ts": ts.as_unit("s").asi8, **{f.lower(): frame[f].to_numpy() for f in FIELDS}}))
+    os.makedirs(FIXTURES, exist_ok=True)
+    pd.concat(rows).to_csv(bars_path(interval), index=False, float_format="%.6g", compression="gzip")
+
+
+def load_bars(interval, align=True):
+    """``{symbol: OHLCV frame}``; with ``align`` the series is shifted so its last bar is current."""
+    path = bars_path(interval)
+    if not os.path.exists(path): return {}
+    table = pd.read_csv(path)
+    shift = 0
+    if align and len(table):
+        step = 86400 if interval == "1d" else 60
+        shift = (int(time.time()) // step - int(table["ts"].max()) // step) * step
+    frames = {}
+    for symbol, rows in table.groupby("symbol", sort=False):
+        index = pd.to_datetime(rows["ts"].to_numpy() + shift, unit="s", utc=True)
+        frames[symbol] = pd.DataFrame({f: rows[f.lower()].to_numpy(dtype=float) for f in FIELDS}, index=index)
+    return frames
+
+
+def _span(period):
+    n, unit = re.fullmatch(r"(\d+)(mo|d|wk|y)", period).groups()
+    return pd.Timedelta(days=int(n) * {"d": 1, "wk": 7, "mo": 31, "y": 366}[unit])
+
+
+class YFinanceReplay:
+    """Drop-in for ``yfinance.download`` and ``yfinance.Ticker`` backed by fixture bars."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.frames = {interval: load_bars(interval) for interval in ("1d", "1m")}
+        self.calls = 0
+
+    def slice(self, symbol, interval="1d", period=None, start=None):
+        frame = self.frames.get(interval, {}).get(symbol)
+        if frame is None: return pd.DataFrame(columns=FIELDS)
+        if start is not None: return frame[frame.index >= pd.Timestamp(start)]
+        if period and period != "max": return frame[frame.index > frame.index[-1] - _span(period)]
+        return frame
+
+    def download(self, tickers, period=None, interval="1d", start=None, **_):
+        self.calls += 1
+        if self.latency: time.sleep(self.latency)
+        tickers = tickers.split() if isinstance(tickers, str) else list(tickers)
+        parts = {s: self.slice(s, interval, period, start) for s in tickers}
+        parts = {s: frame for s, frame in parts.items() if not frame.empty}
+        return pd.concat(parts, axis=1) if parts else pd.DataFrame()
+
+    def Ticker(self, symbol):
+        replay = self
+
+        class Ticker:
+            def history(self, period="1mo", interval="1d", start=None, **_):
+                replay.calls += 1
+                if replay.latency: time.sleep(replay.latency)
+                return replay.slice(symbol, interval, period, start)
+        return Ticker()
+
+    def install(self):
+        import yfinance
+        yfinance.download, yfinance.Ticker = self.download, self.Ticker
+        return self
+
+
+def synth_bars(symbol, interval, n):
+    rng = np.random.default_rng(zlib.crc32(f"{symbol}/{interval}".encode()))
+    step = 86400 if interval == "1d" else 60
+    vol = 0.02 if interval == "1d" else 0.0008
+    start = float(np.exp(rng.uniform(0, 10)))
+    close = start * np.exp(np.cumsum(rng.normal(0, vol, n)))
+    open_ = np.concatenate([[start], close[:-1]])
+    spread = np.abs(rng.normal(0, vol / 2, n)) * close
+    end = int(time.time()) // step * step
+    index = pd.to_datetime(np.arange(end - (n - 1) * step, end + 1, step), unit="s", utc=True)
+    return pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) + spread, "Low": np.minimum(open_, close) - spread,
+                         "Close": close, "Volume": rng.integers(1_000, 1_000_000, n).astype(float)}, index=index)
+
+
+def synth_rss(query, n=20):
+    rng = np.random.default_rng(zlib.crc32(query.encode()))
+    words = query.split()
+    items = []
+    for i in range(n):
+        title = " ".join(rng.choice(words, 6)) + f" update {i + 1}"
+        published = email.utils.formatdate(time.time() - i * 1800, usegmt=True)
+        items.append(f"<item><title>{title} - Wire {i % 5}</title><link>https://news.example/{slug(query)}/{i}</link>"
+                     f"<pubDate>{published}</pubDate><source url=\"https://news.example\">Wire {i % 5}</source></item>")
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{query}</title>{''.join(items)}</channel></rss>").encode()
+
+
+def record(queries):
+    import requests
+    import yfinance as yf
+    from terminal import news
+    syms = symbols()
+    for interval, period in (("1d", f"{DAILY_BARS * 3 // 2}d"), ("1m", "1d")):
+        frame = yf.download(syms, period=period, interval=interval, group_by="ticker", progress=False, multi_level_index=True)
+        limit = DAILY_BARS if interval == "1d" else MINUTE_BARS
+        write_bars(interval, {s: frame[s].tail(limit) for s in syms if s in frame.columns.get_level_values(0)})
+    for query in queries:
+        r = requests.get(news.FEED_URL, params={"q": f"{query} when:1d", "hl": "en-US", "gl": "US", "ceid": "US:en"},
+                         headers={"User-Agent": news.USER_AGENT}, timeout=10)
+        r.raise_for_status()
+        write_rss(query, r.content)
+
+
+def synth(queries):
+    syms = symbols()
+    write_bars("1d", {s: synth_bars(s, "1d", DAILY_BARS) for s in syms})
+    write_bars("1m", {s: synth_bars(s, "1m", MINUTE_BARS) for s in syms})
+    for query in queries: write_rss(query, synth_rss(query))
+
+
+def write_rss(query, body):
+    os.makedirs(os.path.dirname(rss_path(query)), exist_ok=True)
+    with open(rss_path(query), "wb") as f: f.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the offline benchmark fixtures.")
+    parser.add_argument("mode", choices=["record", "synth"])
+    args = parser.parse_args()
+    queries = list(backend_constant("NEWS_QUERIES").values())
+    (record if args.mode == "record" else synth)(queries)
+    print(f"wrote {len(symbols())} symbols and {len(queries)} feeds to {os.path.relpath(FIXTURES, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
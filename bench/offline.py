@@ -0,0 +1,212 @@
+"""Offline benchmark suite: replayed market data, RSS fixtures, a fake Gemini and quote stream.
+
+Times the terminal layers directly (quotes, news fetch+parse, bar sync,
+correlation, LLM streaming, live quote overlay) and then the app itself through AppTest: first
+paint and warm rerun per view, a report generation, and the per-function
+histograms the app records in ``terminal.metrics``. Results can be saved as
+JSON and compared against an earlier run.
+
+    python bench/fixtures.py synth                 # once, or `record` with network
+    python bench/offline.py --runs 5 --json bench.json
+    python bench/offline.py --compare bench.json --fail-over 20
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import fixtures
+import fakes
+
+APP = os.path.join(fixtures.ROOT, "app.py")
+VIEWS = ["Home", "Assistant", "Bitcoin", "Currencies", "Geopolitics", "Calendar", "Charts"]
+# Per-function rows recorded by the app during the AppTest runs.
+APP_FUNCTIONS = ["get_market_data", "get_macro_fng", "get_crypto_fng", "get_correlation_matrix", "get_rss_news",
+                 "resolve_best_model", "stream_report", "rerun"]
+
+
+class Timings:
+    def __init__(self):
+        self.samples = {}
+
+    def add(self, name, seconds):
+        self.samples.setdefault(name, []).append(seconds)
+
+    def time(self, name, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.add(name, time.perf_counter() - start)
+        return result
+
+    def summary(self):
+        out = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            out[name] = {"n": len(values), "p50": statistics.median(ordered), "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+                         "mean": statistics.fmean(ordered), "min": ordered[0]}
+        return out
+
+
+def setup(args, data_dir):
+    """Point every upstream at the local fakes before the terminal layers are imported."""
+    services = fakes.FakeServices(rss_latency=args.rss_latency, ttft=args.llm_ttft, chunk_delay=args.llm_chunk_delay,
+                                  chunks=args.llm_chunks).start()
+    os.environ.update(TERMINAL_DATA_DIR=data_dir, GEMINI_API_ROOT=services.url, TERMINAL_LLM_RPM="100000")
+    os.environ.pop("GOOGLE_API_KEY", None)
+    os.environ.pop("TERMINAL_QUOTE_STREAM", None)
+    os.environ.pop("TERMINAL_QUOTE_STREAM_URL", None)
+    replay = fixtures.YFinanceReplay(latency=args.yf_latency).install()
+    feed = fakes.QuoteFeed(rate=args.tick_rate).start()
+    from terminal import news, sentiment, stream
+    news.FEED_URL, sentiment.FNG_URL, stream.STREAM_URL = f"{services.url}/rss", f"{services.url}/fng", feed.url
+    return services, feed, replay
+
+
+def bench_stream(timings, runs, symbols):
+    from terminal import quotes, stream
+    polled = quotes.fetch_quotes(symbols)
+    for _ in range(runs):
+        live = stream.QuoteStream(symbols).start()
+        start = time.perf_counter()
+        while not live.snapshot()["ok"].all() and time.perf_counter() - start < 10: time.sleep(0.005)
+        timings.add("layer.stream_all_symbols_live", time.perf_counter() - start)
+        for _ in range(100): timings.time("layer.stream_overlay", live.overlay, polled)
+        live.stop()
+
+
+def bench_layers(timings, runs, data_dir):
+    from terminal import barstore, correlation, dispatch, llm, news, quotes
+    symbols = quotes.universe()
+    queries = list(fixtures.backend_constant("NEWS_QUERIES").values())
+    core = list(fixtures.backend_constant("CORRELATION_SYMBOLS"))
+    client = llm.GeminiClient()
+    dispatcher = dispatch.Dispatcher(requests_per_minute=100000, burst=100)
+    for run in range(runs):
+        timings.time("layer.fetch_quotes", quotes.fetch_quotes, symbols)
+        feed = news.NewsFeed(min_age=0)
+        for query in queries: timings.time("layer.news_fetch", feed.fetch, query)
+        for query in queries: timings.time("layer.news_revalidate", feed.fetch, query)
+        store = barstore.BarStore(os.path.join(data_dir, f"layer-bars-{run}"))
+        timings.time("layer.bar_sync", store.sync, symbols, "1d")
+        for name, universe in (("core", core), ("all", symbols)):
+            engine = correlation.UniverseCorrelation(store, universe)
+            timings.time(f"layer.correlation_{name}", lambda: (engine.refresh(force=True), engine.engine.frame(30)))
+        start, first = time.perf_counter(), None
+        upstream = lambda: client.stream("bench-key", f"benchmark prompt {run}")
+        for _ in dispatcher.stream("bench-key", f"layer-{run}", upstream):
+            if first is None: first = time.perf_counter() - start
+        timings.add("layer.llm_first_chunk", first)
+        timings.add("layer.llm_stream", time.perf_counter() - start)
+
+
+def bench_app(timings, runs, views):
+    from streamlit.testing.v1 import AppTest
+    from terminal import metrics
+    metrics.REGISTRY.reset()
+    errors = []
+
+    def session(view):
+        at = AppTest.from_file(APP, default_timeout=120)
+        at.session_state["active_view"] = view
+        return at
+
+    for view in views:
+        for run in range(runs):
+            at = session(view)
+            timings.time(f"app.first_paint.{view}", at.run)
+            timings.time(f"app.rerun.{view}", at.run)
+            errors += [f"{view}: {e.value}" for e in at.exception]
+
+    for run in range(runs):
+        at = session("Home")
+        at.run()
+        at.sidebar.text_input[0].input(f"bench-key-{run}").run()
+        button = next(b for b in at.button if b.label == "GENERATE EXECUTIVE BRIEFING")
+        timings.time("app.generate_report", button.click().run)
+        errors += [f"report: {e.value}" for e in at.exception]
+
+    rows = {row["name"]: row for row in metrics.snapshot()}
+    functions = {name: {k: rows[name][k] for k in ("calls", "errors", "p50_s", "p95_s", "mean_s", "hit_ratio")}
+                 for name in APP_FUNCTIONS if name in rows}
+    caches = {name: row["hit_ratio"] for name, row in rows.items() if row["hit_ratio"] is not None}
+    return functions, caches, errors
+
+
+def git_revision():
+    try: return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=fixtures.ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError: return ""
+
+
+def print_report(result, baseline=None):
+    base = (baseline or {}).get("timings", {})
+    print(f"# offline benchmark · {result['meta']['revision'] or 'working tree'} · python {result['meta']['python']}")
+    print(f"{'timing':<34}{'n':>4}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}" + (f"{'Δ p50':>9}" if base else ""))
+    for name, row in result["timings"].items():
+        line = f"{name:<34}{row['n']:>4}{row['p50'] * 1000:>10.1f}{row['p95'] * 1000:>10.1f}{row['mean'] * 1000:>10.1f}"
+        if name in base and base[name]["p50"]: line += f"{(row['p50'] / base[name]['p50'] - 1) * 100:>+8.0f}%"
+        print(line)
+    print(f"\n{'app function':<34}{'calls':>6}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, row in result["functions"].items():
+        print(f"{name:<34}{row['calls']:>6}{row['errors']:>5}{(row['p50_s'] or 0) * 1000:>10.1f}{(row['p95_s'] or 0) * 1000:>10.1f}")
+    print("\ncache hit ratios: " + ", ".join(f"{name} {ratio:.0%}" for name, ratio in sorted(result["caches"].items())))
+    print("upstream requests: " + ", ".join(f"{name} {n}" for name, n in result["upstream"].items()))
+    for error in result["errors"]: print(f"error: {error}")
+
+
+def regressions(result, baseline, threshold):
+    base = baseline.get("timings", {})
+    return [name for name, row in result["timings"].items()
+            if name in base and base[name]["p50"] and row["p50"] > base[name]["p50"] * (1 + threshold / 100)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--views", nargs="+", default=VIEWS)
+    parser.add_argument("--skip-app", action="store_true", help="only time the terminal layers")
+    parser.add_argument("--yf-latency", type=float, default=0.0, help="seconds added to each replayed yfinance call")
+    parser.add_argument("--rss-latency", type=float, default=0.0)
+    parser.add_argument("--llm-ttft", type=float, default=0.3, help="fake Gemini time to first token")
+    parser.add_argument("--llm-chunk-delay", type=float, default=0.02)
+    parser.add_argument("--llm-chunks", type=int, default=40)
+    parser.add_argument("--tick-rate", type=float, default=10.0, help="fake quote stream rounds per second")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--fail-over", type=float, help="exit 1 if any p50 is this many percent slower than the baseline")
+    args = parser.parse_args()
+    if not os.path.exists(fixtures.bars_path("1d")): parser.error("no fixtures; run `python bench/fixtures.py synth` first")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        services, feed, replay = setup(args, data_dir)
+        timings = Timings()
+        bench_layers(timings, args.runs, data_dir)
+        from terminal import quotes
+        bench_stream(timings, args.runs, quotes.universe())
+        functions, caches, errors = bench_app(timings, args.runs, args.views) if not args.skip_app else ({}, {}, [])
+        services.stop()
+        feed.stop()
+
+    result = {"meta": {"revision": git_revision(), "python": platform.python_version(), "runs": args.runs, "time": time.time(),
+                       "latency": {"yfinance": args.yf_latency, "rss": args.rss_latency, "llm_ttft": args.llm_ttft,
+                                   "llm_chunk_delay": args.llm_chunk_delay, "llm_chunks": args.llm_chunks,
+                                   "tick_rate": args.tick_rate}},
+              "timings": timings.summary(), "functions": functions, "caches": caches,
+              "upstream": {**services.requests, "yfinance": replay.calls, "ticks": feed.sent}, "errors": errors}
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+    print_report(result, baseline)
+    if args.json:
+        with open(args.json, "w") as f: json.dump(result, f, indent=2)
+    slower = regressions(result, baseline, args.fail_over) if baseline and args.fail_over is not None else []
+    if slower: print(f"\nslower than baseline by >{args.fail_over:.0f}%: {', '.join(slower)}", file=sys.stderr)
+    return 1 if slower or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Cold-start benchmark: per-view import cost and time to first paint.
+
+Each view runs in a fresh interpreter through Streamlit's AppTest harness with
+the background refresher and quote stream disabled, so the numbers measure what the script
+itself imports and renders (modules the harness already loaded, such as
+pandas, are not counted against the view). Exits non-zero when a view exceeds the budget.
+
+    python bench/startup.py                       # all views, 3 runs each
+    python bench/startup.py --views Home Charts --budget 2.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+VIEWS = ["Home", "Assistant", "Bitcoin", "Currencies", "Geopolitics", "Calendar", "Charts"]
+HEAVY = ["pandas", "numpy", "plotly", "yfinance", "lxml", "requests"]
+
+
+def child(view):
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    harness = time.perf_counter() - t0
+    baseline = set(sys.modules)
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.session_state["active_view"] = view
+    t0 = time.perf_counter()
+    at.run()
+    paint = time.perf_counter() - t0
+    loaded = set(sys.modules) - baseline
+    print(json.dumps({"view": view, "harness": harness, "paint": paint, "modules": len(loaded),
+                      "heavy": [m for m in HEAVY if m in loaded], "errors": [str(e.value)[:200] for e in at.exception]}))
+
+
+def measure(view, data_dir):
+    env = dict(os.environ, TERMINAL_REFRESHER="0", TERMINAL_QUOTE_STREAM="0", TERMINAL_DATA_DIR=data_dir)
+    env.pop("GOOGLE_API_KEY", None)
+    out = subprocess.run([sys.executable, __file__, "--child", view], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--views", nargs="+", default=VIEWS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=float(os.environ.get("TERMINAL_STARTUP_BUDGET", "3.0")),
+                        help="max median first-paint seconds per view")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child: return child(args.child)
+
+    results, failed = [], []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for view in args.views:
+            runs = [measure(view, data_dir) for _ in range(args.runs)]
+            paint = statistics.median(r["paint"] for r in runs)
+            row = {"view": view, "paint": paint, "harness": statistics.median(r["harness"] for r in runs),
+                   "modules": runs[-1]["modules"], "heavy": runs[-1]["heavy"], "errors": runs[-1]["errors"]}
+            results.append(row)
+            if paint > args.budget or row["errors"]: failed.append(view)
+
+    if args.json: print(json.dumps(results, indent=2))
+    else:
+        print(f"{'view':<14}{'paint s':>9}{'harness s':>11}{'modules':>9}  heavy imports")
+        for r in results:
+            flag = " !" if r["view"] in failed else ""
+            print(f"{r['view']:<14}{r['paint']:>9.2f}{r['harness']:>11.2f}{r['modules']:>9}  {', '.join(r['heavy']) or '-'}{flag}")
+            for e in r["errors"]: print(f"{'':<14}error: {e}")
+    if failed:
+        print(f"over budget ({args.budget:.2f}s) or failing: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Data, AI and rendering layers behind the Streamlit terminal in app.py."""
+import collections
+import importlib
+import os
+import threading
+import types
+
+DATA_DIR = os.environ.get("TERMINAL_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".terminal"))
+# Live quotes come from the pricing websocket; the yfinance poll then only seeds
+# day opens and covers silent symbols. TERMINAL_QUOTE_STREAM=0 falls back to polling;
+# the socket address is TERMINAL_QUOTE_STREAM_URL (see terminal/stream.py).
+STREAM_QUOTES = os.environ.get("TERMINAL_QUOTE_STREAM", "") != "0"
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def __getattr__(self, attr):
+        module = self.__dict__["_module"]
+        if module is None: module = self.__dict__["_module"] = importlib.import_module(self.__name__)
+        return getattr(module, attr)
+
+
+def lazy(name):
+    return LazyModule(name)
+
+
+def open_db(path, name, schema):
+    """``(path, connection)`` for a store's SQLite file, ``DATA_DIR/name`` unless ``path`` is given, in WAL mode with ``schema`` applied."""
+    import sqlite3  # stores only; keeps the package import light
+    path = path or os.path.join(DATA_DIR, name)
+    if path != ":memory:": os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path, check_same_thread=False)
+    with db:
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(schema)
+    return path, db
+
+
+class LRUCache:
+    """Thread-safe mapping of at most ``size`` entries that evicts the least recently used."""
+
+    def __init__(self, size):
+        self.size = size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items: return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size: self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock: self._items.clear()
@@ -0,0 +1,367 @@
+"""Headless JSON API and CLI over ``terminal.backend``.
+
+A small asyncio HTTP/1.1 server (keep-alive, standard library only) answers
+bots from the same ``Backend`` the dashboard uses, so it reads the same
+refresher snapshots, bar store, report store and LLM cache instead of a UI
+rerun per request. Encoded bodies are memoised per route and query until the
+snapshot behind them changes or a short TTL passes, so repeat reads are a
+dictionary hit and a socket write; misses and slow work (correlation refresh,
+news fetch, report generation) run in the default executor, and concurrent
+misses for the same key share one build.
+
+    python -m terminal.api serve --port 8090          # standalone, its own Backend
+    TERMINAL_API_PORT=8090 streamlit run app.py       # inside the dashboard process
+    python -m terminal.api market --class Crypto      # one-shot JSON to stdout
+    python -m terminal.api fng --url http://127.0.0.1:8090
+
+Routes: ``GET /v1/health``, ``/v1/market?class=|symbols=``, ``/v1/fng``,
+``/v1/correlation?universe=&window=``, ``/v1/news?mode=|q=``, ``/v1/briefings``,
+``/v1/briefings/<MODE>``, ``/metrics``; ``POST /v1/briefings/<MODE>``
+generates one (Gemini key in ``X-Goog-Api-Key`` or the server's own).
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import NamedTuple
+
+from terminal import backend, correlation, metrics, quotes, symbols
+
+HOST = os.environ.get("TERMINAL_API_HOST", "127.0.0.1")
+PORT = 8090
+MAX_HEADER = 16 * 1024
+MAX_BODY = 64 * 1024
+MEMO_SIZE = 1024
+STATUS = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    query: dict
+    headers: dict
+
+
+def clean(value):
+    """JSON-safe scalar: NaN/inf become ``None``, NumPy scalars become Python ones."""
+    if hasattr(value, "item"): value = value.item()
+    return None if isinstance(value, float) and not math.isfinite(value) else value
+
+
+# --- handlers: (backend, request) -> (status, payload) ---
+def health(core, req):
+    jobs = {}
+    for name in ("quotes", "macro_fng", "crypto_fng", "bars_1d", "briefings"):
+        snap = core.refresher.get(name)
+        jobs[name] = {"updated_at": snap.updated_at, "stale": snap.stale, "error": snap.error or None}
+    connected, messages, error = core.stream_status()
+    return 200, {"jobs": jobs, "stream": {"enabled": core.stream_quotes, "connected": connected, "messages": messages, "error": error}}
+
+
+def market(core, req):
+    frame = core.market_data()
+    if frame is None: raise ApiError(503, "no quotes loaded yet")
+    if "class" in req.query:
+        if req.query["class"] not in quotes.MARKET_MAP: raise ApiError(404, f"unknown class; one of {', '.join(quotes.MARKET_MAP)}")
+        frame = quotes.select(frame, quotes.MARKET_MAP[req.query["class"]])
+        names = list(frame.index)
+    else:
+        if "symbols" in req.query:
+            frame = quotes.select(frame, {s: s for s in req.query["symbols"].upper().split(",") if s})
+        else: frame = frame.assign(symbol=frame.index)
+        names = [record.name if (record := symbols.REGISTRY.get(s)) else s for s in frame["symbol"]]
+    snap = core.refresher.get("quotes")
+    rows = [{"symbol": s, "name": n, "price": clean(p), "change": clean(c), "ok": bool(ok)}
+            for s, n, p, c, ok in zip(frame["symbol"], names, frame["price"], frame["change"], frame["ok"])]
+    return 200, {"polled_at": snap.updated_at, "stale": snap.stale, "quotes": rows}
+
+
+def fng(core, req):
+    score, vix, vix_change = core.macro_fng()
+    return 200, {"macro": {"score": clean(score), "vix": clean(vix), "vix_change": clean(vix_change)}, "crypto": {"score": clean(core.crypto_fng())}}
+
+
+def correlation_matrix(core, req):
+    universe = req.query.get("universe", "Core")
+    if universe not in backend.correlation_universes(): raise ApiError(404, f"unknown universe; one of {', '.join(backend.correlation_universes())}")
+    try: window = int(req.query.get("window", 30))
+    except ValueError: raise ApiError(400, "window must be an integer")
+    if window not in correlation.WINDOWS: raise ApiError(400, f"window must be one of {correlation.WINDOWS}")
+    corr = core.correlation_matrix(universe, window)
+    if corr is None: raise ApiError(503, "not enough history yet")
+    return 200, {"universe": universe, "window": window, "labels": [str(c) for c in corr.columns],
+                 "matrix": [[clean(round(v, 4)) for v in row] for row in corr.to_numpy()]}
+
+
+def news_items(core, req):
+    if "q" in req.query: query = req.query["q"]
+    elif req.query.get("mode", "GLOBAL").upper() in backend.NEWS_QUERIES: query = backend.NEWS_QUERIES[req.query.get("mode", "GLOBAL").upper()]
+    else: raise ApiError(404, f"unknown mode; one of {', '.join(backend.NEWS_QUERIES)}")
+    try: items = core.rss_news(query)
+    except Exception as e: raise ApiError(502, f"news feed error: {e}")
+    return 200, {"query": query, "items": [item._asdict() for item in items]}
+
+
+def report_payload(report, with_items=False):
+    out = {"mode": report.mode, "created": report.created, "model": report.model, "source": report.source, "text": report.text}
+    if with_items: out["items"] = [item._asdict() for item in report.items]
+    return out
+
+
+def briefings(core, req):
+    latest = (core.reports.latest(mode) for mode in backend.NEWS_QUERIES)
+    return 200, {"briefings": [report_payload(r) for r in latest if r]}
+
+
+def briefing(core, req, mode):
+    mode = mode.upper()
+    if mode not in backend.NEWS_QUERIES: raise ApiError(404, f"unknown mode; one of {', '.join(backend.NEWS_QUERIES)}")
+    report = core.reports.latest(mode)
+    if report is None: raise ApiError(404, f"no {mode} briefing yet")
+    return 200, report_payload(report, with_items=True)
+
+
+def generate(core, req, mode):
+    mode = mode.upper()
+    if mode not in backend.NEWS_QUERIES: raise ApiError(404, f"unknown mode; one of {', '.join(backend.NEWS_QUERIES)}")
+    api_key = req.headers.get("x-goog-api-key") or core.server_api_key
+    if not api_key: raise ApiError(401, "send a Gemini key in X-Goog-Api-Key")
+    text, created = core.brief(mode, api_key)
+    if not created: raise ApiError(502, text)
+    return 201, report_payload(core.reports.latest(mode), with_items=True)
+
+
+def prometheus(core, req):
+    return 200, metrics.prometheus()
+
+
+# method, path pattern, handler, memo TTL in seconds (0 = never memoised), snapshot jobs the body depends on
+ROUTES = (
+    ("GET", r"/v1/health", health, 1.0, ()),
+    ("GET", r"/v1/market", market, 1.0, ("quotes",)),
+    ("GET", r"/v1/fng", fng, 1.0, ("macro_fng", "crypto_fng")),
+    ("GET", r"/v1/correlation", correlation_matrix, 60.0, ("bars_1d",)),
+    ("GET", r"/v1/news", news_items, 60.0, ()),
+    ("GET", r"/v1/briefings", briefings, 5.0, ()),
+    ("GET", r"/v1/briefings/(?P<mode>[A-Za-z]+)", briefing, 5.0, ()),
+    ("POST", r"/v1/briefings/(?P<mode>[A-Za-z]+)", generate, 0, ()),
+    ("GET", r"/metrics", prometheus, 1.0, ()),
+)
+_ROUTES = [(method, re.compile(pattern + "$"), handler, ttl, jobs) for method, pattern, handler, ttl, jobs in ROUTES]
+
+
+def route(method, path):
+    """``(handler, kwargs, ttl, jobs)`` for a request line; ``ApiError`` for unknown paths or methods."""
+    allowed = False
+    for m, pattern, handler, ttl, jobs in _ROUTES:
+        match = pattern.match(path)
+        if not match: continue
+        if m == method: return handler, match.groupdict(), ttl, jobs
+        allowed = True
+    raise ApiError(405 if allowed else 404, f"{method} {path} not supported")
+
+
+def call(core, req):
+    """Run the handler for ``req``: ``(status, payload)``, errors included."""
+    try:
+        handler, kwargs, _, _ = route(req.method, req.path)
+        return handler(core, req, **kwargs)
+    except ApiError as e: return e.status, {"error": str(e)}
+    except Exception as e:
+        metrics.fail("api")
+        return 500, {"error": str(e) or type(e).__name__}
+
+
+def encode(status, payload):
+    if isinstance(payload, str): return status, payload.encode(), "text/plain; version=0.0.4"
+    return status, json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(), "application/json"
+
+
+class ApiServer:
+    def __init__(self, core, host=HOST, port=PORT):
+        self.core, self.host, self.port = core, host, port
+        self.requests = 0
+        self._memo = {}        # (path, query) -> (expires, version, encoded response)
+        self._inflight = {}    # (path, query) -> future of a build in progress
+        self._loop = self._server = self._thread = None
+
+    def version(self, jobs):
+        return tuple(self.core.refresher.get(name).updated_at for name in jobs)
+
+    async def respond(self, req):
+        try: handler, _, ttl, jobs = route(req.method, req.path)
+        except ApiError as e: return encode(e.status, {"error": str(e)})
+        if not ttl:
+            response = encode(*await asyncio.to_thread(call, self.core, req))
+            # A write (briefing generation) invalidates the memoised reads under the same collection.
+            collection = req.path.rsplit("/", 1)[0]
+            for key in [k for k in self._memo if k[0].startswith(collection)]: self._memo.pop(key, None)
+            return response
+        key, now, version = (req.path, tuple(sorted(req.query.items()))), time.monotonic(), self.version(jobs)
+        hit = self._memo.get(key)
+        metrics.cache(f"api.{handler.__name__}", bool(hit and hit[0] > now and hit[1] == version))
+        if hit and hit[0] > now and hit[1] == version: return hit[2]
+        build = self._inflight.get(key)
+        if build is None: build = self._inflight[key] = asyncio.ensure_future(self.build(key, req, ttl, version))
+        return await asyncio.shield(build)
+
+    async def build(self, key, req, ttl, version):
+        try:
+            response = await asyncio.to_thread(lambda: encode(*call(self.core, req)))
+            if response[0] == 200:
+                if len(self._memo) >= MEMO_SIZE: self._memo.pop(next(iter(self._memo)))
+                self._memo[key] = (time.monotonic() + ttl, version, response)
+            return response
+        finally: self._inflight.pop(key, None)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try: head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.LimitOverrunError: return await self.write(writer, *encode(413, {"error": "headers too large"}), False)
+                except asyncio.IncompleteReadError: return
+                lines = head.decode("latin-1").split("\r\n")
+                try: method, target, version = lines[0].split(" ", 2)
+                except ValueError: return await self.write(writer, *encode(400, {"error": "bad request line"}), False)
+                headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+                try: length = int(headers.get("content-length") or 0)
+                except ValueError: length = -1
+                if length < 0: return await self.write(writer, *encode(400, {"error": "bad Content-Length"}), False)
+                if length > MAX_BODY: return await self.write(writer, *encode(413, {"error": "body too large"}), False)
+                if length: await reader.readexactly(length)
+                url = urllib.parse.urlsplit(target)
+                req = Request(method.upper(), url.path.rstrip("/") or "/", dict(urllib.parse.parse_qsl(url.query)), headers)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                start = time.perf_counter()
+                status, body, content_type = await self.respond(req)
+                metrics.observe("api.request", time.perf_counter() - start, status >= 500)
+                self.requests += 1
+                await self.write(writer, status, body, content_type, keep_alive)
+                if not keep_alive: return
+        except (ConnectionError, asyncio.IncompleteReadError): pass
+        finally: writer.close()
+
+    async def write(self, writer, status, body, content_type, keep_alive):
+        writer.write(f"HTTP/1.1 {status} {STATUS.get(status, '')}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    async def serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self.handle, self.host, self.port, limit=MAX_HEADER, backlog=512)
+        self.port = self._server.sockets[0].getsockname()[1]
+        async with self._server: await self._server.serve_forever()
+
+    def start(self):
+        """Serve from a daemon thread with its own event loop; returns once the socket is bound."""
+        bound = threading.Event()
+
+        def run():
+            async def main():
+                task = asyncio.ensure_future(self.serve())
+                while self._server is None and not task.done(): await asyncio.sleep(0.01)
+                bound.set()
+                await task
+            try: asyncio.run(main())
+            except asyncio.CancelledError: pass
+            finally: bound.set()
+
+        self._thread = threading.Thread(target=run, name="terminal-api", daemon=True)
+        self._thread.start()
+        bound.wait(10)
+        return self
+
+    def stop(self):
+        if self._loop and self._server: self._loop.call_soon_threadsafe(self._server.close)
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+
+def serve_in_thread(core, host=HOST, port=PORT):
+    return ApiServer(core, host, port).start()
+
+
+# --- CLI ---
+def cli_request(args):
+    """``(method, path, query)`` for a one-shot subcommand."""
+    if args.command == "market": return "GET", "/v1/market", {k: v for k, v in (("class", args.asset_class), ("symbols", args.symbols)) if v}
+    if args.command == "correlation": return "GET", "/v1/correlation", {"universe": args.universe, "window": str(args.window)}
+    if args.command == "news": return "GET", "/v1/news", {"q": args.query} if args.query else {"mode": args.mode}
+    if args.command == "briefings": return "GET", f"/v1/briefings/{args.mode.upper()}" if args.mode else "/v1/briefings", {}
+    if args.command == "generate": return "POST", f"/v1/briefings/{args.mode.upper()}", {}
+    return "GET", f"/v1/{args.command}", {}
+
+
+def fetch(url, method, path, query, headers):
+    request = urllib.request.Request(f"{url.rstrip('/')}{path}?{urllib.parse.urlencode(query)}", method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=300) as response: return response.status, json.load(response)
+    except urllib.error.HTTPError as e: return e.code, json.load(e)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m terminal.api", description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="query a running server instead of building a local backend")
+    parser.add_argument("--api-key", default=os.environ.get("GOOGLE_API_KEY"), help="Gemini key for briefings (default $GOOGLE_API_KEY)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the HTTP server")
+    serve.add_argument("--host", default=HOST)
+    serve.add_argument("--port", type=int, default=PORT)
+    commands.add_parser("health")
+    market_cmd = commands.add_parser("market")
+    market_cmd.add_argument("--class", dest="asset_class", choices=list(quotes.MARKET_MAP))
+    market_cmd.add_argument("--symbols", help="comma-separated yfinance codes")
+    commands.add_parser("fng")
+    corr_cmd = commands.add_parser("correlation")
+    corr_cmd.add_argument("--universe", default="Core")
+    corr_cmd.add_argument("--window", type=int, default=30)
+    news_cmd = commands.add_parser("news")
+    news_cmd.add_argument("--mode", default="GLOBAL", type=str.upper, choices=list(backend.NEWS_QUERIES))
+    news_cmd.add_argument("--query")
+    brief_cmd = commands.add_parser("briefings")
+    brief_cmd.add_argument("mode", nargs="?", type=str.upper, choices=list(backend.NEWS_QUERIES))
+    gen_cmd = commands.add_parser("generate")
+    gen_cmd.add_argument("mode", type=str.upper, choices=list(backend.NEWS_QUERIES))
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = ApiServer(backend.Backend(server_api_key=args.api_key).start(), args.host, args.port)
+        print(f"serving on http://{args.host}:{args.port}", file=sys.stderr)
+        try: asyncio.run(server.serve())
+        except KeyboardInterrupt: pass
+        return 0
+
+    method, path, query = cli_request(args)
+    headers = {"X-Goog-Api-Key": args.api_key} if args.api_key and method == "POST" else {}
+    if args.url: status, payload = fetch(args.url, method, path, query, headers)
+    else:
+        # One-shot: no refresher loop (it would start every job, briefings and bar backfill included,
+        # and exit with them half done). Poll instead of opening the websocket, and run only the
+        # snapshot jobs this route reads, to completion, before answering.
+        core = backend.Backend(server_api_key=args.api_key, stream_quotes=False)
+        for name in route(method, path)[3]: core.refresher.run(name)
+        status, payload = call(core, Request(method, path, query, {k.lower(): v for k, v in headers.items()}))
+    json.dump(payload, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 0 if status < 400 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
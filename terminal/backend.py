@@ -0,0 +1,286 @@
+"""Streamlit-free data and briefing layer behind the dashboard and the JSON API.
+
+``Backend`` owns the long-lived resources (refresher jobs, live quote stream,
+bar, headline, report and watchlist stores, news feed, LLM client, dispatcher
+and response cache) and answers the reads the dashboard renders. app.py keeps
+one per server in ``st.cache_resource`` and ``terminal.api`` one per process,
+so both serve the same snapshots. Resources are built, and the layers behind
+them imported, on first use, so a view that never touches the LLM stack never
+loads it.
+"""
+import os
+import threading
+import time
+
+from terminal import STREAM_QUOTES, lazy, metrics, refresher
+
+(barstore, correlation, dispatch, headlines, llm, llmcache, news, pipeline, quotes, reports, sentiment, stream, watchlists) = (
+    lazy(f"terminal.{name}") for name in ("barstore", "correlation", "dispatch", "headlines", "llm", "llmcache", "news", "pipeline",
+                                          "quotes", "reports", "sentiment", "stream", "watchlists"))
+
+BRIEFING_MINUTES = int(os.environ.get("TERMINAL_BRIEFING_MINUTES", "30"))
+
+CORRELATION_SYMBOLS = ("BTC-USD", "^GSPC", "GC=F", "CL=F", "DX-Y.NYB")
+CORRELATION_NAMES = {"BTC-USD": "BTC", "^GSPC": "SPX", "GC=F": "GOLD", "CL=F": "OIL", "DX-Y.NYB": "DXY"}
+
+NEWS_QUERIES = {
+    "GLOBAL": "Global economy stock market inflation central banks",
+    "BTC": "Bitcoin crypto market ETF on-chain",
+    "FX": "EURUSD GBPUSD USDJPY AUDUSD USDCAD forex central bank",
+    "GEO": "Geopolitics War Oil Gold Economy sanctions",
+}
+
+REPORT_TTL = 3600
+REPORT_SAFETY_SETTINGS = [{"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"}]
+REPORT_GENERATION_CONFIG = {"maxOutputTokens": 8192}
+
+
+def correlation_universes():
+    universes = {"Core": {name: symbol for symbol, name in CORRELATION_NAMES.items()}, **quotes.MARKET_MAP}
+    merged = {}
+    for tickers in universes.values():
+        for name, symbol in tickers.items():
+            if symbol and symbol not in merged.values() and name not in merged: merged[name] = symbol
+    universes["All"] = merged
+    return universes
+
+
+def build_report_prompt(data_dump, mode):
+    if mode == "BTC":
+        prompt = f"""ROLE: Senior Crypto Strategist. TASK: Deep-dive Bitcoin report. DATA: {data_dump}. OUTPUT: ### ⚡️ LIVE PULSE\n### 🏦 FLOWS\n### 🔮 SCENARIOS"""
+    elif mode == "GEO":
+        prompt = f"""ROLE: Intelligence Analyst. TASK: Geopolitical Threat Assessment. DATA: {data_dump}. OUTPUT: ### 🌍 THREAT MATRIX\n### ⚔️ FLASHPOINTS\n### 🛡 MARKET IMPACT"""
+    elif mode == "GLOBAL":
+        prompt = f"""ROLE: Chief Investment Officer. TASK: Global Market Executive Summary. DATA: {data_dump}. OUTPUT: ### 🌎 MACRO OVERVIEW\n### 🚨 KEY RISKS\n### 💡 OPPORTUNITIES"""
+    else: # FX
+        prompt = f"""ROLE: FX Strategist. TASK: Weekly Outlook for 7 Major Pairs. DATA: {data_dump}. OUTPUT: **💵 DXY**\n---\n### 🇪🇺 EUR/USD\n### 🇬🇧 GBP/USD\n### 🇯🇵 USD/JPY\n### 🇨🇭 USD/CHF\n### 🇦🇺 AUD/USD\n### 🇨🇦 USD/CAD\n### 🇳🇿 NZD/USD"""
+    return prompt
+
+
+class ReportError(Exception):
+    """A report could not be generated; raised after any partial output, whose text is not a report."""
+
+
+class Backend:
+    def __init__(self, server_api_key=None, stream_quotes=STREAM_QUOTES):
+        self.server_api_key, self.stream_quotes = server_api_key, stream_quotes
+        self.quote_poll = 300 if stream_quotes else 15
+        self._resources = {}
+        self._lock = threading.RLock()
+        self._briefing_attempt = None
+        self.refresher = (refresher.Refresher()
+            .register("quotes", metrics.timed("refresh.quotes")(self.poll_quotes), self.quote_poll)
+            .register("macro_fng", metrics.timed("refresh.macro_fng")(lambda: sentiment.fetch_macro_fng()), 300, default=(50, 0, 0))
+            .register("crypto_fng", metrics.timed("refresh.crypto_fng")(lambda: sentiment.fetch_crypto_fng()), 300, default=50)
+            .register("bars_1d", metrics.timed("refresh.bars_1d")(lambda: self.bars.sync(quotes.universe(quotes.MARKET_MAP) + CORRELATION_SYMBOLS, "1d")), 3600)
+            .register("briefings", metrics.timed("refresh.briefings")(lambda: self.pregenerate_briefings(server_api_key) if server_api_key else None), 60))
+
+    def start(self):
+        # TERMINAL_REFRESHER=0 leaves the jobs registered but idle (benchmarks, offline runs).
+        if os.environ.get("TERMINAL_REFRESHER", "1") != "0": self.refresher.start()
+        return self
+
+    # --- resources ---
+    def _resource(self, name, factory):
+        with self._lock:
+            if name not in self._resources: self._resources[name] = factory()
+            return self._resources[name]
+
+    @property
+    def watchlists(self):
+        return self._resource("watchlists", watchlists.WatchlistStore)
+
+    @property
+    def bars(self):
+        return self._resource("bars", barstore.BarStore)
+
+    @property
+    def quote_stream(self):
+        return self._resource("quote_stream", lambda: stream.QuoteStream(self.quote_universe()).start())
+
+    @property
+    def news_feed(self):
+        return self._resource("news_feed", news.NewsFeed)
+
+    @property
+    def headlines(self):
+        return self._resource("headlines", headlines.HeadlineStore)
+
+    @property
+    def llm_client(self):
+        return self._resource("llm_client", llm.GeminiClient)
+
+    @property
+    def dispatcher(self):
+        return self._resource("dispatcher", lambda: dispatch.Dispatcher(requests_per_minute=int(os.environ.get("TERMINAL_LLM_RPM", "15"))))
+
+    @property
+    def llm_cache(self):
+        return self._resource("llm_cache", llmcache.ResponseCache)
+
+    @property
+    def reports(self):
+        return self._resource("reports", reports.ReportStore)
+
+    def correlation_engine(self, universe):
+        def build():
+            tickers = correlation_universes()[universe]
+            return correlation.UniverseCorrelation(self.bars, tickers.values(), labels=tickers.keys())
+        return self._resource(f"correlation:{universe}", build)
+
+    def stream_status(self):
+        """``(connected, messages, error)`` of the quote stream, without opening it."""
+        live = self._resources.get("quote_stream")
+        return (live.connected, live.messages, live.error) if live else (False, 0, None)
+
+    def dispatch_stats(self):
+        """LLM queue stats, or ``None`` while nothing has been dispatched (without building the LLM stack)."""
+        live = self._resources.get("dispatcher")
+        return live.stats() if live else None
+
+    # --- market data ---
+    def quote_universe(self):
+        # Built-in asset classes plus every symbol on a saved watchlist.
+        return tuple(dict.fromkeys(quotes.universe(quotes.MARKET_MAP) + self.watchlists.symbols()))
+
+    def poll_quotes(self):
+        universe = self.quote_universe()
+        snapshot = quotes.fetch_quotes(universe)
+        if self.stream_quotes:
+            self.quote_stream.add_symbols(universe)
+            self.quote_stream.seed(snapshot)
+        return snapshot
+
+    def watch_symbols(self, codes):
+        # Subscribe right away and pull the next poll forward so a saved list fills in without waiting quote_poll.
+        if self.stream_quotes: self.quote_stream.add_symbols(codes)
+        self.refresher.refresh("quotes")
+
+    def read_snapshot(self, name, wait=0.0):
+        snap = self.refresher.get(name, wait=wait)
+        metrics.cache(f"snapshot.{name}", not snap.stale)
+        return snap.value
+
+    @metrics.timed("get_market_data")
+    def market_data(self):
+        if not self.stream_quotes: return self.read_snapshot("quotes", wait=15)
+        live = self.quote_stream
+        metrics.cache("stream.quotes", live.connected)
+        return live.overlay(self.read_snapshot("quotes", wait=0 if live.connected else 15))
+
+    @metrics.timed("get_crypto_fng")
+    def crypto_fng(self):
+        return self.read_snapshot("crypto_fng", wait=5)
+
+    @metrics.timed("get_macro_fng")
+    def macro_fng(self):
+        polled = self.read_snapshot("macro_fng", wait=5)
+        live = self.quote_stream.quote("^VIX") if self.stream_quotes else None
+        if not live: return polled
+        vix, change = live
+        return sentiment.vix_score(vix), round(vix, 2), round(change, 2) if change is not None else polled[2]
+
+    @metrics.timed("get_correlation_matrix")
+    def correlation_matrix(self, universe="Core", window=30):
+        try:
+            engine = self.correlation_engine(universe)
+            if any(self.bars.last_ts(s, "1d") is None for s in engine.symbols): self.refresher.get("bars_1d", wait=30)
+            engine.refresh()
+            corr = engine.engine.frame(window)
+            corr = corr.dropna(how="all").dropna(axis=1, how="all")
+            return corr if not corr.empty else None
+        except Exception:
+            metrics.fail("get_correlation_matrix")
+            return None
+
+    # --- news and briefings ---
+    @metrics.timed("get_rss_news")
+    def rss_news(self, query):
+        return self.news_feed.fetch(query)
+
+    def briefing_news(self, mode, items=None):
+        if items is None:
+            try: items = self.rss_news(NEWS_QUERIES[mode])
+            except Exception: items = ()
+        self.headlines.ingest(items, mode)
+        return self.headlines.briefing_items(mode)
+
+    @metrics.timed("resolve_best_model")
+    def resolve_model(self, api_key):
+        return self.llm_client.resolve_model(api_key)
+
+    @metrics.timed("stream_report")
+    def stream_report(self, data_dump, mode, api_key):
+        if not api_key: raise ReportError("⚠️ Please enter your Google API Key in the sidebar.")
+        clean_key = api_key.strip()
+        active_model, status = self.resolve_model(clean_key)
+        if not active_model: raise ReportError(f"❌ Error: {status}")
+        cache = self.llm_cache
+        cache_key = llmcache.cache_key(active_model, "report", mode=mode, news=llmcache.news_fingerprint(data_dump))
+        hit = cache.get(cache_key, max_age=REPORT_TTL)
+        metrics.cache("llm.report", hit is not None)
+        if hit is not None:
+            yield hit
+            return
+
+        parts = []
+        try:
+            client, prompt = self.llm_client, build_report_prompt(data_dump, mode)
+            upstream = lambda: client.stream(clean_key, prompt, REPORT_GENERATION_CONFIG, REPORT_SAFETY_SETTINGS)
+            for chunk in self.dispatcher.stream(clean_key, cache_key, upstream, dispatch.BATCH):
+                chunk = chunk.replace("$","USD ")
+                parts.append(chunk)
+                yield chunk
+        except llm.LLMError as e: raise ReportError(f"❌ Error: {str(e)}") from e
+        except Exception as e: raise ReportError(f"System Error: {str(e)}") from e
+        # A blocked or empty completion is a failure, not a cacheable answer.
+        text = "".join(parts)
+        if not text.strip(): raise ReportError("❌ Error: the model returned an empty report")
+        cache.put(cache_key, text, "report", active_model)
+
+    def generate_report(self, data_dump, mode, api_key):
+        """Whole report text; raises ``ReportError`` if generation failed at any point."""
+        return "".join(self.stream_report(data_dump, mode, api_key))
+
+    def briefing_pipeline(self, api_key, max_workers=4):
+        # Resolve the shared resources up front; the workers only use them.
+        feed = self.news_feed
+        self.headlines, self.llm_client, self.llm_cache, self.dispatcher
+        flow = pipeline.Pipeline(max_workers=max_workers)
+        for mode in NEWS_QUERIES:
+            flow.add(f"news:{mode}", lambda mode=mode: self.briefing_news(mode, feed.fetch(NEWS_QUERIES[mode])))
+            flow.add(f"report:{mode}", lambda items, mode=mode: self.generate_report(news.format_items(items), mode, api_key), deps=[f"news:{mode}"])
+        return flow
+
+    def save_report(self, mode, text, items, source, api_key=None):
+        if not text: return None
+        model = self.llm_client.resolve_model(api_key)[0] if api_key else ""
+        return self.reports.save(mode, text, items, model=model or "", source=source)
+
+    def brief(self, mode, api_key, source="api"):
+        """News, report and store for one mode; ``(text, created)`` with ``created`` None on failure."""
+        items = self.briefing_news(mode)
+        briefed_at = time.time()  # after ingest, so the headlines just briefed are not "new" next time
+        try: text = self.generate_report(news.format_items(items), mode, api_key)
+        except ReportError as e: return str(e), None
+        created = self.save_report(mode, text, items, source, api_key)
+        if created: self.headlines.mark_briefed(mode, briefed_at)
+        return text, created
+
+    def pregenerate_briefings(self, api_key):
+        # Runs on the refresher thread. Due-ness is measured from the last attempted run, not the
+        # last saved report, so a mode that keeps failing waits for the next slot instead of
+        # rerunning the pipeline on every tick; after a restart the saved reports seed it.
+        store = self.reports
+        if self._briefing_attempt is None: self._briefing_attempt = min(store.latest_times().get(mode, 0.0) for mode in NEWS_QUERIES)
+        if not reports.BriefingSchedule(every=BRIEFING_MINUTES * 60).due(self._briefing_attempt): return self._briefing_attempt
+        self._briefing_attempt = time.time()
+        items = {}
+        for name, state, value in self.briefing_pipeline(api_key).run():
+            stage, mode = name.split(":")
+            if state != pipeline.DONE: continue
+            if stage == "news": items[mode] = value
+            else:
+                if self.save_report(mode, value, items[mode], "scheduled", api_key): self.headlines.mark_briefed(mode)
+        store.prune()
+        return self._briefing_attempt
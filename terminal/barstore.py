@@ -0,0 +1,120 @@
+"""Append-only on-disk OHLCV store, one memory-mapped record file per symbol/interval.
+
+Files hold fixed-width little-endian records (``BAR_DTYPE``) sorted by
+timestamp. ``sync`` only downloads bars newer than the last stored one and
+never rewrites existing records, so a restarted process reads warm history
+straight from disk.
+"""
+import os
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from terminal import DATA_DIR
+
+BAR_DTYPE = np.dtype([("ts", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"), ("volume", "<f8")])
+INTERVAL_SECONDS = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600, "1d": 86400, "1wk": 604800}
+BACKFILL = {"1m": "7d", "5m": "60d", "15m": "60d", "1h": "730d", "1d": "5y", "1wk": "10y"}
+
+
+def _epoch(index, interval):
+    # Daily and weekly bars are keyed by their exchange-local date so that
+    # symbols from different time zones line up on the same row.
+    ts = pd.DatetimeIndex(index)
+    if INTERVAL_SECONDS[interval] >= 86400: ts = ts.tz_localize(None).normalize() if ts.tz is not None else ts.normalize()
+    ts = ts.tz_convert("UTC") if ts.tz is not None else ts.tz_localize("UTC")
+    return ts.as_unit("s").asi8
+
+
+class BarStore:
+    def __init__(self, root=None):
+        self.root = root or os.path.join(DATA_DIR, "bars")
+        self._lock = threading.Lock()
+
+    def path(self, symbol, interval):
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", symbol)
+        return os.path.join(self.root, interval, f"{safe}.bin")
+
+    def bars(self, symbol, interval):
+        """Read-only structured array view of every stored bar (empty if none)."""
+        path = self.path(symbol, interval)
+        try: size = os.path.getsize(path)
+        except OSError: return np.empty(0, dtype=BAR_DTYPE)
+        count = size // BAR_DTYPE.itemsize  # ignore a torn trailing record from an interrupted write
+        if not count: return np.empty(0, dtype=BAR_DTYPE)
+        return np.memmap(path, dtype=BAR_DTYPE, mode="r", shape=(count,))
+
+    def last_ts(self, symbol, interval):
+        bars = self.bars(symbol, interval)
+        return int(bars["ts"][-1]) if len(bars) else None
+
+    def read(self, symbol, interval, since=None):
+        """Stored bars as a DataFrame indexed by UTC timestamp, optionally from ``since`` (epoch seconds)."""
+        bars = self.bars(symbol, interval)
+        if since is not None: bars = bars[np.searchsorted(bars["ts"], since):]
+        frame = pd.DataFrame({c.capitalize(): np.asarray(bars[c]) for c in BAR_DTYPE.names[1:]})
+        frame.index = pd.to_datetime(np.asarray(bars["ts"]), unit="s", utc=True)
+        return frame
+
+    def closes(self, symbols, interval="1d", since=None):
+        """Close prices for several symbols aligned on timestamp, one column per symbol."""
+        return pd.DataFrame({s: self.read(s, interval, since)["Close"] for s in symbols})
+
+    def append(self, symbol, interval, frame):
+        """Append rows of an OHLCV frame newer than the last stored bar; returns the count written."""
+        if frame is None or frame.empty: return 0
+        frame = frame.dropna(subset=["Close"])
+        ts = _epoch(frame.index, interval)
+        with self._lock:
+            last = self.last_ts(symbol, interval)
+            keep = ts > last if last is not None else np.ones(len(ts), dtype=bool)
+            if not keep.any(): return 0
+            records = np.empty(int(keep.sum()), dtype=BAR_DTYPE)
+            records["ts"] = ts[keep]
+            for c in BAR_DTYPE.names[1:]:
+                col = c.capitalize()
+                records[c] = frame[col].to_numpy(dtype="f8")[keep] if col in frame else np.nan
+            path = self.path(symbol, interval)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "ab") as f:
+                # Drop a torn trailing record first so new records stay aligned with bars().
+                f.truncate((f.tell() // BAR_DTYPE.itemsize) * BAR_DTYPE.itemsize)
+                f.write(records.tobytes())
+            return len(records)
+
+    def sync(self, symbols, interval="1d"):
+        """Download only the bars missing since each symbol's last stored timestamp.
+
+        The still-forming bar of the current period is skipped so stored
+        records are final and never need rewriting.
+        """
+        step = INTERVAL_SECONDS[interval]
+        now = time.time()
+        fresh, stale = [], {}
+        for symbol in dict.fromkeys(symbols):
+            last = self.last_ts(symbol, interval)
+            if last is None: fresh.append(symbol)
+            elif now - last >= 2 * step: stale[symbol] = last
+        written = {}
+        if fresh:
+            written.update(self._download(fresh, interval, now, period=BACKFILL[interval]))
+        if stale:
+            start = pd.Timestamp(min(stale.values()) + step, unit="s", tz="UTC")
+            written.update(self._download(list(stale), interval, now, start=start))
+        return written
+
+    def _download(self, symbols, interval, now, **window):
+        import yfinance as yf
+        frame = yf.download(symbols, interval=interval, group_by="ticker", threads=True,
+                            progress=False, auto_adjust=True, multi_level_index=True, **window)
+        written = {}
+        if frame is None or frame.empty: return written
+        cutoff = now - INTERVAL_SECONDS[interval]
+        for symbol in symbols:
+            if symbol not in frame.columns.get_level_values(0): continue
+            hist = frame[symbol]
+            written[symbol] = self.append(symbol, interval, hist[_epoch(hist.index, interval) <= cutoff])
+        return written
@@ -0,0 +1,97 @@
+"""Native price charts read straight from the bar store and downsampled server-side.
+
+Candles are merged into at most ``max_points`` OHLC buckets (first open, max
+high, min low, last close, summed volume), so wicks survive any compression
+ratio; line mode keeps ``max_points`` closes picked by Largest-Triangle-Three-
+Buckets. Both work on the memory-mapped columns without building a DataFrame,
+and finished figures are memoised on the symbol, window and last stored bar,
+so a rerun with no new bars skips the downsampling and gets a copy of the
+cached figure.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+from terminal import LRUCache, metrics
+
+RANGES = {"1D": 1, "5D": 5, "1M": 31, "6M": 183, "1Y": 366, "5Y": 5 * 366, "Max": None}
+STYLES = ("Candles", "Line")
+# Roughly one candle per 2px and one line vertex per px of a full-width chart.
+CANDLE_POINTS = 600
+LINE_POINTS = 1500
+CACHE_SIZE = 32
+
+_cache = LRUCache(CACHE_SIZE)
+
+
+def window(bars, days):
+    """The trailing ``days`` of ``bars``, anchored on the last stored bar rather than the clock."""
+    if days is None or not len(bars): return bars
+    return bars[np.searchsorted(bars["ts"], int(bars["ts"][-1]) - days * 86400):]
+
+
+def bucket_ohlc(bars, n):
+    """Merge consecutive bars into ``n`` equal-count OHLCV buckets."""
+    if len(bars) <= n: return np.array(bars)
+    starts = np.linspace(0, len(bars), n, endpoint=False).astype(np.int64)
+    out = np.empty(n, dtype=bars.dtype)
+    out["ts"], out["open"] = bars["ts"][starts], bars["open"][starts]
+    out["close"] = bars["close"][np.append(starts[1:], len(bars)) - 1]
+    out["high"] = np.fmax.reduceat(bars["high"], starts)
+    out["low"] = np.fmin.reduceat(bars["low"], starts)
+    out["volume"] = np.add.reduceat(np.nan_to_num(bars["volume"]), starts)
+    return out
+
+
+def lttb(x, y, n):
+    """Indices of the ``n`` points Largest-Triangle-Three-Buckets keeps from ``(x, y)``."""
+    size = len(y)
+    if n >= size or n < 3: return np.arange(size)
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    keep = np.empty(n, dtype=np.int64)
+    keep[0], keep[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, edges[i + 2] if i + 2 < n - 1 else size
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def series(bars, style, max_points):
+    """Downsampled bars for ``style``: OHLC buckets for candles, LTTB-selected rows for lines."""
+    bars = bars[np.isfinite(bars["close"])]
+    if style == "Candles": return bucket_ohlc(bars, max_points)
+    return np.asarray(bars[lttb(bars["ts"].astype(float), np.asarray(bars["close"], dtype=float), max_points)])
+
+
+def figure(store, symbol, interval, range_name="1Y", style="Candles", text_color="#F3F4F6", max_points=None):
+    """Plotly figure for ``symbol`` from ``store``, or ``None`` when nothing is stored yet."""
+    bars = store.bars(symbol, interval)
+    if not len(bars): return None
+    max_points = max_points or (CANDLE_POINTS if style == "Candles" else LINE_POINTS)
+    key = (symbol, interval, range_name, style, max_points, text_color, len(bars), int(bars["ts"][-1]))
+    fig = _cache.get(key)
+    metrics.cache("charts.figure", fig is not None)
+    if fig is None:
+        fig = build_figure(series(window(bars, RANGES[range_name]), style, max_points), symbol, style, text_color)
+        _cache.put(key, fig)
+    return go.Figure(fig)
+
+
+def build_figure(points, symbol, style, text_color):
+    x = points["ts"].astype("datetime64[s]")
+    if style == "Candles":
+        trace = go.Candlestick(x=x, open=points["open"], high=points["high"], low=points["low"], close=points["close"], name=symbol,
+                               increasing_line_color='#10B981', decreasing_line_color='#EF4444')
+    else:
+        trace = go.Scattergl(x=x, y=points["close"], mode="lines", name=symbol, line={'color': '#3B82F6', 'width': 1.5})
+    fig = go.Figure(trace)
+    fig.update_layout(height=650, margin=dict(l=10, r=10, t=30, b=10), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      font={'family': "Inter", 'color': text_color}, xaxis_rangeslider_visible=False, showlegend=False,
+                      uirevision=symbol, title={'text': f"{symbol} · {len(points):,} pts", 'font': {'size': 13}})
+    fig.update_xaxes(gridcolor='rgba(128,128,128,0.15)')
+    fig.update_yaxes(gridcolor='rgba(128,128,128,0.15)', side="right")
+    return fig
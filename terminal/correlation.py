@@ -0,0 +1,158 @@
+"""Incremental multi-window rolling correlation over an arbitrary symbol universe.
+
+Each window keeps a ring buffer of its last ``size`` return rows plus running
+pairwise sums (count, sum, sum of squares, cross-products). A new bar adds
+its outer products and removes the ones of the row falling out of the
+window, so an update is O(N²) regardless of window length. Missing values
+are tracked with pairwise masks, which lets 24/7 crypto and weekday-only
+markets share a universe. The sums are rebuilt from the ring once per full
+wrap to keep floating-point drift from accumulating.
+"""
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+WINDOWS = (7, 30, 90, 365)
+
+
+class _Window:
+    def __init__(self, size, n_symbols):
+        self.size = size
+        self.ring = np.full((size, n_symbols), np.nan)
+        self.pos, self.filled, self.since_rebase = 0, 0, 0
+        shape = (n_symbols, n_symbols)
+        self.n, self.sx, self.sxx, self.sxy = (np.zeros(shape) for _ in range(4))
+
+    def _accumulate(self, row, sign):
+        mask = (~np.isnan(row)).astype(float)
+        z = np.nan_to_num(row)
+        self.n += sign * np.outer(mask, mask)
+        self.sx += sign * np.outer(z, mask)
+        self.sxx += sign * np.outer(z * z, mask)
+        self.sxy += sign * np.outer(z, z)
+
+    def push(self, row):
+        if self.filled == self.size: self._accumulate(self.ring[self.pos], -1.0)
+        else: self.filled += 1
+        self.ring[self.pos] = row
+        self._accumulate(row, 1.0)
+        self.pos = (self.pos + 1) % self.size
+        self.since_rebase += 1
+        if self.since_rebase >= self.size: self.rebase()
+
+    def load(self, rows):
+        rows = rows[-self.size:]
+        self.ring[:] = np.nan
+        self.ring[:len(rows)] = rows
+        self.filled, self.pos = len(rows), len(rows) % self.size
+        self.rebase()
+
+    def rebase(self):
+        rows = self.ring[:self.filled] if self.filled < self.size else self.ring
+        mask = (~np.isnan(rows)).astype(float)
+        z = np.nan_to_num(rows)
+        self.n, self.sx, self.sxx, self.sxy = mask.T @ mask, z.T @ mask, (z * z).T @ mask, z.T @ z
+        self.since_rebase = 0
+
+    def corr(self, min_periods):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n = self.n
+            mean_i, mean_j = self.sx / n, self.sx.T / n
+            cov = self.sxy / n - mean_i * mean_j
+            var_i = self.sxx / n - mean_i ** 2
+            var_j = self.sxx.T / n - mean_j ** 2
+            out = cov / np.sqrt(var_i * var_j)
+        out[(n < min_periods) | ~(var_i > 0) | ~(var_j > 0)] = np.nan
+        return np.clip(out, -1.0, 1.0)
+
+
+class RollingCorrelation:
+    def __init__(self, labels, windows=WINDOWS, min_periods=5):
+        self.labels = list(labels)
+        self.min_periods = min_periods
+        self._windows = {w: _Window(w, len(self.labels)) for w in windows}
+
+    @property
+    def windows(self):
+        return tuple(self._windows)
+
+    def update(self, row):
+        """Add one bar of returns (NaN where a symbol has no data)."""
+        row = np.asarray(row, dtype=float)
+        for window in self._windows.values(): window.push(row)
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=float).reshape(-1, len(self.labels))
+        for window in self._windows.values():
+            if len(rows) >= window.size or window.filled == 0: window.load(rows)
+            else:
+                for row in rows: window.push(row)
+
+    def corr(self, window):
+        return self._windows[window].corr(self.min_periods)
+
+    def frame(self, window):
+        return pd.DataFrame(self.corr(window), index=self.labels, columns=self.labels)
+
+
+class UniverseCorrelation:
+    """Keeps a RollingCorrelation in step with the daily closes of a BarStore.
+
+    Each symbol keeps its own watermark (the last close fed to the engine).
+    When a symbol's store gains bars at or before the universe's newest fed
+    row (a late or failed download, a partial sync), the rows it belongs to
+    have already been pushed, so the engine is reloaded from a full window.
+    """
+
+    def __init__(self, store, symbols, labels=None, windows=WINDOWS, interval="1d", min_refresh=60):
+        self.store, self.symbols, self.interval = store, list(symbols), interval
+        self.labels, self.windows = list(labels or self.symbols), tuple(windows)
+        self.min_refresh = min_refresh
+        self._reset()
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self.engine = RollingCorrelation(self.labels, self.windows)
+        self._prev = np.full(len(self.symbols), np.nan)
+        self._seen = {s: None for s in self.symbols}
+        self._last_ts = None
+
+    @property
+    def ready(self):
+        return self._last_ts is not None
+
+    def _late(self):
+        """True if a symbol has stored bars newer than its watermark but not newer than ``_last_ts``."""
+        for symbol, seen in self._seen.items():
+            ts = self.store.bars(symbol, self.interval)["ts"]
+            i = np.searchsorted(ts, seen + 1) if seen is not None else 0
+            if i < len(ts) and ts[i] <= self._last_ts: return True
+        return False
+
+    def refresh(self, force=False):
+        """Feed returns for any closes stored since the last refresh; returns the number of new bars."""
+        with self._lock:
+            if not force and self.ready and time.time() - self._checked < self.min_refresh: return 0
+            self._checked = time.time()
+            if self.ready and self._late(): self._reset()
+            if self._last_ts is None: since = time.time() - (max(self.engine.windows) * 2 + 30) * 86400
+            else: since = self._last_ts + 1
+            frame = self.store.closes(self.symbols, self.interval, since=since)
+            if frame.empty: return 0
+            frame = frame.reindex(columns=self.symbols)
+            closes = frame.to_numpy(dtype=float)
+            returns = np.empty_like(closes)
+            prev = self._prev
+            for i, row in enumerate(closes):
+                with np.errstate(divide="ignore", invalid="ignore"): returns[i] = row / prev - 1.0
+                prev = np.where(np.isnan(row), prev, row)
+            self._prev = prev
+            for symbol in self.symbols:
+                last = frame[symbol].last_valid_index()
+                if last is not None: self._seen[symbol] = int(last.timestamp())
+            self._last_ts = int(frame.index[-1].timestamp())
+            self.engine.extend(returns)
+            return len(returns)
@@ -0,0 +1,132 @@
+"""Process-wide dispatcher for upstream LLM calls.
+
+Identical in-flight requests (same request key) share one upstream call and
+its streamed chunks. Each API key gets a token-bucket rate limit, a cap on
+concurrent calls, and a priority queue in which interactive chat jumps ahead
+of batch report generation. Queue depth and wait times are kept for
+``stats``.
+"""
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from terminal.llm import _key_id
+
+INTERACTIVE, BATCH = 0, 1
+
+
+class Flight:
+    """One upstream call whose chunks can be replayed and followed by any number of readers."""
+
+    def __init__(self):
+        self.chunks, self.done, self.error = [], False, None
+        self._cond = threading.Condition()
+
+    def push(self, chunk):
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.done, self.error = True, error
+            self._cond.notify_all()
+
+    def follow(self):
+        i = 0
+        while True:
+            with self._cond:
+                while i >= len(self.chunks) and not self.done: self._cond.wait()
+                pending, done, error = self.chunks[i:], self.done, self.error
+            i += len(pending)
+            yield from pending
+            if done and i >= len(self.chunks):
+                if error: raise error
+                return
+
+
+class _Lane:
+    """Queue, token bucket and concurrency slots for one API key."""
+
+    def __init__(self, dispatcher):
+        self.d = dispatcher
+        self.queue, self.running = [], 0
+        self.tokens, self.stamp = float(dispatcher.burst), time.monotonic()
+        self.wake = threading.Condition(dispatcher._lock)
+        threading.Thread(target=self._loop, name="llm-dispatch", daemon=True).start()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.d.burst, self.tokens + (now - self.stamp) * self.d.rate)
+        self.stamp = now
+
+    def _loop(self):
+        with self.d._lock:
+            while True:
+                self._refill()
+                if not self.queue or self.running >= self.d.concurrency:
+                    self.wake.wait()
+                    continue
+                if self.tokens < 1:
+                    self.wake.wait((1 - self.tokens) / self.d.rate)
+                    continue
+                _, _, job = heapq.heappop(self.queue)
+                self.tokens -= 1
+                self.running += 1
+                self.d._record_wait(job["priority"], time.monotonic() - job["queued"])
+                threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job):
+        flight, error = job["flight"], RuntimeError("LLM call interrupted")
+        try:
+            for chunk in job["factory"](): flight.push(chunk)
+            error = None
+        except Exception as e: error = e
+        finally:
+            # Unregister before finishing, so a request made after the followers see the end
+            # starts a fresh call instead of replaying this one (or its error).
+            with self.d._lock:
+                self.running -= 1
+                self.d._inflight.pop(job["key"], None)
+                self.wake.notify()
+            flight.finish(error)
+
+
+class Dispatcher:
+    def __init__(self, requests_per_minute=15, burst=5, concurrency=4):
+        self.rate, self.burst, self.concurrency = requests_per_minute / 60.0, burst, concurrency
+        self._lock = threading.Lock()
+        self._lanes, self._inflight = {}, {}
+        self._seq = itertools.count()
+        self._waits = {INTERACTIVE: collections.deque(maxlen=200), BATCH: collections.deque(maxlen=200)}
+        self.submitted = self.coalesced = 0
+
+    def stream(self, api_key, request_key, factory, priority=BATCH):
+        """Iterate the chunks of ``factory()``, sharing one upstream call per ``request_key``."""
+        with self._lock:
+            self.submitted += 1
+            flight = self._inflight.get(request_key)
+            if flight: self.coalesced += 1
+            else:
+                flight = self._inflight[request_key] = Flight()
+                lane = self._lanes.get(_key_id(api_key)) or self._lanes.setdefault(_key_id(api_key), _Lane(self))
+                job = {"key": request_key, "factory": factory, "flight": flight, "priority": priority, "queued": time.monotonic()}
+                heapq.heappush(lane.queue, (priority, next(self._seq), job))
+                lane.wake.notify()
+        return flight.follow()
+
+    def _record_wait(self, priority, wait):
+        self._waits[priority].append(wait)
+
+    def stats(self):
+        with self._lock:
+            out = {"queued": sum(len(l.queue) for l in self._lanes.values()),
+                   "running": sum(l.running for l in self._lanes.values()),
+                   "submitted": self.submitted, "coalesced": self.coalesced}
+            for priority, name in ((INTERACTIVE, "interactive"), (BATCH, "batch")):
+                waits = sorted(self._waits[priority])
+                out[f"{name}_wait_avg"] = sum(waits) / len(waits) if waits else 0.0
+                out[f"{name}_wait_p95"] = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+        return out
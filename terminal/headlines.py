@@ -0,0 +1,134 @@
+"""Deduplicated local headline store backed by SQLite + FTS5.
+
+Feed items are normalised (lower-cased, publisher suffix and punctuation
+stripped) and dropped if they match an existing headline exactly or if their
+word-shingle Jaccard similarity to a full-text candidate clears
+``SIMILARITY``. Each headline remembers which briefing modes have seen it, so
+``since_last_briefing`` can answer "what is new for GEO" with one indexed
+query.
+"""
+import re
+import sqlite3
+import threading
+import time
+
+from terminal import open_db
+from terminal.news import NewsItem
+
+SIMILARITY = 0.6
+SHINGLE = 3
+CANDIDATES = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS headlines (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    norm TEXT NOT NULL UNIQUE,
+    link TEXT, source TEXT, published TEXT, ts REAL, query TEXT,
+    ingested REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS headlines_ts ON headlines(ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS headlines_fts USING fts5(norm, content='headlines', content_rowid='id');
+CREATE TABLE IF NOT EXISTS headline_modes (
+    headline_id INTEGER NOT NULL REFERENCES headlines(id),
+    mode TEXT NOT NULL,
+    seen REAL NOT NULL,
+    PRIMARY KEY (mode, headline_id)
+);
+CREATE INDEX IF NOT EXISTS headline_modes_seen ON headline_modes(mode, seen);
+CREATE TABLE IF NOT EXISTS briefings (mode TEXT PRIMARY KEY, briefed REAL NOT NULL);
+"""
+
+
+def normalize(title):
+    title = re.sub(r"\s+[-–|]\s+[^-–|]{2,60}$", "", title)  # Google News appends " - Publisher"
+    title = re.sub(r"[^\w\s]", " ", title.lower())
+    return " ".join(title.split())
+
+
+def shingles(norm, size=SHINGLE):
+    words = norm.split()
+    if len(words) < size: return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+class HeadlineStore:
+    def __init__(self, path=None):
+        self.path, self._db = open_db(path, "headlines.db", _SCHEMA)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+
+    def _duplicate_of(self, norm):
+        row = self._db.execute("SELECT id FROM headlines WHERE norm = ?", (norm,)).fetchone()
+        if row: return row["id"]
+        terms = [w for w in set(norm.split()) if len(w) > 3]
+        if not terms: return None
+        match = " OR ".join(f'"{w}"' for w in terms)
+        target = shingles(norm)
+        for row in self._db.execute("SELECT rowid, norm FROM headlines_fts WHERE headlines_fts MATCH ? ORDER BY rank LIMIT ?", (match, CANDIDATES)):
+            if jaccard(target, shingles(row["norm"])) >= SIMILARITY: return row["rowid"]
+        return None
+
+    def ingest(self, items, mode):
+        """Store feed items under ``mode``; returns the items that were not near-duplicates."""
+        now = time.time()
+        fresh = []
+        with self._lock, self._db:
+            for item in items:
+                norm = normalize(item.title)
+                if not norm: continue
+                hid = self._duplicate_of(norm)
+                if hid is None:
+                    cur = self._db.execute(
+                        "INSERT INTO headlines (title, norm, link, source, published, ts, query, ingested) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (item.title, norm, item.link, item.source, item.published, item.timestamp or now, item.query, now))
+                    hid = cur.lastrowid
+                    self._db.execute("INSERT INTO headlines_fts (rowid, norm) VALUES (?, ?)", (hid, norm))
+                    fresh.append(item)
+                self._db.execute("INSERT OR IGNORE INTO headline_modes (headline_id, mode, seen) VALUES (?, ?, ?)", (hid, mode, now))
+        return fresh
+
+    def last_briefing(self, mode):
+        with self._lock: row = self._db.execute("SELECT briefed FROM briefings WHERE mode = ?", (mode,)).fetchone()
+        return row["briefed"] if row else 0.0
+
+    def mark_briefed(self, mode, when=None):
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO briefings (mode, briefed) VALUES (?, ?)", (mode, when or time.time()))
+
+    def since_last_briefing(self, mode, limit=20):
+        """Deduplicated headlines first seen for ``mode`` after its last briefing, newest first."""
+        return self._select("AND m.seen > ?", (mode, self.last_briefing(mode), limit))
+
+    def latest(self, mode, limit=20):
+        return self._select("", (mode, limit))
+
+    def briefing_items(self, mode, limit=20):
+        """New-since-last-briefing headlines first, topped up with the most recent ones already covered."""
+        items = list(self.since_last_briefing(mode, limit))
+        if len(items) < limit:
+            seen = {i.link for i in items}
+            items += [i for i in self.latest(mode, limit) if i.link not in seen][:limit - len(items)]
+        return tuple(items)
+
+    def search(self, text, limit=20):
+        terms = " OR ".join(f'"{w}"' for w in normalize(text).split())
+        if not terms: return ()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT h.* FROM headlines_fts f JOIN headlines h ON h.id = f.rowid WHERE headlines_fts MATCH ? ORDER BY rank LIMIT ?", (terms, limit)).fetchall()
+        return tuple(self._item(r) for r in rows)
+
+    def _select(self, where, params):
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT h.* FROM headline_modes m JOIN headlines h ON h.id = m.headline_id WHERE m.mode = ? {where} ORDER BY h.ts DESC LIMIT ?", params).fetchall()
+        return tuple(self._item(r) for r in rows)
+
+    @staticmethod
+    def _item(row):
+        return NewsItem(row["title"], row["link"] or "", row["source"] or "", row["published"] or "", row["ts"] or 0.0, row["query"] or "")
@@ -0,0 +1,77 @@
+"""Correlation heatmap that stays fast at hundreds of symbols.
+
+Builds one array-backed ``go.Heatmap`` trace instead of one annotation per
+cell, orders symbols by average-linkage clustering so correlated blocks sit
+together, and only prints values on cells whose magnitude clears a threshold
+(all cells for small matrices, hover only past ``TEXT_LIMIT``). Built figures are memoised on a digest of the
+matrix, so reruns with unchanged data skip the clustering; callers get a copy,
+so styling one render never leaks into the next.
+"""
+import hashlib
+
+import numpy as np
+import plotly.graph_objects as go
+
+from terminal import LRUCache, metrics
+
+COLORSCALE = [[0.0, '#EF4444'], [0.5, '#F3F4F6'], [1.0, '#10B981']]
+FULL_LABEL_LIMIT = 12
+TEXT_LIMIT = 150
+CACHE_SIZE = 32
+
+_cache = LRUCache(CACHE_SIZE)
+
+
+def cluster_order(corr):
+    """Leaf order of an average-linkage clustering on ``1 - corr`` distance."""
+    corr = np.asarray(corr, dtype=float)
+    n = len(corr)
+    if n < 3: return list(range(n))
+    dist = np.clip(1.0 - np.nan_to_num(corr, nan=0.0), 0.0, 2.0)
+    np.fill_diagonal(dist, np.inf)
+    orders, sizes = [[i] for i in range(n)], np.ones(n)
+    for _ in range(n - 1):
+        i, j = sorted(np.unravel_index(np.argmin(dist), dist.shape))
+        merged = (sizes[i] * dist[i] + sizes[j] * dist[j]) / (sizes[i] + sizes[j])
+        dist[i, :], dist[:, i] = merged, merged
+        dist[j, :], dist[:, j] = np.inf, np.inf
+        dist[i, i] = np.inf
+        orders[i], orders[j] = orders[i] + orders[j], None
+        sizes[i] += sizes[j]
+    return next(o for o in orders if o is not None)
+
+
+def digest(corr_df):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(corr_df.to_numpy(dtype=float)).tobytes())
+    h.update("\x1f".join(map(str, corr_df.index)).encode())
+    return h.hexdigest()
+
+
+def figure(corr_df, text_color, title, threshold=0.7):
+    key = (digest(corr_df), text_color, title, threshold)
+    fig = _cache.get(key)
+    metrics.cache("heatmap.figure", fig is not None)
+    if fig is None:
+        fig = build_figure(corr_df, text_color, title, threshold)
+        _cache.put(key, fig)
+    return go.Figure(fig)
+
+
+def build_figure(corr_df, text_color, title, threshold=0.7):
+    order = cluster_order(corr_df.values)
+    labels = [str(corr_df.index[i]) for i in order]
+    z = corr_df.to_numpy(dtype=float)[np.ix_(order, order)]
+    n = len(labels)
+    show = np.isfinite(z) & ((np.abs(z) >= threshold) if n > FULL_LABEL_LIMIT else True)
+    if n > FULL_LABEL_LIMIT: np.fill_diagonal(show, False)
+    text = np.where(show, np.char.mod("%.2f", np.nan_to_num(z)), "") if n <= TEXT_LIMIT else None
+    fig = go.Figure(go.Heatmap(
+        z=z, x=labels, y=labels, text=text, texttemplate="%{text}", textfont={'size': 11 if n <= FULL_LABEL_LIMIT else 8},
+        zmin=-1, zmax=1, colorscale=COLORSCALE, showscale=n > FULL_LABEL_LIMIT,
+        hovertemplate="%{y} / %{x}: %{z:.2f}<extra></extra>", xgap=1 if n <= 60 else 0, ygap=1 if n <= 60 else 0,
+    ))
+    fig.update_layout(title={'text': title, 'font': {'size': 14, 'color': text_color}}, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      font={'family': "Inter", 'color': text_color}, height=max(300, min(900, 14 * n + 80)), margin=dict(l=10, r=10, t=40, b=10),
+                      xaxis={'showticklabels': n <= 80}, yaxis={'showticklabels': n <= 80, 'autorange': 'reversed'})
+    return fig
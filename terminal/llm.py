@@ -0,0 +1,119 @@
+"""Gemini REST client.
+
+Blocking and SSE-streaming generation over one pooled keep-alive ``requests.Session`` with explicit timeouts and
+urllib3 retry/backoff on 429/5xx, plus a TTL cache of the resolved model per
+API key so ``models.list`` is not called before every generation.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from terminal import metrics
+
+API_ROOT = os.environ.get("GEMINI_API_ROOT", "https://generativelanguage.googleapis.com/v1beta")
+PREFERRED_MODELS = ["gemini-1.5-flash", "gemini-1.0-pro", "gemini-pro"]
+
+
+class LLMError(Exception):
+    pass
+
+
+def _key_id(api_key):
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _chunk_text(data):
+    candidates = data.get('candidates') or [{}]
+    return "".join(p.get('text', '') for p in candidates[0].get('content', {}).get('parts', []))
+
+
+def extract_text(data):
+    if 'candidates' not in data: raise LLMError(data.get('error', {}).get('message', 'Unknown'))
+    try: return "".join(p.get('text', '') for p in data['candidates'][0]['content']['parts'])
+    except (KeyError, IndexError): raise LLMError(data['candidates'][0].get('finishReason', 'Empty response'))
+
+
+class GeminiClient:
+    def __init__(self, base_url=API_ROOT, timeout=(5, 120), retries=3, backoff=0.5, model_ttl=3600, pool_size=8):
+        self.base_url, self.timeout, self.model_ttl = base_url.rstrip("/"), timeout, model_ttl
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET", "POST"}), respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._models, self._resolving = {}, {}
+        self._lock = threading.Lock()
+
+    def _request(self, method, path, api_key, **kwargs):
+        headers = {"x-goog-api-key": api_key.strip(), **kwargs.pop("headers", {})}
+        return self.session.request(method, f"{self.base_url}/{path}", headers=headers, timeout=kwargs.pop("timeout", self.timeout), **kwargs)
+
+    def resolve_model(self, api_key):
+        """``(model, "OK")`` or ``(None, reason)``; successful lookups are cached per key for ``model_ttl`` seconds."""
+        key = _key_id(api_key)
+        with self._lock:
+            cached = self._models.get(key)
+            key_lock = self._resolving.setdefault(key, threading.Lock())
+        metrics.cache("llm.model", bool(cached and time.time() - cached[1] < self.model_ttl))
+        if cached and time.time() - cached[1] < self.model_ttl: return cached[0], "OK"
+        with key_lock:  # concurrent misses for the same key share one models.list call
+            with self._lock: cached = self._models.get(key)
+            if cached and time.time() - cached[1] < self.model_ttl: return cached[0], "OK"
+            return self._fetch_model(api_key, key)
+
+    def _fetch_model(self, api_key, key):
+        try:
+            data = self._request("GET", "models", api_key).json()
+            if 'error' in data: return None, data['error']['message']
+            valid_models = [m['name'].replace("models/", "") for m in data.get('models', []) if 'generateContent' in m.get('supportedGenerationMethods', [])]
+            model = next((p for p in PREFERRED_MODELS if p in valid_models), valid_models[0] if valid_models else None)
+            if not model: return None, "No valid models"
+        except Exception as e: return None, str(e)
+        with self._lock: self._models[key] = (model, time.time())
+        return model, "OK"
+
+    def forget_model(self, api_key):
+        with self._lock: self._models.pop(_key_id(api_key), None)
+
+    def payload(self, prompt, generation_config=None, safety_settings=None):
+        body = {"contents": [{"parts": [{"text": prompt}]}]}
+        if safety_settings: body["safetySettings"] = safety_settings
+        if generation_config: body["generationConfig"] = generation_config
+        return body
+
+    @metrics.timed("llm.generate")
+    def generate(self, api_key, prompt, generation_config=None, safety_settings=None):
+        """Blocking ``generateContent`` call; raises LLMError with the API's message on failure."""
+        model, status = self.resolve_model(api_key)
+        if not model: raise LLMError(status)
+        r = self._request("POST", f"models/{model}:generateContent", api_key, json=self.payload(prompt, generation_config, safety_settings))
+        if r.status_code == 404: self.forget_model(api_key)
+        return extract_text(r.json())
+
+    @metrics.timed("llm.stream")
+    def stream(self, api_key, prompt, generation_config=None, safety_settings=None):
+        """Yield text chunks from ``streamGenerateContent`` (SSE) as they arrive."""
+        model, status = self.resolve_model(api_key)
+        if not model: raise LLMError(status)
+        body = self.payload(prompt, generation_config, safety_settings)
+        with self._request("POST", f"models/{model}:streamGenerateContent", api_key, params={"alt": "sse"}, json=body, stream=True) as r:
+            if r.status_code != 200:
+                if r.status_code == 404: self.forget_model(api_key)
+                try: message = r.json().get('error', {}).get('message', r.reason)
+                except ValueError: message = r.reason
+                raise LLMError(message)
+            r.encoding = "utf-8"
+            for line in r.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"): continue
+                data = json.loads(line[5:])
+                if 'error' in data: raise LLMError(data['error'].get('message', 'Unknown'))
+                text = _chunk_text(data)
+                if text: yield text
@@ -0,0 +1,90 @@
+"""Persistent, content-addressed cache for LLM responses.
+
+Keys are SHA-256 digests of a canonical JSON document (model, kind and the
+normalised inputs), so the same news set or question maps to the same entry
+regardless of pubdates, ordering or syndicated duplicates. Entries live in
+SQLite, expire by age and are evicted least-recently-used once the store
+grows past ``max_bytes``.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+
+from terminal import open_db
+from terminal.headlines import normalize
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    model TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed);
+"""
+
+
+def news_fingerprint(data_dump):
+    """Sorted, de-duplicated normalised titles from a ``- title (pubdate)`` news dump."""
+    titles = set()
+    for line in data_dump.splitlines():
+        title = normalize(re.sub(r"\s*\([^()]*\)\s*$", "", line.strip().lstrip("-").strip()))
+        if title: titles.add(title)
+    return sorted(titles)
+
+
+def cache_key(model, kind, **inputs):
+    doc = json.dumps({"model": model, "kind": kind, **inputs}, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(doc.encode()).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path=None, max_age=6 * 3600, max_bytes=64 * 1024 * 1024):
+        self.path, self._db = open_db(path, "llm_cache.db", _SCHEMA)
+        self.max_age, self.max_bytes = max_age, max_bytes
+        self.hits = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, max_age=None):
+        max_age = self.max_age if max_age is None else max_age
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute("SELECT text, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] <= max_age:
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key, text, kind, model=""):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO responses (key, kind, model, created, accessed, size, text) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (key, kind, model, now, now, len(text.encode()), text))
+        self.evict()
+
+    def evict(self):
+        """Drop expired entries, then least-recently-used ones until under ``max_bytes``."""
+        with self._lock, self._db:
+            removed = self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.max_age,)).rowcount
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+                    if total <= self.max_bytes: break
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    total -= size
+                    removed += 1
+            self.evictions += removed
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = self.hits + self.misses
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0, "evictions": self.evictions}
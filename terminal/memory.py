@@ -0,0 +1,159 @@
+"""Bounded, compacting conversation memory for the Assistant.
+
+Every turn is appended to SQLite, but only the last ``keep_turns`` stay
+verbatim in the prompt; older turns are folded into a running extractive
+summary, and both parts share a fixed token budget, so a follow-up question
+carries the thread without the context growing over a long desk session.
+The view reads a recent window from an in-memory tail and pages older turns
+from disk, and a reload reopens the session by id without replaying it.
+"""
+import collections
+import re
+import threading
+import time
+import uuid
+from typing import NamedTuple
+
+from terminal import open_db
+from terminal.retrieval import estimate_tokens
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    session TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (session, seq)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    summarized INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+_MARKDOWN = re.compile(r"[*_`]+|^[#>\s]+", re.M)
+ROLES = {"user": "User", "assistant": "Assistant"}
+
+
+class Turn(NamedTuple):
+    seq: int
+    role: str
+    content: str
+    created: float
+
+
+def gist(text, max_chars=240):
+    """Leading sentences of ``text`` with markdown stripped, cut to ``max_chars``."""
+    flat = " ".join(_MARKDOWN.sub("", text).split())
+    out = ""
+    for sentence in _SENTENCE.split(flat):
+        if out and len(out) + len(sentence) >= max_chars: break
+        out = f"{out} {sentence}".strip()
+    return out if len(out) <= max_chars else out[:max_chars - 1].rstrip() + "…"
+
+
+def fold(summary, turns, budget):
+    """``summary`` plus one gist line per turn, dropping the oldest lines to stay under ``budget`` tokens."""
+    lines = summary.splitlines() + [f"{ROLES.get(t.role, t.role)}: {gist(t.content)}" for t in turns]
+    while lines and estimate_tokens("\n".join(lines)) > budget: lines.pop(0)
+    return "\n".join(lines)
+
+
+class MemoryStore:
+    def __init__(self, path=None):
+        self.path, self._db = open_db(path, "memory.db", _SCHEMA)
+        self._lock = threading.Lock()
+
+    def state(self, session):
+        """``(summary, first_unsummarized_seq, turn_count)`` for ``session``; empty for a new one."""
+        with self._lock:
+            row = self._db.execute("SELECT summary, summarized FROM sessions WHERE session = ?", (session,)).fetchone()
+            count = self._db.execute("SELECT COALESCE(MAX(seq) + 1, 0) FROM turns WHERE session = ?", (session,)).fetchone()[0]
+        return (*(row or ("", 0)), count)
+
+    def append(self, session, turn):
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO turns (session, seq, role, content, created) VALUES (?, ?, ?, ?, ?)", (session, *turn))
+            self._db.execute("INSERT INTO sessions (session, summary, summarized, updated) VALUES (?, '', 0, ?) "
+                             "ON CONFLICT(session) DO UPDATE SET updated = excluded.updated", (session, turn.created))
+
+    def save_summary(self, session, summary, summarized):
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO sessions (session, summary, summarized, updated) VALUES (?, ?, ?, ?)",
+                             (session, summary, summarized, time.time()))
+
+    def turns(self, session, limit, before=None):
+        """Up to ``limit`` turns of ``session`` preceding seq ``before``, oldest first."""
+        with self._lock:
+            rows = self._db.execute("SELECT seq, role, content, created FROM turns WHERE session = ? AND seq < ? ORDER BY seq DESC LIMIT ?",
+                                    (session, before if before is not None else 2 ** 62, limit)).fetchall()
+        return [Turn(*row) for row in reversed(rows)]
+
+    def prune(self, max_age_days=30):
+        """Drop sessions untouched for ``max_age_days``."""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock, self._db:
+            stale = [r[0] for r in self._db.execute("SELECT session FROM sessions WHERE updated < ?", (cutoff,))]
+            self._db.executemany("DELETE FROM turns WHERE session = ?", [(s,) for s in stale])
+            self._db.executemany("DELETE FROM sessions WHERE session = ?", [(s,) for s in stale])
+        return len(stale)
+
+
+class ConversationMemory:
+    def __init__(self, store, session=None, keep_turns=6, token_budget=1500, summary_share=0.4, tail=64):
+        self.store, self.session = store, session or uuid.uuid4().hex[:16]
+        self.keep_turns, self.token_budget = keep_turns, token_budget
+        self.summary_budget = int(token_budget * summary_share)
+        self.summary, self.summarized, self.count = store.state(self.session)
+        self._tail = collections.deque(store.turns(self.session, max(tail, keep_turns)), maxlen=max(tail, keep_turns))
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, role, content):
+        with self._lock:
+            turn = Turn(self.count, role, content, time.time())
+            self.store.append(self.session, turn)
+            self._tail.append(turn)
+            self.count += 1
+            self._compact()
+        return turn
+
+    def verbatim(self):
+        """Turns not yet folded into the summary, oldest first."""
+        return [t for t in self._tail if t.seq >= self.summarized]
+
+    def _compact(self):
+        live = self.verbatim()
+        keep, budget = live[-self.keep_turns:], self.token_budget - self.summary_budget
+        while len(keep) > 1 and sum(estimate_tokens(t.content) for t in keep) > budget: keep = keep[1:]
+        rolled = live[:len(live) - len(keep)]
+        if not rolled: return
+        self.summary = fold(self.summary, rolled, self.summary_budget)
+        self.summarized = keep[0].seq if keep else self.count
+        self.store.save_summary(self.session, self.summary, self.summarized)
+
+    def context(self):
+        """Prompt block: the running summary, then the verbatim turns, within ``token_budget``."""
+        with self._lock: summary, turns = self.summary, self.verbatim()
+        budget = self.token_budget - estimate_tokens(summary)
+        lines = []
+        for turn in reversed(turns):
+            line = f"{ROLES.get(turn.role, turn.role)}: {turn.content}"
+            if estimate_tokens(line) > budget: line = line[:max(0, budget * 4 - 1)] + "…"
+            lines.insert(0, line)
+            budget -= estimate_tokens(line)
+            if budget <= 0: break
+        parts = ([f"Earlier in this conversation:\n{summary}"] if summary else []) + (["Recent turns:\n" + "\n\n".join(lines)] if lines else [])
+        return "\n\n".join(parts)
+
+    def recent(self, n):
+        """The last ``n`` turns, from the in-memory tail when it covers them."""
+        with self._lock:
+            if n <= len(self._tail) or len(self._tail) == self.count: return list(self._tail)[-n:]
+        return self.store.turns(self.session, n)
@@ -0,0 +1,152 @@
+"""Process-wide latency histograms, call/error counters and cache hit ratios.
+
+Every layer records into the shared ``REGISTRY``; the sidebar diagnostics
+panel reads ``snapshot()`` and the exporters render it as Prometheus text
+exposition or JSON lines.
+"""
+import bisect
+import functools
+import inspect
+import json
+import re
+import threading
+import time
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; the last slot counts values above the top bucket."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count, self.sum, self.max = 0, 0.0, 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate by linear interpolation inside the bucket holding the ``q`` rank."""
+        if not self.count: return 0.0
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = self.buckets[i - 1] if i else 0.0
+                hi = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(lo + (hi - lo) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+
+class Registry:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.started = time.time()
+        self._latency, self._calls, self._errors = {}, {}, {}
+        self._hits, self._misses = {}, {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, error=False):
+        with self._lock:
+            hist = self._latency.get(name)
+            if hist is None: hist = self._latency[name] = Histogram(self.buckets)
+            hist.observe(seconds)
+            self._calls[name] = self._calls.get(name, 0) + 1
+            if error: self._errors[name] = self._errors.get(name, 0) + 1
+
+    def fail(self, name):
+        """Count an error a caller handled itself (fallback value, warning, error text)."""
+        with self._lock: self._errors[name] = self._errors.get(name, 0) + 1
+
+    def cache(self, name, hit):
+        counter = self._hits if hit else self._misses
+        with self._lock: counter[name] = counter.get(name, 0) + 1
+
+    def timed(self, name=None):
+        """Decorator recording latency and raised errors; generators are timed until exhausted."""
+        def wrap(fn):
+            label = name or fn.__name__
+            if inspect.isgeneratorfunction(fn):
+                @functools.wraps(fn)
+                def timed_gen(*args, **kwargs):
+                    start, error = time.perf_counter(), False
+                    try: yield from fn(*args, **kwargs)
+                    except BaseException as e:
+                        error = not isinstance(e, GeneratorExit)
+                        raise
+                    finally: self.observe(label, time.perf_counter() - start, error)
+                return timed_gen
+
+            @functools.wraps(fn)
+            def timed_fn(*args, **kwargs):
+                start = time.perf_counter()
+                try: result = fn(*args, **kwargs)
+                except Exception:
+                    self.observe(label, time.perf_counter() - start, True)
+                    raise
+                self.observe(label, time.perf_counter() - start)
+                return result
+            return timed_fn
+        return wrap
+
+    def snapshot(self):
+        """One row per metric name: calls, errors, latency summary and cache hit ratio."""
+        with self._lock:
+            names = sorted(set(self._latency) | set(self._errors) | set(self._hits) | set(self._misses))
+            rows = []
+            for name in names:
+                hist = self._latency.get(name)
+                hits, misses = self._hits.get(name, 0), self._misses.get(name, 0)
+                rows.append({
+                    "name": name, "calls": self._calls.get(name, 0), "errors": self._errors.get(name, 0),
+                    "mean_s": hist.sum / hist.count if hist and hist.count else None,
+                    "p50_s": hist.quantile(0.5) if hist else None, "p95_s": hist.quantile(0.95) if hist else None,
+                    "max_s": hist.max if hist else None,
+                    "cache_hits": hits, "cache_misses": misses,
+                    "hit_ratio": hits / (hits + misses) if hits + misses else None,
+                })
+            return rows
+
+    def prometheus(self, prefix="terminal"):
+        """Prometheus text exposition (version 0.0.4)."""
+        out = [f"# HELP {prefix}_latency_seconds Call latency.", f"# TYPE {prefix}_latency_seconds histogram"]
+        with self._lock:
+            for name, hist in sorted(self._latency.items()):
+                label, cumulative = _label(name), 0
+                for bound, n in zip(self.buckets + (float("inf"),), hist.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    out.append(f'{prefix}_latency_seconds_bucket{{fn="{label}",le="{le}"}} {cumulative}')
+                out.append(f'{prefix}_latency_seconds_sum{{fn="{label}"}} {hist.sum!r}')
+                out.append(f'{prefix}_latency_seconds_count{{fn="{label}"}} {hist.count}')
+            for metric, help_text, counter in (("errors", "Failed calls.", self._errors),
+                                               ("cache_hits", "Cache lookups served from cache.", self._hits),
+                                               ("cache_misses", "Cache lookups that went upstream.", self._misses)):
+                out += [f"# HELP {prefix}_{metric}_total {help_text}", f"# TYPE {prefix}_{metric}_total counter"]
+                out += [f'{prefix}_{metric}_total{{fn="{_label(name)}"}} {n}' for name, n in sorted(counter.items())]
+        out += [f"# HELP {prefix}_start_time_seconds Registry creation time.", f"# TYPE {prefix}_start_time_seconds gauge",
+                f"{prefix}_start_time_seconds {self.started!r}"]
+        return "\n".join(out) + "\n"
+
+    def jsonl(self):
+        """One JSON object per metric, stamped with the export time."""
+        now = time.time()
+        return "".join(json.dumps({"ts": now, **row}) + "\n" for row in self.snapshot())
+
+    def reset(self):
+        with self._lock:
+            for table in (self._latency, self._calls, self._errors, self._hits, self._misses): table.clear()
+            self.started = time.time()
+
+
+def _label(name):
+    return re.sub(r'["\\\n]', "_", name)
+
+
+REGISTRY = Registry()
+observe, fail, cache, timed = REGISTRY.observe, REGISTRY.fail, REGISTRY.cache, REGISTRY.timed
+snapshot, prometheus, jsonl = REGISTRY.snapshot, REGISTRY.prometheus, REGISTRY.jsonl
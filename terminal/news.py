@@ -0,0 +1,107 @@
+"""Google News RSS ingestion.
+
+Feeds are fetched over one pooled session, revalidated with ETag /
+If-Modified-Since so an unchanged feed costs a 304, and parsed with an
+incremental ``lxml`` parser that stops building items after ``max_items``
+entries. A feed is only a few KB, so the body is read whole and the
+connection goes back to the pool; the briefing pipeline fetches its queries
+concurrently over that pool.
+"""
+import email.utils
+import io
+import threading
+import time
+from typing import NamedTuple
+
+from terminal import metrics
+
+FEED_URL = "https://news.google.com/rss/search"
+USER_AGENT = "Mozilla/5.0 (compatible; Terminal/1.0)"
+
+
+class NewsItem(NamedTuple):
+    title: str
+    link: str
+    source: str
+    published: str
+    timestamp: float
+    query: str
+
+
+class _Entry(NamedTuple):
+    items: tuple
+    etag: str
+    last_modified: str
+    checked: float
+
+
+def _timestamp(pubdate):
+    try: return email.utils.parsedate_to_datetime(pubdate).timestamp()
+    except (TypeError, ValueError): return 0.0
+
+
+@metrics.timed("news.parse")
+def parse_items(stream, query="", max_items=20):
+    """Stream-parse RSS ``<item>`` elements from a file-like object."""
+    from lxml import etree
+    items = []
+    for _, el in etree.iterparse(stream, events=("end",), tag="item", recover=True, resolve_entities=False, no_network=True):
+        pubdate = el.findtext("pubDate") or ""
+        items.append(NewsItem(
+            title=(el.findtext("title") or "No Title").strip(),
+            link=(el.findtext("link") or "").strip(),
+            source=(el.findtext("source") or "").strip(),
+            published=pubdate,
+            timestamp=_timestamp(pubdate),
+            query=query,
+        ))
+        el.clear()
+        if len(items) >= max_items: break
+    return tuple(items)
+
+
+class NewsFeed:
+    def __init__(self, min_age=60, timeout=5, pool_size=8):
+        self.min_age, self.timeout = min_age, timeout
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, query, max_items=20, window="1d"):
+        """Latest items for ``query``, revalidating the cached copy at most every ``min_age`` seconds."""
+        key = (query, max_items, window)
+        with self._lock: entry = self._entries.get(key)
+        if entry and time.time() - entry.checked < self.min_age:
+            metrics.cache("news.feed", True)
+            return entry.items
+
+        headers = {}
+        if entry and entry.etag: headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified: headers["If-Modified-Since"] = entry.last_modified
+        params = {"q": f"{query} when:{window}", "hl": "en-US", "gl": "US", "ceid": "US:en"}
+        try:
+            r = self.session.get(FEED_URL, params=params, headers=headers, timeout=self.timeout)
+            metrics.cache("news.feed", r.status_code == 304 and entry is not None)
+            if r.status_code == 304 and entry:
+                items = entry.items
+            else:
+                r.raise_for_status()
+                items = parse_items(io.BytesIO(r.content), query, max_items)
+            etag, modified = r.headers.get("ETag", ""), r.headers.get("Last-Modified", "")
+        except Exception:
+            if entry: return entry.items
+            raise
+        with self._lock: self._entries[key] = _Entry(items, etag, modified, time.time())
+        return items
+
+
+def format_items(items):
+    """Prompt-ready bullet list, one ``- title (pubdate)`` line per item."""
+    lines = [f"- {item.title} ({item.published})" for item in items]
+    return "\n".join(lines) + "\n" if lines else "No recent news found."
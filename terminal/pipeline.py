@@ -0,0 +1,50 @@
+"""Tiny dependency-graph runner with bounded concurrency.
+
+Nodes run on a thread pool as soon as all of their dependencies have
+finished; a node whose dependency failed is skipped. ``run`` is a generator
+of ``(name, status, value)`` events so the caller (the Streamlit script
+thread) can update progress widgets while workers stay free of ``st`` calls.
+"""
+import concurrent.futures as cf
+
+PENDING, RUNNING, DONE, FAILED, SKIPPED = "pending", "running", "done", "failed", "skipped"
+
+
+class Pipeline:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._nodes = {}
+
+    def add(self, name, fn, deps=()):
+        """Register ``fn(*dep_results)`` to run after every node in ``deps``."""
+        missing = [d for d in deps if d not in self._nodes]
+        if missing: raise ValueError(f"{name} depends on unknown nodes {missing}")
+        self._nodes[name] = (fn, tuple(deps))
+        return self
+
+    def run(self):
+        status = {name: PENDING for name in self._nodes}
+        results = {}
+        with cf.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline") as pool:
+            running = {}
+            while True:
+                for name, (fn, deps) in self._nodes.items():
+                    if status[name] != PENDING: continue
+                    if any(status[d] in (FAILED, SKIPPED) for d in deps):
+                        status[name] = SKIPPED
+                        yield name, SKIPPED, None
+                    elif all(status[d] == DONE for d in deps):
+                        status[name] = RUNNING
+                        running[pool.submit(fn, *(results[d] for d in deps))] = name
+                        yield name, RUNNING, None
+                if not running: break
+                done, _ = cf.wait(running, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        status[name] = DONE
+                        yield name, DONE, results[name]
+                    except Exception as e:
+                        status[name] = FAILED
+                        yield name, FAILED, e
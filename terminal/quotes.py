@@ -0,0 +1,92 @@
+"""Batched quote engine for the ticker grid.
+
+One ``yf.download`` call covers every requested symbol; anything that comes
+back empty is retried per-symbol in a bounded thread pool with a deadline, so
+a single slow ticker only costs its own row instead of stalling the grid.
+"""
+import concurrent.futures as cf
+
+MARKET_MAP = {
+    "Standard": {"BTC": "BTC-USD", "EUR": "EURUSD=X", "USD": "DX-Y.NYB", "GOLD": "GC=F", "OIL": "CL=F", "SPX": "^GSPC"},
+    "Crypto": {"BTC": "BTC-USD", "ETH": "ETH-USD", "SOL": "SOL-USD", "XRP": "XRP-USD", "DOGE": "DOGE-USD", "ADA": "ADA-USD"},
+    "Forex": {"EUR": "EURUSD=X", "GBP": "GBPUSD=X", "JPY": "JPY=X", "CHF": "CHF=X", "CAD": "CAD=X", "AUD": "AUDUSD=X"},
+    "Tech Stocks": {"NVDA": "NVDA", "TSLA": "TSLA", "AAPL": "AAPL", "MSFT": "MSFT", "GOOG": "GOOG", "AMZN": "AMZN"},
+    "Indices": {"S&P 500": "^GSPC", "NASDAQ": "^IXIC", "DOW": "^DJI", "VIX": "^VIX", "FTSE": "^FTSE", "DAX": "^GDAXI"}
+}
+
+COLUMNS = ["price", "change", "ok"]
+
+
+def universe(market_map=MARKET_MAP):
+    """Sorted, de-duplicated yfinance symbols across every asset class."""
+    return tuple(sorted({s for tickers in market_map.values() for s in tickers.values() if s}))
+
+
+def _summarise(hist):
+    if hist is None or hist.empty: return None
+    hist = hist.dropna(subset=["Close"])
+    if hist.empty: return None
+    latest = float(hist['Close'].iloc[-1])
+    open_p = float(hist['Open'].iloc[0]) if len(hist) > 1 else latest
+    change = ((latest - open_p) / open_p) * 100 if open_p else 0.0
+    return latest, change
+
+
+def _batch_history(symbols, timeout):
+    import yfinance as yf
+    frame = yf.download(list(symbols), period="1d", interval="1m", group_by="ticker",
+                        threads=True, progress=False, timeout=timeout, multi_level_index=True)
+    found = {}
+    if frame is None or frame.empty: return found
+    for symbol in symbols:
+        if symbol not in frame.columns.get_level_values(0): continue
+        summary = _summarise(frame[symbol])
+        if summary: found[symbol] = summary
+    return found
+
+
+def _single_history(symbol, timeout):
+    import yfinance as yf
+    ticker = yf.Ticker(symbol)
+    hist = ticker.history(period="1d", interval="1m", timeout=timeout)
+    if hist.empty: hist = ticker.history(period="2d", timeout=timeout)
+    return _summarise(hist)
+
+
+def fetch_quotes(symbols, timeout=8.0, max_workers=8):
+    """Columnar snapshot indexed by symbol with ``price``, ``change`` (%) and ``ok``.
+
+    Symbols that fail or miss the deadline are returned with ``ok=False`` and
+    zeroed values rather than raising.
+    """
+    symbols = tuple(dict.fromkeys(s for s in symbols if s))
+    found = {}
+    try: found.update(_batch_history(symbols, timeout))
+    except Exception: pass
+
+    missing = [s for s in symbols if s not in found]
+    if missing:
+        pool = cf.ThreadPoolExecutor(max_workers=min(max_workers, len(missing)))
+        futures = {pool.submit(_single_history, s, timeout): s for s in missing}
+        done, _ = cf.wait(futures, timeout=timeout)
+        for future in done:
+            try: summary = future.result()
+            except Exception: summary = None
+            if summary: found[futures[future]] = summary
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    import pandas as pd
+    rows = [(*found[s], True) if s in found else (0.0, 0.0, False) for s in symbols]
+    return pd.DataFrame(rows, index=pd.Index(symbols, name="symbol"), columns=COLUMNS)
+
+
+def select(snapshot, tickers_dict):
+    """Re-key a symbol snapshot by display name for one asset class."""
+    import pandas as pd
+    names = [n for n, s in tickers_dict.items() if s]
+    frame = snapshot.reindex([tickers_dict[n] for n in names])
+    frame[["price", "change"]] = frame[["price", "change"]].fillna(0.0)
+    frame["ok"] = frame["ok"].fillna(False).astype(bool)
+    frame.insert(0, "symbol", frame.index)
+    frame.index = pd.Index(names, name="name")
+    return frame
@@ -0,0 +1,92 @@
+"""Process-wide stale-while-revalidate refresher.
+
+Each registered job is re-run on its own interval by a background thread and
+its latest result is kept in memory. Readers never trigger a fetch: they get
+the last good value plus flags saying whether it is stale or the last attempt
+failed.
+"""
+import concurrent.futures as cf
+import threading
+import time
+from typing import Any, NamedTuple
+
+
+class Snapshot(NamedTuple):
+    value: Any
+    updated_at: float
+    stale: bool
+    error: str
+
+    @property
+    def age(self):
+        return time.time() - self.updated_at if self.updated_at else float("inf")
+
+
+class _Job:
+    def __init__(self, name, fn, interval, default):
+        self.name, self.fn, self.interval = name, fn, interval
+        self.value, self.updated_at, self.error = default, 0.0, ""
+        self.running, self.next_due = False, 0.0
+        self.loaded = threading.Event()
+
+
+class Refresher:
+    def __init__(self, max_workers=4, tick=1.0):
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._pool = cf.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresher")
+        self._tick = tick
+        self._stop = threading.Event()
+        self._thread = None
+
+    def register(self, name, fn, interval, default=None):
+        with self._lock: self._jobs[name] = _Job(name, fn, interval, default)
+        return self
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def refresh(self, name):
+        """Schedule ``name`` to run on the next tick, ahead of its interval."""
+        with self._lock: self._jobs[name].next_due = 0.0
+
+    def run(self, name):
+        """Run ``name`` now on the calling thread and return its snapshot (one-shot tools that never start the loop)."""
+        job = self._jobs[name]
+        with self._lock: job.running = True
+        self._run(job)
+        return self.get(name)
+
+    def get(self, name, wait=0.0):
+        """Latest snapshot for ``name``; blocks up to ``wait`` seconds only if it has never loaded."""
+        job = self._jobs[name]
+        if wait and self._thread and not job.loaded.is_set(): job.loaded.wait(wait)
+        with self._lock:
+            stale = job.running or bool(job.error) or not job.updated_at or time.time() - job.updated_at > job.interval
+            return Snapshot(job.value, job.updated_at, stale, job.error)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            now = time.time()
+            with self._lock:
+                due = [j for j in self._jobs.values() if not j.running and now >= j.next_due]
+                for job in due: job.running = True
+            for job in due: self._pool.submit(self._run, job)
+            self._stop.wait(self._tick)
+
+    def _run(self, job):
+        try:
+            value = job.fn()
+            with self._lock: job.value, job.updated_at, job.error = value, time.time(), ""
+        except Exception as e:
+            with self._lock: job.error = str(e) or type(e).__name__
+        finally:
+            with self._lock: job.running, job.next_due = False, time.time() + job.interval
+            job.loaded.set()
@@ -0,0 +1,102 @@
+"""Persistent briefing store and the pre-generation schedule.
+
+Every generated briefing is kept in SQLite with its timestamp, model and the
+news items it was built from, so views can show the latest one instantly
+and a restarted server keeps its reports. ``BriefingSchedule`` decides when
+the next pre-generation is due: on a fixed cadence plus shortly before the
+London and New York opens.
+"""
+import datetime
+import json
+import threading
+import time
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from terminal import open_db
+from terminal.news import NewsItem
+
+MARKET_OPENS = (("Europe/London", "08:00"), ("America/New_York", "09:30"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    created REAL NOT NULL,
+    model TEXT,
+    source TEXT,
+    text TEXT NOT NULL,
+    items TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_mode_created ON reports(mode, created);
+"""
+
+
+class Report(NamedTuple):
+    mode: str
+    created: float
+    model: str
+    source: str
+    text: str
+    items: tuple
+
+
+class ReportStore:
+    def __init__(self, path=None):
+        self.path, self._db = open_db(path, "reports.db", _SCHEMA)
+        self._lock = threading.Lock()
+
+    def save(self, mode, text, items=(), model="", source="manual", created=None):
+        created = created or time.time()
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO reports (mode, created, model, source, text, items) VALUES (?, ?, ?, ?, ?, ?)",
+                             (mode, created, model, source, text, json.dumps([list(i) for i in items])))
+        return created
+
+    def latest(self, mode):
+        with self._lock:
+            row = self._db.execute("SELECT mode, created, model, source, text, items FROM reports WHERE mode = ? ORDER BY created DESC LIMIT 1", (mode,)).fetchone()
+        return self._report(row) if row else None
+
+    def latest_times(self):
+        """``{mode: created}`` of the newest report per mode."""
+        with self._lock: return dict(self._db.execute("SELECT mode, MAX(created) FROM reports GROUP BY mode").fetchall())
+
+    def history(self, mode, limit=10):
+        with self._lock:
+            rows = self._db.execute("SELECT mode, created, model, source, text, items FROM reports WHERE mode = ? ORDER BY created DESC LIMIT ?", (mode, limit)).fetchall()
+        return [self._report(r) for r in rows]
+
+    def prune(self, keep=50):
+        """Keep only the newest ``keep`` reports per mode."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM reports WHERE id NOT IN (SELECT id FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY mode ORDER BY created DESC) AS n FROM reports) WHERE n <= ?)", (keep,))
+
+    @staticmethod
+    def _report(row):
+        mode, created, model, source, text, items = row
+        return Report(mode, created, model or "", source or "", text, tuple(NewsItem(*i) for i in json.loads(items)))
+
+
+class BriefingSchedule:
+    """Slots every ``every`` seconds plus ``lead`` seconds before each market open."""
+
+    def __init__(self, every=1800, opens=MARKET_OPENS, lead=900):
+        self.every, self.lead = every, lead
+        self.opens = [(ZoneInfo(tz), datetime.time.fromisoformat(at)) for tz, at in opens]
+
+    def last_slot(self, now=None):
+        now = now or time.time()
+        slots = [now - now % self.every] if self.every else []
+        for tz, at in self.opens:
+            local = datetime.datetime.fromtimestamp(now, tz)
+            for days in (0, 1):
+                day = local.date() - datetime.timedelta(days=days)
+                slot = datetime.datetime.combine(day, at, tz).timestamp() - self.lead
+                if slot <= now:
+                    slots.append(slot)
+                    break
+        return max(slots) if slots else 0.0
+
+    def due(self, last_run, now=None):
+        return last_run < self.last_slot(now)
@@ -0,0 +1,89 @@
+"""Section-level BM25 retrieval over generated reports for the Assistant.
+
+Reports are split on their ``###`` headings, indexed with Okapi BM25 and the
+best sections for a question are packed into a token budget, so chat
+prompts carry only the relevant parts of each report.
+"""
+import collections
+import functools
+import math
+import re
+from typing import NamedTuple
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[./][a-z0-9]+)?")
+_STOP = frozenset("a an and are as at be but by for from has have in is it its of on or that the this to was were will with what which who how why when where does do about any there their".split())
+
+
+class Section(NamedTuple):
+    report: str
+    heading: str
+    text: str
+    position: int
+
+
+def tokenize(text):
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOP]
+
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+
+def split_sections(report, text):
+    """Split a report into its ``###`` sections; any preamble becomes its own section."""
+    sections, heading, lines = [], "", []
+    for line in text.splitlines():
+        if line.startswith("###"):
+            if "".join(lines).strip(): sections.append(Section(report, heading, "\n".join(lines).strip(), len(sections)))
+            heading, lines = line.lstrip("#").strip(), [line]
+        else: lines.append(line)
+    if "".join(lines).strip(): sections.append(Section(report, heading, "\n".join(lines).strip(), len(sections)))
+    return sections
+
+
+class BM25Index:
+    def __init__(self, sections, k1=1.5, b=0.75):
+        self.sections, self.k1, self.b = list(sections), k1, b
+        self._tf = [collections.Counter(tokenize(f"{s.report} {s.heading} {s.text}")) for s in self.sections]
+        self._len = [sum(tf.values()) for tf in self._tf]
+        self._avg = (sum(self._len) / len(self._len)) if self._len else 0.0
+        df = collections.Counter(t for tf in self._tf for t in tf)
+        n = len(self.sections)
+        self._idf = {t: math.log(1 + (n - f + 0.5) / (f + 0.5)) for t, f in df.items()}
+
+    def scores(self, query):
+        terms = set(tokenize(query))
+        out = []
+        for tf, length in zip(self._tf, self._len):
+            norm = self.k1 * (1 - self.b + self.b * length / self._avg) if self._avg else self.k1
+            out.append(sum(self._idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm) for t in terms if t in tf))
+        return out
+
+    def search(self, query, k=4):
+        ranked = sorted(zip(self.scores(query), range(len(self.sections))), key=lambda p: (-p[0], p[1]))
+        return [(score, self.sections[i]) for score, i in ranked[:k]]
+
+
+@functools.lru_cache(maxsize=16)
+def _index(reports):
+    return BM25Index(s for name, text in reports for s in split_sections(name, text))
+
+
+def select_sections(reports, question, k=4, token_budget=2000):
+    """Top-``k`` sections for ``question`` that fit ``token_budget``.
+
+    ``reports`` maps a report label to its text. When nothing matches, the
+    opening sections of each report are used instead so generic questions
+    ("summarise everything") still get context.
+    """
+    index = _index(tuple(reports.items()))
+    ranked = [s for score, s in index.search(question, len(index.sections)) if score > 0]
+    if not ranked: ranked = sorted(index.sections, key=lambda s: (s.position, s.report))
+    chosen, used = [], 0
+    for section in ranked:
+        cost = estimate_tokens(section.text)
+        if used + cost > token_budget: continue
+        chosen.append(section)
+        used += cost
+        if len(chosen) >= k: break
+    return chosen
@@ -0,0 +1,25 @@
+"""Fear & greed feeds: alternative.me for crypto, VIX for macro.
+
+These raise on failure; callers decide what a fallback value looks like.
+"""
+import requests
+
+FNG_URL = "https://api.alternative.me/fng/"
+
+
+def fetch_crypto_fng(timeout=5):
+    r = requests.get(FNG_URL, params={"limit": 1}, timeout=timeout)
+    return int(r.json()['data'][0]['value'])
+
+
+def vix_score(vix):
+    return max(0, min(100, int(100 - ((vix - 10) * 3))))
+
+
+def fetch_macro_fng():
+    import yfinance as yf
+    hist = yf.Ticker("^VIX").history(period="5d")
+    vix_now = hist['Close'].iloc[-1]
+    vix_prev = hist['Close'].iloc[-2]
+    change_pct = ((vix_now - vix_prev) / vix_prev) * 100
+    return vix_score(vix_now), round(float(vix_now), 2), round(float(change_pct), 2)
@@ -0,0 +1,178 @@
+"""Push quote feed: Yahoo's pricing websocket into per-symbol NumPy ring buffers.
+
+One background thread holds the socket, re-sends the subscription as a
+heartbeat and reconnects with backoff. Every tick lands in a fixed-size ring
+(one row per symbol) and updates last/open/change in place, so ``snapshot()``
+is an array copy rather than a download. Point ``TERMINAL_QUOTE_STREAM_URL`` at a
+local stand-in (``python bench/fakes.py quotes``) to run without Yahoo.
+"""
+import base64
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from terminal import metrics
+
+STREAM_URL = os.environ.get("TERMINAL_QUOTE_STREAM_URL", "wss://streamer.finance.yahoo.com/?version=2")
+TICK_DTYPE = np.dtype([("ts", "<f8"), ("price", "<f8"), ("volume", "<f8")])
+HEARTBEAT = 15
+
+
+def decode(message):
+    """``(symbol, price, ts, open, change_percent, day_volume)`` from one websocket frame."""
+    from yfinance.pricing_pb2 import PricingData
+    data = PricingData()
+    data.ParseFromString(base64.b64decode(json.loads(message)["message"]))
+    ts = data.time / 1000.0 if data.time else time.time()
+    return data.id, data.price, ts, data.open_price, data.change_percent, float(data.day_volume)
+
+
+def encode(symbol, price, ts, open_price=0.0, change_percent=0.0, day_volume=0):
+    """Inverse of ``decode``; used by the stand-in feed server."""
+    from yfinance.pricing_pb2 import PricingData
+    data = PricingData(id=symbol, price=price, time=int(ts * 1000), open_price=open_price,
+                       change_percent=change_percent, day_volume=int(day_volume))
+    return json.dumps({"type": "pricing", "message": base64.b64encode(data.SerializeToString()).decode()})
+
+
+class QuoteStream:
+    def __init__(self, symbols, url=None, capacity=1024, max_backoff=30.0):
+        self.symbols = list(dict.fromkeys(symbols))
+        self.url, self.capacity, self.max_backoff = url or STREAM_URL, capacity, max_backoff
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        n = len(self.symbols)
+        self._ticks = np.zeros((n, capacity), dtype=TICK_DTYPE)
+        self._head = np.zeros(n, dtype=np.int64)    # next write slot per symbol
+        self._count = np.zeros(n, dtype=np.int64)   # ticks seen, saturating at capacity in ring()
+        self._last = np.full(n, np.nan)
+        self._open = np.full(n, np.nan)
+        self._feed_change = np.full(n, np.nan)
+        self._updated = np.zeros(n)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._resubscribe = False
+        self.connected, self.messages, self.error = False, 0, None
+
+    def add_symbols(self, symbols):
+        """Grow every per-symbol array for codes not yet tracked; the socket resubscribes on its next beat."""
+        new = [s for s in dict.fromkeys(symbols) if s and s not in self._index]
+        if not new: return False
+        k = len(new)
+        with self._lock:
+            self._index.update((s, len(self.symbols) + i) for i, s in enumerate(new))
+            self.symbols = self.symbols + new
+            self._ticks = np.concatenate([self._ticks, np.zeros((k, self.capacity), dtype=TICK_DTYPE)])
+            self._head, self._count = np.append(self._head, np.zeros(k, dtype=np.int64)), np.append(self._count, np.zeros(k, dtype=np.int64))
+            self._last, self._open = np.append(self._last, np.full(k, np.nan)), np.append(self._open, np.full(k, np.nan))
+            self._feed_change, self._updated = np.append(self._feed_change, np.full(k, np.nan)), np.append(self._updated, np.zeros(k))
+            self._resubscribe = True
+        return True
+
+    # --- ingest ---
+    def push(self, symbol, price, ts=None, volume=np.nan, open_price=0.0, change_percent=np.nan):
+        i = self._index.get(symbol)
+        if i is None or not price: return False
+        ts = ts or time.time()
+        with self._lock:
+            slot = self._head[i]
+            self._ticks[i, slot] = (ts, price, volume)
+            self._head[i] = (slot + 1) % self.capacity
+            self._count[i] += 1
+            self._last[i], self._updated[i] = price, ts
+            if open_price: self._open[i] = open_price
+            elif np.isnan(self._open[i]): self._open[i] = price
+            self._feed_change[i] = change_percent
+        return True
+
+    def seed(self, snapshot):
+        """Take opens (and a last price for silent symbols) from a polled ``quotes.fetch_quotes`` frame."""
+        if snapshot is None or snapshot.empty: return
+        with self._lock:
+            for symbol, price, change, ok in zip(snapshot.index, snapshot["price"], snapshot["change"], snapshot["ok"]):
+                i = self._index.get(symbol)
+                if i is None or not ok or not price: continue
+                self._open[i] = price / (1 + change / 100)
+                if not self._updated[i]: self._last[i] = price
+
+    # --- read ---
+    def ring(self, symbol):
+        """Buffered ticks for ``symbol`` in arrival order."""
+        i = self._index[symbol]
+        with self._lock:
+            head, count, row = self._head[i], self._count[i], self._ticks[i].copy()
+        return row[:count] if count < self.capacity else np.roll(row, -head)
+
+    def quote(self, symbol, max_age=60.0):
+        """``(price, change_percent_vs_previous_close)`` from the feed, or ``None`` when stale.
+
+        The change is ``None`` if the feed did not send one.
+        """
+        i = self._index.get(symbol)
+        if i is None: return None
+        with self._lock:
+            if time.time() - self._updated[i] > max_age: return None
+            change = float(self._feed_change[i])
+            return float(self._last[i]), (None if np.isnan(change) else change)
+
+    def snapshot(self, max_age=60.0):
+        """Frame shaped like ``quotes.fetch_quotes``; ``ok`` marks symbols with a tick in the last ``max_age`` s."""
+        with self._lock:
+            symbols, last, open_, updated = self.symbols, self._last.copy(), self._open.copy(), self._updated.copy()
+        with np.errstate(divide="ignore", invalid="ignore"): change = np.where(open_ > 0, (last - open_) / open_ * 100, 0.0)
+        ok = (time.time() - updated <= max_age) & np.isfinite(last)
+        return pd.DataFrame({"price": np.nan_to_num(last), "change": np.nan_to_num(change), "ok": ok},
+                            index=pd.Index(symbols, name="symbol"))
+
+    def overlay(self, polled, max_age=60.0):
+        """``polled`` with every symbol that has a fresh tick replaced by streamed values."""
+        live = self.snapshot(max_age)
+        if polled is None: return live[live["ok"]] if live["ok"].any() else None
+        rows = live.reindex(polled.index)
+        fresh = rows["ok"].eq(True).to_numpy()
+        merged = polled.copy()
+        for column in ("price", "change"): merged[column] = np.where(fresh, rows[column].to_numpy(), polled[column].to_numpy())
+        merged["ok"] = polled["ok"].to_numpy() | fresh
+        return merged
+
+    # --- connection ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="quote-stream", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        from websockets.sync.client import connect
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                with connect(self.url, open_timeout=10, close_timeout=1) as ws:
+                    self._listen(ws)
+                backoff = 1.0
+            except Exception as e:
+                self.error = str(e) or type(e).__name__
+                metrics.fail("quote_stream")
+            self.connected = False
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _listen(self, ws):
+        ws.send(json.dumps({"subscribe": self.symbols}))
+        self.connected, self.error, beat = True, None, time.time()
+        while not self._stop.is_set():
+            if self._resubscribe or time.time() - beat >= HEARTBEAT:
+                self._resubscribe = False
+                ws.send(json.dumps({"subscribe": self.symbols}))
+                beat = time.time()
+            try: message = ws.recv(timeout=1.0)
+            except TimeoutError: continue
+            symbol, price, ts, open_price, change, volume = decode(message)
+            if self.push(symbol, price, ts, volume, open_price, change): self.messages += 1
@@ -0,0 +1,109 @@
+"""One symbol registry for the grid, charts and watchlists.
+
+Each instrument is a compact ``Symbol`` record (yfinance code, display name,
+TradingView code, icon, quick-switch label) indexed by yfinance code,
+TradingView code and display name, so every lookup is a single dict hit.
+Unknown codes typed into a watchlist are registered on first use with
+derived defaults.
+"""
+import re
+import threading
+from typing import NamedTuple
+
+from terminal.quotes import MARKET_MAP
+
+
+class Symbol(NamedTuple):
+    yf: str
+    name: str
+    tv: str
+    icon: str
+    label: str
+
+
+# yfinance, display name, TradingView, quick-switch label ("" keeps it out of the Charts menu)
+SYMBOLS = (
+    ("BTC-USD", "BTC", "COINBASE:BTCUSD", "Bitcoin (BTC/USD)"),
+    ("ETH-USD", "ETH", "COINBASE:ETHUSD", "Ethereum (ETH/USD)"),
+    ("XRP-USD", "XRP", "COINBASE:XRPUSD", "Ripple (XRP/USD)"),
+    ("SOL-USD", "SOL", "COINBASE:SOLUSD", ""),
+    ("DOGE-USD", "DOGE", "COINBASE:DOGEUSD", ""),
+    ("ADA-USD", "ADA", "COINBASE:ADAUSD", ""),
+    ("GC=F", "GOLD", "OANDA:XAUUSD", "Gold (XAU/USD)"),
+    ("CL=F", "OIL", "TVC:USOIL", "Crude Oil (WTI)"),
+    ("DX-Y.NYB", "DXY", "TVC:DXY", "Dollar Index (DXY)"),
+    ("EURUSD=X", "EUR", "FX:EURUSD", "EUR / USD"),
+    ("GBPUSD=X", "GBP", "FX:GBPUSD", "GBP / USD"),
+    ("JPY=X", "JPY", "FX:USDJPY", "USD / JPY"),
+    ("CHF=X", "CHF", "FX:USDCHF", "USD / CHF"),
+    ("AUDUSD=X", "AUD", "FX:AUDUSD", "AUD / USD"),
+    ("CAD=X", "CAD", "FX:USDCAD", "USD / CAD"),
+    ("NZDUSD=X", "NZD", "FX:NZDUSD", "NZD / USD"),
+    ("NVDA", "NVDA", "NASDAQ:NVDA", ""),
+    ("TSLA", "TSLA", "NASDAQ:TSLA", ""),
+    ("AAPL", "AAPL", "NASDAQ:AAPL", ""),
+    ("MSFT", "MSFT", "NASDAQ:MSFT", ""),
+    ("GOOG", "GOOG", "NASDAQ:GOOG", ""),
+    ("AMZN", "AMZN", "NASDAQ:AMZN", ""),
+    ("^GSPC", "SPX", "OANDA:SPX500USD", ""),
+    ("^IXIC", "NDX", "OANDA:NAS100USD", ""),
+    ("^DJI", "DOW", "TVC:DJI", ""),
+    ("^VIX", "VIX", "TVC:VIX", ""),
+    ("^FTSE", "FTSE", "TVC:UKX", ""),
+    ("^GDAXI", "DAX", "XETR:DAX", ""),
+)
+
+ICONS = (("BTC", "₿"), ("ETH", "Ξ"), ("EUR", "💶"), ("GBP", "💷"), ("USD", "💵"), ("DXY", "💵"), ("JPY", "¥"),
+         ("GOLD", "⚱️"), ("OIL", "🛢️"), ("NVDA", "🤖"), ("AAPL", "🍎"))
+
+
+def icon_for(name):
+    upper = name.upper()
+    return next((icon for needle, icon in ICONS if needle in upper), "📈")
+
+
+def default_name(code):
+    """Display name for an unregistered yfinance code: ``^N225`` -> ``N225``, ``SI=F`` -> ``SI``."""
+    return re.sub(r"(=X|=F)$", "", code.lstrip("^"))
+
+
+class Registry:
+    def __init__(self, records=SYMBOLS, aliases=MARKET_MAP):
+        self._by_yf, self._by_tv, self._by_name = {}, {}, {}
+        self._lock = threading.Lock()
+        for yf, name, tv, label in records: self.add(yf, name, tv, label)
+        # Asset-class display names ("S&P 500", "USD") resolve to the same records.
+        for tickers in aliases.values():
+            for name, yf in tickers.items(): self._by_name.setdefault(name.upper(), self._by_yf[yf])
+
+    def add(self, yf, name=None, tv="", label=""):
+        name = name or default_name(yf)
+        record = Symbol(yf, name, tv, icon_for(name), label)
+        with self._lock:
+            self._by_yf[yf] = record
+            if tv: self._by_tv[tv] = record
+            self._by_name.setdefault(name.upper(), record)
+        return record
+
+    def get(self, code):
+        """Record for a yfinance code, TradingView code or display name; ``None`` if unknown."""
+        return self._by_yf.get(code) or self._by_tv.get(code) or self._by_name.get(code.upper())
+
+    def resolve(self, code):
+        """Like ``get`` but registers unknown codes as yfinance symbols."""
+        code = code.strip()
+        return self.get(code) or self.add(code.upper())
+
+    def chart_code(self, code):
+        """TradingView code for the embed, falling back to the raw yfinance code."""
+        record = self.get(code)
+        return (record.tv or record.yf) if record else code
+
+    def quick_switch(self):
+        with self._lock: return {r.label: r.tv for r in self._by_yf.values() if r.label}
+
+    def __len__(self):
+        return len(self._by_yf)
+
+
+REGISTRY = Registry()
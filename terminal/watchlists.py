@@ -0,0 +1,66 @@
+"""User watchlists: named, ordered lists of yfinance codes kept in SQLite.
+
+The union of every list is cached in memory and rebuilt only when a list is
+saved or deleted, so the quote poller and stream can ask for it every rerun.
+"""
+import json
+import re
+import threading
+import time
+
+from terminal import open_db
+
+MAX_SYMBOLS = 1000
+SYMBOL_RE = re.compile(r"^\^?[A-Z0-9][A-Z0-9.\-=]{0,19}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchlists (
+    name TEXT PRIMARY KEY,
+    symbols TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+def parse_symbols(text):
+    """Upper-cased, de-duplicated codes from comma/space/newline separated text, plus the rejected tokens."""
+    tokens = [t.upper() for t in re.split(r"[\s,;]+", text) if t]
+    valid = [t for t in dict.fromkeys(tokens) if SYMBOL_RE.match(t)]
+    return valid[:MAX_SYMBOLS], [t for t in tokens if not SYMBOL_RE.match(t)]
+
+
+class WatchlistStore:
+    def __init__(self, path=None):
+        self.path, self._db = open_db(path, "watchlists.db", _SCHEMA)
+        self._lock = threading.Lock()
+        self._lists = None
+
+    def _load(self):
+        with self._lock:
+            if self._lists is None:
+                rows = self._db.execute("SELECT name, symbols FROM watchlists ORDER BY name").fetchall()
+                self._lists = {name: tuple(json.loads(symbols)) for name, symbols in rows}
+            return self._lists
+
+    def names(self):
+        return list(self._load())
+
+    def get(self, name):
+        return self._load().get(name, ())
+
+    def symbols(self):
+        """Every symbol on any list, in first-seen order."""
+        return tuple(dict.fromkeys(s for symbols in self._load().values() for s in symbols))
+
+    def save(self, name, symbols):
+        symbols = list(dict.fromkeys(symbols))[:MAX_SYMBOLS]
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO watchlists (name, symbols, updated) VALUES (?, ?, ?)",
+                             (name, json.dumps(symbols), time.time()))
+            self._lists = None
+        return symbols
+
+    def delete(self, name):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM watchlists WHERE name = ?", (name,))
+            self._lists = None
@@ -0,0 +1,42 @@
+"""HTML documents for the iframe widgets: vitals panel, TradingView chart, economic calendar.
+
+Templates and the vitals stylesheet live in ``assets/`` and are read once.
+The vitals panel ships its few rules inline instead of loading the Tailwind
+Play CDN, which compiled every utility class in the browser on each mount.
+Rendered documents are memoised on their inputs, so an unchanged widget hands
+Streamlit the identical string and the frontend keeps the mounted iframe.
+"""
+import functools
+import html
+import os
+import string
+
+ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+@functools.lru_cache(maxsize=None)
+def asset(name):
+    with open(os.path.join(ASSETS, name), encoding="utf-8") as f: return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def template(name):
+    return string.Template(asset(name))
+
+
+@functools.lru_cache(maxsize=256)
+def vitals_html(vix, vix_change, theme="dark"):
+    falling = vix_change < 0
+    return template("vitals.html").substitute(
+        css=asset("vitals.css"), theme=html.escape(theme), vix=vix, vix_change=abs(vix_change),
+        vix_class="down" if falling else "up", arrow="▼" if falling else "▲")
+
+
+@functools.lru_cache(maxsize=64)
+def tradingview_html(symbol, theme="dark"):
+    return template("tradingview.html").substitute(symbol=html.escape(symbol), theme=html.escape(theme))
+
+
+@functools.lru_cache(maxsize=16)
+def calendar_html(timezone_id):
+    return template("calendar.html").substitute(timezone=int(timezone_id))
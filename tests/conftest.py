@@ -0,0 +1,12 @@
+"""Shared setup: the bench stand-ins on the path and a throwaway data directory.
+
+``terminal`` fixes ``DATA_DIR`` at import, so this runs before any test imports it.
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench"))
+os.environ["TERMINAL_DATA_DIR"] = tempfile.mkdtemp(prefix="terminal-tests-")
+os.environ["TERMINAL_REFRESHER"] = "0"
+os.environ.setdefault("TERMINAL_LLM_RPM", "100000")
@@ -0,0 +1,82 @@
+"""JSON API server and CLI against the local stand-ins."""
+import contextlib
+import io
+import json
+import socket
+import unittest
+from unittest import mock
+
+import fakes
+import fixtures
+from terminal import api, backend, barstore, refresher, sentiment
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.services = fakes.FakeServices().start()
+        self.addCleanup(self.services.stop)
+        replay = fixtures.YFinanceReplay()
+        import yfinance
+        for patch in (mock.patch.object(sentiment, "FNG_URL", f"{self.services.url}/fng"),
+                      mock.patch.multiple(yfinance, download=replay.download, Ticker=replay.Ticker),
+                      mock.patch.object(refresher.Refresher, "start", side_effect=AssertionError("refresher started"))):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out): code = api.main(list(argv))
+        return code, json.loads(out.getvalue())
+
+    def test_one_shot_runs_only_the_jobs_its_route_reads(self):
+        with mock.patch.object(backend.Backend, "pregenerate_briefings") as briefings, \
+             mock.patch.object(barstore.BarStore, "sync") as sync:
+            code, payload = self.run_cli("--api-key", "test-key", "fng")
+        self.assertEqual(code, 0)
+        self.assertEqual(payload["crypto"]["score"], self.services.fng)
+        self.assertEqual(self.services.requests["fng"], 1)
+        briefings.assert_not_called()
+        sync.assert_not_called()
+
+    def test_one_shot_market_polls_quotes(self):
+        code, payload = self.run_cli("market", "--class", "Crypto")
+        self.assertEqual(code, 0)
+        self.assertEqual(len(payload["quotes"]), 6)
+        self.assertTrue(all(q["ok"] for q in payload["quotes"]))
+
+
+
+class ServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = api.ApiServer(backend.Backend(stream_quotes=False), port=0).start()
+        self.addCleanup(self.server.stop)
+
+    def raw(self, request):
+        with socket.create_connection((self.server.host, self.server.port), timeout=5) as sock:
+            sock.sendall(request)
+            data = b""
+            while chunk := sock.recv(65536): data += chunk
+        return data
+
+    def test_health(self):
+        status, payload = api.fetch(self.server.url, "GET", "/v1/health", {}, {})
+        self.assertEqual(status, 200)
+        self.assertIn("quotes", payload["jobs"])
+
+    def test_bad_content_length_is_a_400(self):
+        for value in (b"abc", b"-5", b"1.5"):
+            with self.subTest(value=value):
+                reply = self.raw(b"POST /v1/briefings/GLOBAL HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\n")
+                self.assertTrue(reply.startswith(b"HTTP/1.1 400 "), reply[:40])
+
+    def test_oversized_body_is_a_413(self):
+        reply = self.raw(b"POST /v1/briefings/GLOBAL HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (api.MAX_BODY + 1))
+        self.assertTrue(reply.startswith(b"HTTP/1.1 413 "), reply[:40])
+
+    def test_unknown_route_is_a_404(self):
+        status, payload = api.fetch(self.server.url, "GET", "/v1/nope", {}, {})
+        self.assertEqual(status, 404)
+        self.assertIn("error", payload)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Backend report and briefing paths against the local stand-in server."""
+import unittest
+from unittest import mock
+
+import fakes
+from terminal import backend, headlines, llm, llmcache, news, reports
+
+
+class BackendTest(unittest.TestCase):
+    def setUp(self):
+        self.services = fakes.FakeServices(ttft=0, chunk_delay=0, chunks=4).start()
+        self.addCleanup(self.services.stop)
+        patch = mock.patch.object(news, "FEED_URL", f"{self.services.url}/rss")
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.core = backend.Backend(stream_quotes=False)
+        self.core._resources.update(
+            llm_client=llm.GeminiClient(base_url=self.services.url, backoff=0),
+            reports=reports.ReportStore(":memory:"),
+            headlines=headlines.HeadlineStore(":memory:"),
+            llm_cache=llmcache.ResponseCache(":memory:"),
+        )
+
+    def test_brief_saves_report_and_marks_headlines(self):
+        text, created = self.core.brief("GLOBAL", "test-key")
+        self.assertEqual(text, "".join(fakes.reply_chunks(4)).replace("$", "USD "))
+        self.assertEqual(self.core.reports.latest("GLOBAL").created, created)
+        self.assertGreater(self.core.headlines.last_briefing("GLOBAL"), 0)
+
+    def test_briefed_headlines_are_not_new_next_time(self):
+        _, created = self.core.brief("GLOBAL", "test-key")
+        self.assertTrue(created)
+        self.assertEqual(self.core.headlines.since_last_briefing("GLOBAL"), ())
+        self.core.briefing_news("GLOBAL")
+        self.assertEqual(self.core.headlines.since_last_briefing("GLOBAL"), ())
+
+    def test_partial_stream_raises_after_output(self):
+        self.services.stream_error_after = 2
+        chunks = []
+        with self.assertRaises(backend.ReportError) as caught:
+            for chunk in self.core.stream_report("- headline", "GLOBAL", "test-key"): chunks.append(chunk)
+        self.assertEqual(len(chunks), 2)
+        self.assertIn("injected stream error", str(caught.exception))
+
+    def test_partial_stream_is_not_saved(self):
+        self.services.stream_error_after = 2
+        text, created = self.core.brief("GLOBAL", "test-key")
+        self.assertIsNone(created)
+        self.assertIn("injected stream error", text)
+        self.assertIsNone(self.core.reports.latest("GLOBAL"))
+        self.assertEqual(self.core.headlines.last_briefing("GLOBAL"), 0.0)
+
+    def test_empty_completion_is_not_cached(self):
+        self.services.chunks = 0
+        with self.assertRaises(backend.ReportError): self.core.generate_report("- headline", "GLOBAL", "test-key")
+        self.services.chunks = 4
+        self.assertTrue(self.core.generate_report("- headline", "GLOBAL", "test-key"))
+        self.assertEqual(self.services.requests["generate"], 2)
+
+    def test_completed_report_is_cached(self):
+        first = self.core.generate_report("- headline", "GLOBAL", "test-key")
+        self.assertEqual(self.core.generate_report("- headline", "GLOBAL", "test-key"), first)
+        self.assertEqual(self.services.requests["generate"], 1)
+
+    def test_failed_pregeneration_waits_for_next_slot(self):
+        self.services.stream_error_after = 1
+        attempted = self.core.pregenerate_briefings("test-key")
+        generated = self.services.requests["generate"]
+        self.assertEqual(generated, len(backend.NEWS_QUERIES))
+        self.assertEqual(self.core.reports.latest_times(), {})
+        self.assertEqual(self.core.pregenerate_briefings("test-key"), attempted)
+        self.assertEqual(self.services.requests["generate"], generated)
+
+    def test_missing_key_is_an_error(self):
+        text, created = self.core.brief("BTC", "")
+        self.assertIsNone(created)
+        self.assertEqual(self.services.requests["generate"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""On-disk bar store: incremental appends and torn records."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from terminal.barstore import BAR_DTYPE, BarStore
+
+
+def frame(start, closes):
+    closes = np.asarray(closes, dtype=float)
+    index = pd.date_range(start, periods=len(closes), freq="D", tz="UTC")
+    return pd.DataFrame({"Open": closes, "High": closes, "Low": closes, "Close": closes, "Volume": 1.0}, index=index)
+
+
+class BarStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = BarStore(tmp.name)
+
+    def test_append_skips_bars_already_stored(self):
+        self.assertEqual(self.store.append("X", "1d", frame("2024-01-01", [1, 2, 3])), 3)
+        self.assertEqual(self.store.append("X", "1d", frame("2024-01-02", [2, 3, 4, 5])), 2)
+        self.assertEqual(self.store.read("X", "1d")["Close"].tolist(), [1, 2, 3, 4, 5])
+
+    def test_append_after_torn_record_stays_aligned(self):
+        self.store.append("X", "1d", frame("2024-01-01", [1, 2, 3]))
+        with open(self.store.path("X", "1d"), "ab") as f: f.write(b"\x01\x02\x03")
+        self.assertEqual(len(self.store.bars("X", "1d")), 3)
+        self.store.append("X", "1d", frame("2024-01-04", [4, 5]))
+        self.assertEqual(self.store.read("X", "1d")["Close"].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(os.path.getsize(self.store.path("X", "1d")), 5 * BAR_DTYPE.itemsize)
+
+    def test_closes_aligns_symbols_on_timestamp(self):
+        self.store.append("A", "1d", frame("2024-01-01", [1, 2, 3]))
+        self.store.append("B", "1d", frame("2024-01-02", [10, 20]))
+        closes = self.store.closes(["A", "B"])
+        self.assertEqual(len(closes), 3)
+        self.assertTrue(np.isnan(closes["B"].iloc[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
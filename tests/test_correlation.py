@@ -0,0 +1,49 @@
+"""Rolling correlation engine and its bar-store driver."""
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from terminal.barstore import BarStore
+from terminal.correlation import RollingCorrelation, UniverseCorrelation
+
+
+class RollingCorrelationTest(unittest.TestCase):
+    def test_matches_pandas_over_each_window(self):
+        rng = np.random.default_rng(1)
+        returns = rng.normal(size=(120, 4))
+        returns[::7, 2] = np.nan  # a weekday-only market next to 24/7 ones
+        engine = RollingCorrelation(list("ABCD"), windows=(7, 30, 90), min_periods=5)
+        for row in returns: engine.update(row)
+        for window in engine.windows:
+            expected = pd.DataFrame(returns[-window:]).corr(min_periods=5).to_numpy()
+            np.testing.assert_allclose(engine.corr(window), expected, atol=1e-9)
+
+
+class UniverseCorrelationTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = BarStore(tmp.name)
+        self.index = pd.date_range(end=pd.Timestamp.now(tz="UTC").normalize() - pd.Timedelta(days=1), periods=200, freq="D")
+        self.rng = np.random.default_rng(0)
+
+    def write(self, symbol):
+        closes = np.cumprod(1 + self.rng.normal(0, 0.01, len(self.index))) * 100
+        self.store.append(symbol, "1d", pd.DataFrame({"Close": closes}, index=self.index))
+
+    def test_late_symbol_history_is_fed(self):
+        self.write("BTC")
+        self.write("GOLD")
+        universe = UniverseCorrelation(self.store, ["BTC", "GOLD", "SPX"])
+        self.assertEqual(universe.refresh(force=True), 200)
+        self.assertTrue(universe.engine.frame(30).loc["SPX"].isna().all())
+        self.write("SPX")
+        self.assertEqual(universe.refresh(force=True), 200)
+        self.assertFalse(universe.engine.frame(30).loc["SPX", ["BTC", "GOLD"]].isna().any())
+        self.assertEqual(universe.refresh(force=True), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""LLM dispatcher: coalescing, error fan-out, priorities and the rate limit."""
+import threading
+import time
+import unittest
+
+from terminal.dispatch import BATCH, INTERACTIVE, Dispatcher
+
+
+class DispatcherTest(unittest.TestCase):
+    def test_identical_requests_share_one_call(self):
+        release, calls = threading.Event(), []
+
+        def factory():
+            calls.append(1)
+            release.wait(2)
+            yield from ("a", "b")
+
+        d = Dispatcher(requests_per_minute=6000)
+        first, second = d.stream("key", "same", factory), d.stream("key", "same", factory)
+        release.set()
+        self.assertEqual(list(first), ["a", "b"])
+        self.assertEqual(list(second), ["a", "b"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((d.stats()["submitted"], d.stats()["coalesced"]), (2, 1))
+
+    def test_error_reaches_every_follower_after_its_chunks(self):
+        release = threading.Event()
+
+        def factory():
+            release.wait(2)
+            yield "partial"
+            raise RuntimeError("upstream 500")
+
+        d = Dispatcher(requests_per_minute=6000)
+        followers = [d.stream("key", "same", factory) for _ in range(2)]
+        release.set()
+        for follower in followers:
+            self.assertEqual(next(follower), "partial")
+            with self.assertRaisesRegex(RuntimeError, "upstream 500"): next(follower)
+        self.assertEqual(list(d.stream("key", "same", lambda: iter(["fresh"]))), ["fresh"])
+
+    def test_interactive_jumps_queued_batch(self):
+        release, order = threading.Event(), []
+
+        def job(name):
+            def factory():
+                order.append(name)
+                if name == "hold": release.wait(2)
+                yield name
+            return factory
+
+        d = Dispatcher(requests_per_minute=6000, concurrency=1)
+        streams = [d.stream("key", "hold", job("hold"), BATCH)]
+        time.sleep(0.05)
+        streams += [d.stream("key", "batch", job("batch"), BATCH), d.stream("key", "chat", job("chat"), INTERACTIVE)]
+        release.set()
+        for s in streams: list(s)
+        self.assertEqual(order, ["hold", "chat", "batch"])
+
+    def test_token_bucket_spaces_calls(self):
+        starts = []
+
+        def factory():
+            starts.append(time.monotonic())
+            yield "x"
+
+        d = Dispatcher(requests_per_minute=600, burst=1)
+        for i in range(2): list(d.stream("key", i, factory))
+        self.assertGreaterEqual(starts[1] - starts[0], 0.08)
+
+
+if __name__ == "__main__":
+    unittest.main()
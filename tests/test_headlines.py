@@ -0,0 +1,48 @@
+"""Headline store: near-duplicate detection and per-mode briefing windows."""
+import time
+import unittest
+
+from terminal.headlines import HeadlineStore, normalize
+from terminal.news import NewsItem
+
+
+def item(title, ts=None, link=None):
+    return NewsItem(title, link or f"https://example.com/{abs(hash(title))}", "Wire", "", ts or time.time(), "q")
+
+
+class HeadlineStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = HeadlineStore(":memory:")
+
+    def test_normalize_strips_publisher_and_punctuation(self):
+        self.assertEqual(normalize("Fed Holds Rates, Signals Cuts - Reuters"), "fed holds rates signals cuts")
+
+    def test_near_duplicates_are_dropped(self):
+        fresh = self.store.ingest([
+            item("Oil jumps as OPEC agrees deeper supply cuts into next year - Reuters"),
+            item("Oil jumps as OPEC agrees deeper supply cuts into next year - Bloomberg"),
+            item("Oil jumps as OPEC agrees deeper supply cuts into next year, sources say"),
+            item("Gold slides as dollar strengthens"),
+        ], "GEO")
+        self.assertEqual([i.title for i in fresh], [
+            "Oil jumps as OPEC agrees deeper supply cuts into next year - Reuters", "Gold slides as dollar strengthens"])
+        self.assertEqual(self.store.ingest([item("Gold slides as dollar strengthens")], "GEO"), [])
+
+    def test_since_last_briefing_is_per_mode(self):
+        self.store.ingest([item("Gold slides as dollar strengthens", ts=1)], "GEO")
+        self.store.mark_briefed("GEO")
+        time.sleep(0.01)
+        self.store.ingest([item("Bitcoin rallies past resistance", ts=2)], "GEO")
+        self.store.ingest([item("Gold slides as dollar strengthens", ts=1)], "CRYPTO")
+        self.assertEqual([i.title for i in self.store.since_last_briefing("GEO")], ["Bitcoin rallies past resistance"])
+        self.assertEqual([i.title for i in self.store.since_last_briefing("CRYPTO")], ["Gold slides as dollar strengthens"])
+        self.assertEqual(len(self.store.briefing_items("GEO")), 2)
+
+    def test_search_matches_words(self):
+        self.store.ingest([item("Gold slides as dollar strengthens"), item("Bitcoin rallies past resistance")], "GEO")
+        self.assertEqual([i.title for i in self.store.search("bitcoin")], ["Bitcoin rallies past resistance"])
+        self.assertEqual(self.store.search("!!"), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""GeminiClient against the local stand-in server in bench/fakes.py.
+
+    python -m pytest tests
+"""
+import unittest
+
+import fakes
+from terminal import llm
+
+
+class GeminiClientTest(unittest.TestCase):
+    def setUp(self):
+        self.services = fakes.FakeServices(ttft=0, chunk_delay=0, chunks=3).start()
+        self.addCleanup(self.services.stop)
+        self.client = llm.GeminiClient(base_url=self.services.url, timeout=(2, 10), backoff=0)
+        self.addCleanup(self.client.session.close)
+
+    def generate(self, prompt="brief"):
+        return self.client.generate("test-key", prompt)
+
+    def test_model_resolved_once_across_generations(self):
+        for i in range(3): self.assertEqual(self.generate(f"brief {i}"), "".join(fakes.reply_chunks(3)))
+        self.assertEqual(self.services.requests["models"], 1)
+        self.assertEqual(self.services.requests["generate"], 3)
+
+    def test_connection_reused(self):
+        for i in range(4): self.generate(f"brief {i}")
+        self.assertEqual(self.services.requests["connections"], 1)
+
+    def test_retries_after_503(self):
+        self.client.resolve_model("test-key")
+        self.services.fail(503)
+        self.assertTrue(self.generate())
+        self.assertEqual(self.services.requests["failed"], 1)
+        self.assertEqual(self.services.requests["generate"], 1)
+
+    def test_model_dropped_after_404(self):
+        self.generate()
+        self.services.fail(404)
+        with self.assertRaises(llm.LLMError): self.generate()
+        self.assertEqual(self.services.requests["models"], 1)
+        self.generate()
+        self.assertEqual(self.services.requests["models"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Content-addressed LLM response cache: keys, expiry and eviction."""
+import time
+import unittest
+
+from terminal.llmcache import ResponseCache, cache_key, news_fingerprint
+
+
+class KeyTest(unittest.TestCase):
+    def test_fingerprint_ignores_order_pubdates_and_publishers(self):
+        a = "- Gold slides as dollar strengthens - Reuters (Mon, 01 Jan)\n- Oil jumps (Tue, 02 Jan)"
+        b = "- Oil jumps (Wed, 03 Jan)\n- Gold slides as dollar strengthens (Mon, 01 Jan)\n- Oil jumps"
+        self.assertEqual(news_fingerprint(a), news_fingerprint(b))
+
+    def test_key_depends_on_every_input(self):
+        key = cache_key("m", "report", mode="GEO", news=["a"])
+        self.assertEqual(key, cache_key("m", "report", news=["a"], mode="GEO"))
+        self.assertNotEqual(key, cache_key("m2", "report", mode="GEO", news=["a"]))
+        self.assertNotEqual(key, cache_key("m", "report", mode="BTC", news=["a"]))
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(":memory:", max_bytes=10)
+
+    def test_get_respects_max_age(self):
+        self.cache.put("k", "text", "report")
+        self.assertEqual(self.cache.get("k"), "text")
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get("k", max_age=0))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_least_recently_used_evicted_past_max_bytes(self):
+        self.cache.put("a", "aaaa", "report")
+        self.cache.put("b", "bbbb", "report")
+        time.sleep(0.01)
+        self.cache.get("a")
+        self.cache.put("c", "cccc", "report")
+        self.assertEqual(self.cache.get("a"), "aaaa")
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.assertLessEqual(self.cache.stats()["bytes"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Conversation memory: compaction, persistence and paging."""
+import time
+import unittest
+
+from terminal import memory
+from terminal.retrieval import estimate_tokens
+
+
+class ConversationMemoryTest(unittest.TestCase):
+    def setUp(self):
+        self.store = memory.MemoryStore(":memory:")
+
+    def chat(self, session="s1", **kwargs):
+        return memory.ConversationMemory(self.store, session, keep_turns=4, token_budget=400, **kwargs)
+
+    def test_context_stays_within_budget(self):
+        chat = self.chat()
+        for i in range(40): chat.append("user" if i % 2 == 0 else "assistant", f"Turn {i} about yields. " + "More detail follows here. " * 20)
+        self.assertLessEqual(len(chat.verbatim()), 4)
+        self.assertTrue(chat.summary)
+        self.assertLessEqual(estimate_tokens(chat.context()), 400 + 20)
+
+    def test_reopen_restores_summary_and_turns(self):
+        chat = self.chat()
+        for i in range(10): chat.append("user", f"Question {i}? " + "context " * 40)
+        reopened = self.chat()
+        self.assertEqual(len(reopened), 10)
+        self.assertEqual(reopened.summary, chat.summary)
+        self.assertEqual(reopened.context(), chat.context())
+
+    def test_empty_conversation_has_no_turns(self):
+        chat = self.chat("fresh")
+        self.assertEqual(len(chat), 0)
+        self.assertIsNotNone(chat)
+        self.assertEqual(chat.context(), "")
+
+    def test_recent_pages_older_turns_from_disk(self):
+        chat = self.chat(tail=4)
+        for i in range(12): chat.append("user", f"q{i}")
+        self.assertEqual([t.content for t in chat.recent(3)], ["q9", "q10", "q11"])
+        self.assertEqual([t.content for t in chat.recent(8)], [f"q{i}" for i in range(4, 12)])
+
+    def test_prune_drops_stale_sessions(self):
+        self.chat("old").append("user", "hello")
+        self.store.save_summary("old", "", 0)
+        with self.store._db: self.store._db.execute("UPDATE sessions SET updated = ? WHERE session = 'old'", (time.time() - 40 * 86400,))
+        self.chat("new").append("user", "hi")
+        self.assertEqual(self.store.prune(30), 1)
+        self.assertEqual(self.store.state("old"), ("", 0, 0))
+        self.assertEqual(self.store.state("new")[2], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Dependency-graph runner: ordering, argument passing and failure propagation."""
+import threading
+import unittest
+
+from terminal.pipeline import DONE, FAILED, RUNNING, SKIPPED, Pipeline
+
+
+def final(events):
+    return {name: (state, value) for name, state, value in events if state != RUNNING}
+
+
+class PipelineTest(unittest.TestCase):
+    def test_results_flow_to_dependents(self):
+        pipe = Pipeline().add("a", lambda: 2).add("b", lambda: 3).add("sum", lambda a, b: a + b, deps=("a", "b"))
+        events = list(pipe.run())
+        self.assertEqual(final(events)["sum"], (DONE, 5))
+        order = [name for name, state, _ in events if state == RUNNING]
+        self.assertEqual(order[-1], "sum")
+
+    def test_independent_nodes_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=2)
+        pipe = Pipeline(max_workers=2).add("a", barrier.wait).add("b", barrier.wait)
+        self.assertEqual({state for state, _ in final(pipe.run()).values()}, {DONE})
+
+    def test_failure_skips_dependents_only(self):
+        def boom(): raise RuntimeError("feed down")
+        pipe = (Pipeline().add("news", boom).add("quotes", lambda: 1)
+                .add("brief", lambda n: n, deps=("news",)).add("post", lambda b: b, deps=("brief",))
+                .add("chart", lambda q: q, deps=("quotes",)))
+        result = final(pipe.run())
+        self.assertEqual(result["news"][0], FAILED)
+        self.assertIsInstance(result["news"][1], RuntimeError)
+        self.assertEqual(result["brief"], (SKIPPED, None))
+        self.assertEqual(result["post"], (SKIPPED, None))
+        self.assertEqual(result["chart"], (DONE, 1))
+
+    def test_unknown_dependency_rejected(self):
+        with self.assertRaises(ValueError): Pipeline().add("a", lambda x: x, deps=("missing",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Report store and the briefing pre-generation schedule."""
+import datetime
+import unittest
+from zoneinfo import ZoneInfo
+
+from terminal.news import NewsItem
+from terminal.reports import BriefingSchedule, ReportStore
+
+
+class ReportStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = ReportStore(":memory:")
+
+    def test_latest_round_trips_items(self):
+        items = (NewsItem("Gold slides", "https://example.com/1", "Wire", "Mon", 1.0, "gold"),)
+        self.store.save("GEO", "old", created=1.0)
+        self.store.save("GEO", "new", items, model="m", source="scheduled", created=2.0)
+        report = self.store.latest("GEO")
+        self.assertEqual((report.text, report.model, report.source, report.items), ("new", "m", "scheduled", items))
+        self.assertIsNone(self.store.latest("BTC"))
+
+    def test_latest_times_and_prune_are_per_mode(self):
+        for t in range(1, 6): self.store.save("GEO", f"geo {t}", created=float(t))
+        self.store.save("BTC", "btc", created=3.0)
+        self.assertEqual(self.store.latest_times(), {"GEO": 5.0, "BTC": 3.0})
+        self.store.prune(keep=2)
+        self.assertEqual([r.text for r in self.store.history("GEO")], ["geo 5", "geo 4"])
+        self.assertEqual([r.text for r in self.store.history("BTC")], ["btc"])
+
+
+class BriefingScheduleTest(unittest.TestCase):
+    def test_cadence(self):
+        schedule = BriefingSchedule(every=1800, opens=())
+        self.assertEqual(schedule.last_slot(3700), 3600)
+        self.assertTrue(schedule.due(3599, now=3700))
+        self.assertFalse(schedule.due(3600, now=3700))
+
+    def test_slot_before_market_open(self):
+        schedule = BriefingSchedule(every=0, opens=(("America/New_York", "09:30"),), lead=900)
+        now = datetime.datetime(2024, 3, 5, 9, 20, tzinfo=ZoneInfo("America/New_York")).timestamp()
+        self.assertEqual(schedule.last_slot(now), now - 300)
+        self.assertTrue(schedule.due(now - 600, now=now))
+
+
+if __name__ == "__main__":
+    unittest.main()
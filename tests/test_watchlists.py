@@ -0,0 +1,40 @@
+"""Watchlist parsing and the SQLite-backed store."""
+import unittest
+
+from terminal.watchlists import MAX_SYMBOLS, WatchlistStore, parse_symbols
+
+
+class ParseSymbolsTest(unittest.TestCase):
+    def test_upper_cases_dedupes_and_rejects(self):
+        valid, rejected = parse_symbols("aapl, msft\nBTC-USD;^gspc aapl  GC=F bad$sym")
+        self.assertEqual(valid, ["AAPL", "MSFT", "BTC-USD", "^GSPC", "GC=F"])
+        self.assertEqual(rejected, ["BAD$SYM"])
+
+    def test_caps_list_length(self):
+        valid, _ = parse_symbols(" ".join(f"S{i}" for i in range(MAX_SYMBOLS + 5)))
+        self.assertEqual(len(valid), MAX_SYMBOLS)
+
+
+class WatchlistStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = WatchlistStore(":memory:")
+
+    def test_save_get_and_union(self):
+        self.assertEqual(self.store.save("tech", ["AAPL", "MSFT", "AAPL"]), ["AAPL", "MSFT"])
+        self.store.save("macro", ["^GSPC", "MSFT"])
+        self.assertEqual(self.store.names(), ["macro", "tech"])
+        self.assertEqual(self.store.get("tech"), ("AAPL", "MSFT"))
+        self.assertEqual(self.store.get("missing"), ())
+        self.assertEqual(self.store.symbols(), ("^GSPC", "MSFT", "AAPL"))
+
+    def test_writes_refresh_the_cached_union(self):
+        self.store.save("tech", ["AAPL"])
+        self.assertEqual(self.store.symbols(), ("AAPL",))
+        self.store.save("tech", ["NVDA"])
+        self.assertEqual(self.store.symbols(), ("NVDA",))
+        self.store.delete("tech")
+        self.assertEqual((self.store.names(), self.store.symbols()), ([], ()))
+
+
+if __name__ == "__main__":
+    unittest.main()